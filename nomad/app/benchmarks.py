@@ -0,0 +1,236 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import functools
+import gzip
+import io
+import lzma
+import os
+import time
+
+import h5py
+import numpy as np
+import pytest
+from h5grove.content import get_content_from_file
+from h5grove.fastapi_utils import create_error
+
+from nomad import utils
+from nomad.app import h5grove_app
+from nomad.app.v1.routers.uploads import (
+    _receive_upload_stream,
+    _UploadSink,
+    _write_upload_file,
+)
+from nomad.app.v1.utils import create_download_stream_raw_file
+from nomad.files import StagingUploadFiles
+
+
+class BlockingSink:
+    """Writes the chunks directly on the event loop, for comparison."""
+
+    wait_time = 0.0
+
+    def __init__(self, os_path):
+        self.f = open(os_path, 'wb')
+
+    async def write(self, chunk):
+        self.f.write(chunk)
+
+    async def close(self):
+        self.f.close()
+
+
+async def upload_stream(size, chunk_size=64 * 1024):
+    """Simulates a client that sends `size` bytes as fast as possible."""
+    chunk = os.urandom(chunk_size)
+    for _ in range(size // chunk_size):
+        yield chunk
+        # Like a socket read, give other tasks the chance to run
+        await asyncio.sleep(0)
+
+
+async def loop_latencies(done: asyncio.Event, interval=0.01):
+    """
+    Simulates an unrelated request that wants to run every `interval` seconds and
+    returns the delays with which it was actually run.
+    """
+    latencies = []
+    while not done.is_set():
+        start = time.monotonic()
+        await asyncio.sleep(interval)
+        latencies.append(time.monotonic() - start - interval)
+    return latencies
+
+
+@pytest.mark.parametrize('threaded', [False, True])
+def test_concurrent_uploads(benchmark, tmp_path, threaded):
+    n_uploads = 4
+    upload_size = 2 * 1024**3
+
+    async def upload(index):
+        os_path = tmp_path / f'upload_{index}'
+        if threaded:
+            sink = _UploadSink(functools.partial(_write_upload_file, os_path))
+        else:
+            sink = BlockingSink(os_path)
+        await _receive_upload_stream(upload_stream(upload_size), sink)
+
+    async def uploads():
+        done = asyncio.Event()
+        latencies = asyncio.create_task(loop_latencies(done))
+        await asyncio.gather(*[upload(index) for index in range(n_uploads)])
+        done.set()
+        return await latencies
+
+    def run():
+        latencies = asyncio.run(uploads())
+        for index in range(n_uploads):
+            os.remove(tmp_path / f'upload_{index}')
+        return latencies
+
+    latencies = benchmark.pedantic(run, rounds=1)
+    benchmark.extra_info['throughput'] = (
+        n_uploads * upload_size / benchmark.stats.stats.max
+    )
+    benchmark.extra_info['median_latency'] = np.median(latencies)
+    benchmark.extra_info['p99_latency'] = np.percentile(latencies, 99)
+    benchmark.extra_info['max_latency'] = max(latencies)
+
+
+@pytest.fixture(scope='module')
+def compressed_trajectories(tmp_path_factory):
+    """
+    A 128 MB text trajectory compressed with gzip, and with xz in blocks of 16 MB
+    (like multi-threaded xz would).
+    """
+    rng = np.random.default_rng(0)
+    path = tmp_path_factory.mktemp('trajectories')
+    block_size = 16 * 1024**2
+    with gzip.open(path / 'trajectory.xyz.gz', 'wb', compresslevel=6) as gz_file:
+        with open(path / 'trajectory.xyz.xz', 'wb') as xz_file:
+            for _ in range(8):
+                frames = io.BytesIO()
+                while frames.tell() < block_size:
+                    frames.write(b'1000\nframe\n')
+                    np.savetxt(frames, rng.normal(size=(1000, 3)), fmt='%12.6f')
+                block = frames.getvalue()[:block_size]
+                gz_file.write(block)
+                xz_file.write(lzma.compress(block, preset=1))
+
+    return path
+
+
+def read_from_start(path, offset, length):
+    """Reads like the decompressing file objects of the standard library."""
+    open_file = gzip.open if path.endswith('.gz') else lzma.open
+    with open_file(path, 'rb') as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+@pytest.mark.parametrize('checkpoints', [False, True])
+@pytest.mark.parametrize('extension', ['gz', 'xz'])
+def test_read_compressed_raw_file(
+    benchmark, compressed_trajectories, extension, checkpoints
+):
+    upload_files = StagingUploadFiles(utils.create_uuid(), create=True)
+    file_name = f'trajectory.xyz.{extension}'
+    upload_files.add_rawfiles(str(compressed_trajectories / file_name))
+    # Paging through the deep parts of the file
+    offsets = [int(fraction * 128 * 1024**2) for fraction in (0.5, 0.7, 0.9, 0.95)]
+    length = 1024**2
+
+    def read():
+        for offset in offsets:
+            if checkpoints:
+                content = b''.join(
+                    create_download_stream_raw_file(
+                        upload_files, file_name, offset, length, decompress=True
+                    )
+                )
+            else:
+                content = read_from_start(
+                    upload_files.raw_file_object(file_name).os_path, offset, length
+                )
+            assert len(content) == length
+
+    benchmark(read)
+    upload_files.delete()
+
+
+@pytest.fixture(scope='module')
+def hdf5_upload_files():
+    """A staging upload with a NeXus like HDF5 file."""
+    rng = np.random.default_rng(0)
+    upload_files = StagingUploadFiles(utils.create_uuid(), create=True)
+    with h5py.File(upload_files.raw_file_object('viewer.h5').os_path, 'w') as h5_file:
+        entry = h5_file.create_group('entry')
+        entry.attrs['NX_class'] = 'NXentry'
+        entry.attrs['default'] = 'data'
+        data = entry.create_group('data')
+        data.attrs['NX_class'] = 'NXdata'
+        data.attrs['signal'] = 'signal'
+        data.attrs['axes'] = ['y', 'x']
+        data.create_dataset('signal', data=rng.normal(size=(1000, 1000)))
+        data.create_dataset('x', data=np.arange(1000.0))
+        data.create_dataset('y', data=np.arange(1000.0))
+        instrument = entry.create_group('instrument')
+        instrument.attrs['NX_class'] = 'NXinstrument'
+        for index in range(50):
+            instrument.create_dataset(f'parameter_{index}', data=rng.normal())
+
+    yield upload_files
+    upload_files.delete()
+
+
+# The requests of the HDF5 viewer when a file is opened and its default plot shown
+viewer_requests = [
+    ('meta', '/'),
+    ('meta', '/entry'),
+    ('attr', '/entry'),
+    ('meta', '/entry/data'),
+    ('attr', '/entry/data'),
+    ('meta', '/entry/data/signal'),
+    ('meta', '/entry/data/x'),
+    ('meta', '/entry/data/y'),
+    ('data', '/entry/data/x'),
+    ('data', '/entry/data/y'),
+    ('data', '/entry/data/signal'),
+    ('meta', '/entry/instrument'),
+    ('attr', '/entry/instrument'),
+]
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_h5grove_viewer_requests(benchmark, monkeypatch, hdf5_upload_files, cached):
+    if not cached:
+        monkeypatch.setattr(h5grove_app, '_h5_file_version', lambda *args: None)
+    file_path = f'/uploads/{hdf5_upload_files.upload_id}/raw/viewer.h5'
+
+    def replay():
+        for request, path in viewer_requests:
+            with get_content_from_file(file_path, path, create_error) as content:
+                if request == 'meta':
+                    content.metadata()
+                elif request == 'attr':
+                    content.attributes()
+                else:
+                    content.data('0' if path.endswith('signal') else None)
+
+    benchmark(replay)
@@ -19,15 +19,20 @@
 from fastapi import FastAPI, status, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import atexit
+import os
 import traceback
 import re
+import threading
 import urllib.parse
 import h5py
-from typing import Callable, Dict, Any
+from collections import OrderedDict
+from typing import IO, Callable, Dict, Any, Optional, Tuple
 
 from h5grove import fastapi_utils as h5grove_router, utils as h5grove_utils
 
 from nomad import utils
+from nomad.config import config
 from nomad.files import UploadFiles, PublicUploadFiles
 from nomad.app.v1.models import User
 from nomad.app.v1.routers.auth import create_user_dependency
@@ -36,6 +41,125 @@ from nomad.app.v1.routers.uploads import get_upload_with_read_access
 logger = utils.get_logger(__name__)
 
 
+class _CachedH5File(h5py.File):
+    """
+    An HDF5 file that is kept open in the per process cache of open files. Closing
+    it only releases it. It is actually closed, when it was evicted from the cache and
+    is not used by any request anymore.
+    """
+
+    _cache_entry: '_H5FileCacheEntry' = None
+
+    def close(self):
+        _release_h5_file(self)
+
+
+class _H5FileCacheEntry:
+    def __init__(self, version: Tuple, h5_file: _CachedH5File, file_object: IO):
+        self.version = version
+        self.h5_file = h5_file
+        self.file_object = file_object
+        self.users = 1
+        self.evicted = False
+
+    def close(self):
+        h5py.File.close(self.h5_file)
+        self.file_object.close()
+
+
+_h5_files: 'OrderedDict[Tuple, _H5FileCacheEntry]' = OrderedDict()
+_h5_files_lock = threading.Lock()
+
+
+def _h5_file_version(
+    upload_files: UploadFiles, directory: str, path_or_id: str
+) -> Optional[Tuple]:
+    """
+    Identifies the state of the OS file that contains the requested HDF5 file. It
+    changes, if the upload is modified or published. Returns None, if the file
+    cannot be determined.
+    """
+    try:
+        if directory != 'raw':
+            file_object = upload_files.archive_hdf5_file_object(path_or_id)
+        elif isinstance(upload_files, PublicUploadFiles):
+            file_object = upload_files.raw_zip_file_object()
+        else:
+            file_object = upload_files.raw_file_object(path_or_id)
+        stat = os.stat(file_object.os_path)
+    except (AssertionError, AttributeError, KeyError, OSError):
+        return None
+
+    return (
+        upload_files.__class__.__name__,
+        file_object.os_path,
+        stat.st_ino,
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+
+def _evict_h5_file(entry: _H5FileCacheEntry):
+    entry.evicted = True
+    if entry.users == 0:
+        entry.close()
+
+
+def _get_cached_h5_file(key: Tuple, version: Tuple) -> Optional[_CachedH5File]:
+    """Returns the cached open file for the given key, if it is still up to date."""
+    with _h5_files_lock:
+        entry = _h5_files.get(key)
+        if entry is None:
+            return None
+        if entry.version != version:
+            del _h5_files[key]
+            _evict_h5_file(entry)
+            return None
+        _h5_files.move_to_end(key)
+        entry.users += 1
+        return entry.h5_file
+
+
+def _cache_h5_file(
+    key: Tuple, version: Tuple, h5_file: _CachedH5File, file_object: IO
+) -> _CachedH5File:
+    """
+    Adds the opened file to the cache. The cache is limited to
+    `config.services.h5grove_open_files` files, the least recently used are evicted.
+    """
+    h5_file._cache_entry = _H5FileCacheEntry(version, h5_file, file_object)
+    with _h5_files_lock:
+        replaced = _h5_files.pop(key, None)
+        if replaced is not None:
+            _evict_h5_file(replaced)
+        _h5_files[key] = h5_file._cache_entry
+        while len(_h5_files) > max(config.services.h5grove_open_files, 1):
+            _, evicted = _h5_files.popitem(last=False)
+            _evict_h5_file(evicted)
+    return h5_file
+
+
+def _release_h5_file(h5_file: _CachedH5File):
+    entry = h5_file._cache_entry
+    if entry is None:
+        h5py.File.close(h5_file)  # The file was never added to the cache
+        return
+    with _h5_files_lock:
+        entry.users -= 1
+        if entry.evicted and entry.users == 0:
+            entry.close()
+
+
+@atexit.register
+def _close_h5_files():
+    # Files that are opened from Python file objects have to be closed before the
+    # interpreter shuts down
+    with _h5_files_lock:
+        while _h5_files:
+            _, entry = _h5_files.popitem()
+            entry.close()
+
+
 def open_zipped_h5_file(
     filepath: str,
     create_error: Callable[[int, str], Exception],
@@ -45,9 +169,12 @@ def open_zipped_h5_file(
     import io
     from nomad import files
 
+    # This code runs with the globals of h5grove.utils (see below)
+    from nomad.app import h5grove_app  # noqa: PLW0406
+
     """
     Patched h5grove utils function open_file_with_error_fallback in order to open h5 file
-    in zipped folder.
+    in zipped folder. Opened files are cached and reused, until they are modified.
     """
     match = re.match(
         r'.*?/uploads/(?P<upload_id>.+?)/(?P<directory>.+?)/(?P<path_or_id>.+)',
@@ -58,6 +185,18 @@ def open_zipped_h5_file(
 
     upload_files = files.UploadFiles.get(match['upload_id'])
     path_or_id = match['path_or_id']
+    key = (
+        match['upload_id'],
+        match['directory'],
+        path_or_id,
+        tuple(sorted(h5py_options.items())),
+    )
+    version = h5grove_app._h5_file_version(upload_files, match['directory'], path_or_id)
+    if version is not None:
+        f = h5grove_app._get_cached_h5_file(key, version)
+        if f is not None:
+            return f
+
     try:
         if match['directory'] == 'raw':
             file_object = upload_files.raw_file(path_or_id, 'rb')
@@ -67,7 +206,10 @@ def open_zipped_h5_file(
         raise create_error(404, 'File not found!')
 
     try:
-        f = h5py.File(file_object, **h5py_options)
+        if version is None:
+            f = h5py.File(file_object, **h5py_options)
+        else:
+            f = h5grove_app._CachedH5File(file_object, **h5py_options)
     except OSError as e:
         if isinstance(e, FileNotFoundError) or 'No such file or directory' in str(e):
             raise create_error(404, 'File not found!')
@@ -77,6 +219,8 @@ def open_zipped_h5_file(
             raise create_error(404, 'File not found!')
         raise e
 
+    if version is not None:
+        f = h5grove_app._cache_h5_file(key, version, f, file_object)
     return f
 
 
@@ -27,6 +27,7 @@ from fastapi import (
     HTTPException,
     Request,
     Query as QueryParameter,
+    Header,
     Body,
 )
 from fastapi.responses import StreamingResponse
@@ -61,6 +62,7 @@ from ..utils import (
     browser_download_headers,
     DownloadItem,
     create_responses,
+    parse_range_header,
 )
 from ..models import (
     Aggregation,
@@ -1290,10 +1292,21 @@ async def get_entry_raw_file(
                 Attempt to decompress the contents, if the file is .gz or .xz."""
         ),
     ),
+    range_header: Optional[str] = Header(
+        None,
+        alias='Range',
+        description=strip(
+            """
+                A single byte range (e.g. `bytes=0-1023`) of the file, which is answered
+                with `206 Partial Content`. Ignored with `decompress`, `offset`, or
+                `length`."""
+        ),
+    ),
     user: User = Depends(create_user_dependency(signature_token_auth_allowed=True)),
 ):
     """
-    Streams the contents of an individual file from the requested entry.
+    Streams the contents of an individual file from the requested entry. A segment of the
+    file can be requested with `offset` and `length`, or with a HTTP `Range` header.
     """
     query = dict(entry_id=entry_id)
     response = perform_search(
@@ -1328,10 +1341,27 @@ async def get_entry_raw_file(
     if offset == 0 and length < 0:
         mime_type = upload_files.raw_file_mime_type(path)
 
+    status_code = status.HTTP_200_OK
+    headers = {}
+    if not decompress:
+        headers['Accept-Ranges'] = 'bytes'
+        if offset == 0 and length < 0:
+            size = upload_files.raw_file_size(path)
+            byte_range = parse_range_header(range_header, size)
+            if byte_range:
+                offset, length = byte_range
+                status_code = status.HTTP_206_PARTIAL_CONTENT
+                headers['Content-Range'] = (
+                    f'bytes {offset}-{offset + length - 1}/{size}'
+                )
+                headers['Content-Length'] = str(length)
+
     raw_file_content = create_download_stream_raw_file(
         upload_files, path, offset, length, decompress
     )
-    return StreamingResponse(raw_file_content, media_type=mime_type)
+    return StreamingResponse(
+        raw_file_content, status_code=status_code, headers=headers, media_type=mime_type
+    )
 
 
 def answer_entry_archive_request(
@@ -18,9 +18,24 @@
 import os
 import io
 import shutil
+import queue
+import threading
+import time
+import functools
+from concurrent.futures import Future
 from enum import Enum
 from datetime import datetime
-from typing import Tuple, List, Set, Dict, Any, Optional, Union
+from typing import (
+    Tuple,
+    List,
+    Set,
+    Dict,
+    Any,
+    Optional,
+    Union,
+    Callable,
+    Iterable,
+)
 from pydantic import BaseModel, Field, validator
 from mongoengine.queryset.visitor import Q
 from urllib.parse import unquote
@@ -34,8 +49,10 @@ from fastapi import (
     Body,
     Path,
     Query as FastApiQuery,
+    Header,
     HTTPException,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse, FileResponse
 from fastapi.exceptions import RequestValidationError
 
@@ -90,6 +107,7 @@ from ..utils import (
     create_download_stream_zipped,
     create_download_stream_raw_file,
     create_stream_from_string,
+    parse_range_header,
 )
 
 router = APIRouter()
@@ -495,6 +513,36 @@ class PutRawFileResponse(BaseModel):
     )
 
 
+class ChunkedUploadResponse(BaseModel):
+    upload_id: str = Field(
+        None,
+        description=strip(
+            """
+        Unique id of the upload."""
+        ),
+    )
+    session_id: str = Field(
+        None,
+        description=strip(
+            """
+        Unique id of the chunked upload, which is used to put its chunks."""
+        ),
+    )
+    file_name: str = Field(None, description='The name of the uploaded file.')
+    path: str = Field(None, description='The raw directory the file will be added to.')
+    n_chunks: int = Field(
+        None, description='The number of chunks the file is uploaded in.'
+    )
+    missing_chunks: List[int] = Field(
+        None,
+        description=strip(
+            """
+        The indices of the chunks that were not yet received. The chunked upload
+        can be committed when this is empty."""
+        ),
+    )
+
+
 class DeleteEntryFilesRequest(WithQuery):
     """Defines a request to delete entry files."""
 
@@ -597,6 +645,17 @@ _entry_not_found = (
     },
 )
 
+_upload_or_chunked_upload_not_found = (
+    status.HTTP_404_NOT_FOUND,
+    {
+        'model': HTTPExceptionModel,
+        'description': strip(
+            """
+        The specified upload, or the specified chunked upload, could not be found."""
+        ),
+    },
+)
+
 _upload_or_path_not_found = (
     status.HTTP_404_NOT_FOUND,
     {
@@ -972,24 +1031,19 @@ async def get_upload_rawdir_path(
             # Path denotes a directory
             start = pagination.get_simple_index()
             end = start + pagination.page_size
-            directory_list = upload_files.raw_directory_list(path)
+            page, total, total_size = upload_files.raw_directory_page(path, start, end)
             upload_files.close()
             content = []
             path_to_element: Dict[str, RawDirElementMetadata] = {}
-            total = 0
-            total_size = 0
-            for i, path_info in enumerate(directory_list):
-                total += 1
-                total_size += path_info.size
-                if start <= i < end:
-                    element = RawDirElementMetadata(
-                        name=os.path.basename(path_info.path),
-                        is_file=path_info.is_file,
-                        size=path_info.size,
-                    )
-                    content.append(element)
-                    if include_entry_info:
-                        path_to_element[path_info.path] = element
+            for path_info in page:
+                element = RawDirElementMetadata(
+                    name=os.path.basename(path_info.path),
+                    is_file=path_info.is_file,
+                    size=path_info.size,
+                )
+                content.append(element)
+                if include_entry_info:
+                    path_to_element[path_info.path] = element
 
             if include_entry_info and content:
                 for entry in Entry.objects(
@@ -1117,6 +1171,16 @@ async def get_upload_raw_path(
                 instead of the actual mime type."""
         ),
     ),
+    range_header: Optional[str] = Header(
+        None,
+        alias='Range',
+        description=strip(
+            """
+                A single byte range (e.g. `bytes=0-1023`) of the file to download, which is
+                answered with `206 Partial Content`. Ignored with `compress`, `decompress`,
+                `offset`, or `length`."""
+        ),
+    ),
     user: User = Depends(
         create_user_dependency(required=False, signature_token_auth_allowed=True)
     ),
@@ -1133,7 +1197,8 @@ async def get_upload_raw_path(
     When downloading a file, you can specify `decompress` to attempt to decompress the data
     if the file is compressed before streaming it. You can also specify `offset` and `length`
     to download only a segment of the file (*Note:* `offset` and `length` does not work if
-    `compress` is set to true).
+    `compress` is set to true). Alternatively, a segment can be requested with a HTTP
+    `Range` header.
     """
     if files_params.compress and (offset != 0 or length != -1):
         raise HTTPException(
@@ -1158,6 +1223,8 @@ async def get_upload_raw_path(
             )
         if upload_files.raw_path_is_file(path):
             # File
+            status_code = status.HTTP_200_OK
+            headers = {}
             if files_params.compress:
                 media_type = 'application/zip'
                 download_item = DownloadItem(
@@ -1188,17 +1255,29 @@ async def get_upload_raw_path(
                     media_type = 'application/octet-stream'
                 else:
                     media_type = upload_files.raw_file_mime_type(path)
+                if not decompress:
+                    headers['Accept-Ranges'] = 'bytes'
+                    if offset == 0 and length == -1:
+                        size = upload_files.raw_file_size(path)
+                        byte_range = parse_range_header(range_header, size)
+                        if byte_range:
+                            offset, length = byte_range
+                            status_code = status.HTTP_206_PARTIAL_CONTENT
+                            headers['Content-Range'] = (
+                                f'bytes {offset}-{offset + length - 1}/{size}'
+                            )
+                            headers['Content-Length'] = str(length)
                 content = create_download_stream_raw_file(
                     upload_files, path, offset, length, decompress
                 )
-            return StreamingResponse(
-                content,
-                headers=browser_download_headers(
+            headers.update(
+                browser_download_headers(
                     filename=os.path.basename(path)
                     + ('.zip' if files_params.compress else ''),
                     media_type=media_type,
-                ),
+                )
             )
+            return StreamingResponse(content, status_code=status_code, headers=headers)
         else:
             # Directory
             if not files_params.compress:
@@ -1426,7 +1505,11 @@ async def put_upload_raw_path(
     upload_files = StagingUploadFiles(upload_id)
 
     for upload_path in upload_paths:
-        decompress = files.auto_decompress(upload_path)
+        if os.path.isdir(upload_path):
+            # An archive that was already extracted while it was received
+            decompress = 'extracted'
+        else:
+            decompress = files.auto_decompress(upload_path)
         if decompress == 'error':
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1674,6 +1757,268 @@ async def post_upload_raw_create_dir_path(
     return UploadProcDataResponse(upload_id=upload_id, data=upload_to_pydantic(upload))
 
 
+@router.post(
+    '/{upload_id}/raw-chunked/{path:path}',
+    tags=[raw_tag],
+    summary='Start a chunked upload of a file to the specified path (directory) in the specified upload.',
+    response_model=ChunkedUploadResponse,
+    responses=create_responses(
+        _upload_not_found, _not_authorized_to_upload, _bad_request
+    ),
+    response_model_exclude_unset=True,
+    response_model_exclude_none=True,
+)
+async def post_upload_raw_chunked_path(
+    upload_id: str = Path(..., description='The unique id of the upload.'),
+    path: str = Path(..., description='The path within the upload raw files.'),
+    file_name: str = FastApiQuery(..., description='The name of the uploaded file.'),
+    n_chunks: int = FastApiQuery(
+        ...,
+        ge=1,
+        le=config.services.chunked_upload_max_chunks,
+        description='The number of chunks the file is uploaded in.',
+    ),
+    user: User = Depends(
+        create_user_dependency(required=True, upload_token_auth_allowed=True)
+    ),
+):
+    """
+    Starts the upload of a (large) file in chunks, e.g. to resume the upload after a
+    connection was lost. The file will be added to the directory specified by `path`
+    in the upload specified by `upload_id`.
+
+    The returned `session_id` is used to upload the chunks, in any order and in parallel,
+    with PUT `uploads/{upload_id}/chunked/{session_id}/{index}`. Each chunk needs
+    the SHA-256 hex digest of its data as the `checksum` query parameter, and chunks
+    that do not match their checksum are rejected. Chunks can be uploaded again, e.g.
+    when their request failed. GET `uploads/{upload_id}/chunked/{session_id}` gives
+    the chunks that are still missing. Once all chunks are uploaded, POST
+    `uploads/{upload_id}/chunked/{session_id}/commit` assembles the file and adds it to the
+    upload, like PUT `uploads/{upload_id}/raw/{path}` does. Zip and tar archives are
+    extracted.
+    """
+    upload = _get_upload_with_write_access(upload_id, user, include_published=False)
+
+    if not is_safe_relative_path(path):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail='Bad path provided.'
+        )
+    if not is_safe_basename(file_name):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail='Bad file name provided.'
+        )
+
+    chunked_upload = upload.staging_upload_files.create_chunked_upload(
+        file_name, path, n_chunks
+    )
+
+    return _chunked_upload_to_response(upload_id, chunked_upload)
+
+
+@router.get(
+    '/{upload_id}/chunked/{session_id}',
+    tags=[raw_tag],
+    summary='Get the state of a chunked upload, i.e. the chunks that are still missing.',
+    response_model=ChunkedUploadResponse,
+    responses=create_responses(
+        _upload_or_chunked_upload_not_found, _not_authorized_to_upload
+    ),
+    response_model_exclude_unset=True,
+    response_model_exclude_none=True,
+)
+async def get_upload_chunked(
+    upload_id: str = Path(..., description='The unique id of the upload.'),
+    session_id: str = Path(..., description='The unique id of the chunked upload.'),
+    user: User = Depends(
+        create_user_dependency(required=True, upload_token_auth_allowed=True)
+    ),
+):
+    """
+    Gets the state of a chunked upload. The `missing_chunks` are the chunks that still
+    have to be uploaded before the chunked upload can be committed.
+    """
+    upload = _get_upload_with_write_access(upload_id, user, include_published=False)
+    chunked_upload = _get_chunked_upload(upload, session_id)
+
+    return _chunked_upload_to_response(upload_id, chunked_upload)
+
+
+@router.put(
+    '/{upload_id}/chunked/{session_id}/{index}',
+    tags=[raw_tag],
+    summary='Upload a chunk of a chunked upload.',
+    response_model=ChunkedUploadResponse,
+    responses=create_responses(
+        _upload_or_chunked_upload_not_found, _not_authorized_to_upload, _bad_request
+    ),
+    response_model_exclude_unset=True,
+    response_model_exclude_none=True,
+)
+async def put_upload_chunked_chunk(
+    request: Request,
+    upload_id: str = Path(..., description='The unique id of the upload.'),
+    session_id: str = Path(..., description='The unique id of the chunked upload.'),
+    index: int = Path(..., ge=0, description='The index of the chunk.'),
+    checksum: str = FastApiQuery(
+        ...,
+        regex=r'^[0-9a-fA-F]{64}$',
+        description='The SHA-256 hex digest of the chunk data.',
+    ),
+    user: User = Depends(
+        create_user_dependency(required=True, upload_token_auth_allowed=True)
+    ),
+):
+    """
+    Uploads the chunk with the given `index` of a chunked upload. The chunk data has to be
+    streamed in the http body. A chunk that was already uploaded is replaced. Chunks can
+    be at most `services.chunked_upload_max_chunk_size` bytes large.
+    """
+    upload = _get_upload_with_write_access(upload_id, user, include_published=False)
+    chunked_upload = _get_chunked_upload(upload, session_id)
+
+    if index >= chunked_upload.n_chunks:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Bad chunk index, the file has {chunked_upload.n_chunks} chunks.',
+        )
+    content_length = request.headers.get('content-length')
+    if (
+        content_length
+        and content_length.isdigit()
+        and int(content_length) > config.services.chunked_upload_max_chunk_size
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='The chunk is too large.',
+        )
+
+    sink = _UploadSink(
+        functools.partial(chunked_upload.put_chunk, index, checksum=checksum)
+    )
+    try:
+        await _receive_upload_stream(request.stream(), sink)
+        sink.result()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.warn('IO error receiving upload chunk', exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Some IO went wrong, upload probably aborted/disrupted.',
+        )
+
+    return _chunked_upload_to_response(upload_id, chunked_upload)
+
+
+@router.post(
+    '/{upload_id}/chunked/{session_id}/commit',
+    tags=[raw_tag],
+    summary='Add the file of a completely uploaded chunked upload to the upload.',
+    response_model=UploadProcDataResponse,
+    responses=create_responses(
+        _upload_or_chunked_upload_not_found, _not_authorized_to_upload, _bad_request
+    ),
+    response_model_exclude_unset=True,
+    response_model_exclude_none=True,
+)
+async def post_upload_chunked_commit(
+    upload_id: str = Path(..., description='The unique id of the upload.'),
+    session_id: str = Path(..., description='The unique id of the chunked upload.'),
+    user: User = Depends(
+        create_user_dependency(required=True, upload_token_auth_allowed=True)
+    ),
+):
+    """
+    Assembles the file from its chunks, adds it to the upload, and triggers the processing
+    of the upload. Zip and tar archives are extracted and *merged* with the existing
+    content. All chunks need to be uploaded. The chunked upload is removed afterwards.
+    """
+    upload = _get_upload_with_write_access(upload_id, user, include_published=False)
+    chunked_upload = _get_chunked_upload(upload, session_id)
+
+    missing_chunks = chunked_upload.missing_chunks()
+    if missing_chunks:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Not all chunks were uploaded, {len(missing_chunks)} are missing.',
+        )
+    # Keep the chunks if the file cannot be added now, so that the commit can be repeated
+    _check_upload_not_processing(upload)
+
+    tmp_dir = files.create_tmp_dir(upload_id)
+    upload_path = os.path.join(tmp_dir, chunked_upload.file_name)
+    try:
+        if chunked_upload.file_name.lower().endswith(files.decompress_file_extensions):
+            os.makedirs(upload_path)
+            await run_in_threadpool(
+                files.extract_archive_stream, chunked_upload.read_chunks(), upload_path
+            )
+        else:
+            await run_in_threadpool(
+                _write_upload_file, upload_path, chunked_upload.read_chunks()
+            )
+    except ValueError as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    try:
+        upload.process_upload(
+            file_operations=[
+                dict(
+                    op='ADD',
+                    path=upload_path,
+                    target_dir=chunked_upload.path,
+                    temporary=True,
+                )
+            ],
+            only_updated_files=True,
+        )
+    except ProcessAlreadyRunning:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='The upload is currently blocked by another process.',
+        )
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    chunked_upload.delete()
+
+    return UploadProcDataResponse(upload_id=upload_id, data=upload_to_pydantic(upload))
+
+
+@router.delete(
+    '/{upload_id}/chunked/{session_id}',
+    tags=[raw_tag],
+    summary='Abort a chunked upload and delete its chunks.',
+    response_model=ChunkedUploadResponse,
+    responses=create_responses(
+        _upload_or_chunked_upload_not_found, _not_authorized_to_upload
+    ),
+    response_model_exclude_unset=True,
+    response_model_exclude_none=True,
+)
+async def delete_upload_chunked(
+    upload_id: str = Path(..., description='The unique id of the upload.'),
+    session_id: str = Path(..., description='The unique id of the chunked upload.'),
+    user: User = Depends(
+        create_user_dependency(required=True, upload_token_auth_allowed=True)
+    ),
+):
+    """
+    Aborts a chunked upload. All its uploaded chunks are deleted.
+    """
+    upload = _get_upload_with_write_access(upload_id, user, include_published=False)
+    chunked_upload = _get_chunked_upload(upload, session_id)
+    chunked_upload.delete()
+
+    return ChunkedUploadResponse(upload_id=upload_id, session_id=session_id)
+
+
 @router.get(
     '/{upload_id}/archive/mainfile/{mainfile:path}',
     tags=[archive_tag],
@@ -2557,25 +2902,35 @@ async def _get_files_if_provided(
         uploaded_bytes = 0
         for source_stream, file_name in sources:
             upload_path = os.path.join(tmp_dir, file_name)
+            # Archives are extracted while they are received, their path is a directory
+            extract = (
+                method == 2 and no_file_name_info_provided
+            ) or file_name.lower().endswith(files.decompress_file_extensions)
             try:
-                with open(upload_path, 'wb') as f:
-                    uploaded_bytes = 0
-                    log_interval = 1e9
-                    log_unit = 'GB'
-                    next_log_at = log_interval
-                    async for chunk in source_stream:
-                        if not chunk:
-                            # End of data stream
-                            break
-                        uploaded_bytes += len(chunk)
-                        f.write(chunk)
-                        if uploaded_bytes > next_log_at:
-                            logger.info(
-                                'large upload in progress',
-                                uploaded_bytes=uploaded_bytes,
-                            )
-                            next_log_at += log_interval
-                    logger.info(f'upload completed', uploaded_bytes={uploaded_bytes})
+                if extract:
+                    os.makedirs(upload_path)
+                    sink = _UploadSink(
+                        functools.partial(
+                            files.extract_archive_stream, os_target_dir=upload_path
+                        )
+                    )
+                else:
+                    sink = _UploadSink(
+                        functools.partial(_write_upload_file, upload_path)
+                    )
+                uploaded_bytes = await _receive_upload_stream(source_stream, sink)
+                if uploaded_bytes or not extract:
+                    # An empty stream is no data, rather than a bad archive
+                    sink.result()
+            except ValueError as e:
+                if os.path.exists(tmp_dir):
+                    shutil.rmtree(tmp_dir)
+                detail = str(e)
+                if method == 2 and no_file_name_info_provided:
+                    detail = f'No file name provided, and the file does not look like a zip or tar file. {e}'
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=detail
+                )
             except Exception as e:
                 if not (isinstance(e, RuntimeError) and 'Stream consumed' in str(e)):
                     if os.path.exists(tmp_dir):
@@ -2593,30 +2948,120 @@ async def _get_files_if_provided(
             return [], None
 
     logger.info(f'received uploaded file(s)')
-    if method == 2 and no_file_name_info_provided:
-        # Only ok if uploaded file is a zip or a tar archive.
-        ext = (
-            '.zip'
-            if files.zipfile.is_zipfile(upload_path)
-            else '.tar'
-            if files.tarfile.is_tarfile(upload_path)
-            else None
-        )
-        if not ext:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=strip(
-                    """
-                No file name provided, and the file does not look like a zip or tar file."""
-                ),
-            )
-        # Add the correct extension
-        shutil.move(upload_path, upload_path + ext)
-        upload_paths = [upload_path + ext]
 
     return upload_paths, method
 
 
+class _UploadSink:
+    """
+    Passes the received chunks of an upload to `consume`, which is called with an
+    iterable of blocks in a dedicated thread, e.g. to write or extract them. Chunks are
+    coalesced into blocks of `config.services.upload_block_size` bytes and passed on
+    through a bounded queue. Like this, the event loop never waits for disk I/O, but
+    slow disks still slow down the receiving.
+    """
+
+    def __init__(self, consume: Callable[[Iterable[bytes]], Any]):
+        self.block_size = config.services.upload_block_size
+        self.wait_time = 0.0
+        self._consume = consume
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        self._queue: queue.Queue = queue.Queue(
+            maxsize=config.services.upload_queue_size
+        )
+        self._blocks = iter(self._queue.get, None)
+        self._result: Future = Future()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            self._result.set_result(self._consume(self._blocks))
+        except BaseException as e:
+            self._result.set_exception(e)
+        finally:
+            # Keep consuming, the event loop must never block on a full queue
+            for _ in self._blocks:
+                pass
+
+    async def _put(self, block):
+        try:
+            self._queue.put_nowait(block)
+        except queue.Full:
+            start = time.monotonic()
+            await run_in_threadpool(self._queue.put, block)
+            self.wait_time += time.monotonic() - start
+
+    async def write(self, chunk: bytes):
+        if self._result.done():
+            # Raise errors of the consumer early, without receiving the rest
+            self._result.result()
+        self._pending.append(chunk)
+        self._pending_size += len(chunk)
+        if self._pending_size >= self.block_size:
+            data = b''.join(self._pending)
+            size = len(data) - len(data) % self.block_size
+            self._pending = [data[size:]] if size < len(data) else []
+            self._pending_size = len(data) - size
+            await self._put(memoryview(data)[:size])
+
+    async def close(self):
+        """Passes on the remaining data and waits for the consumer to finish."""
+        if self._pending:
+            await self._put(b''.join(self._pending))
+            self._pending = []
+        await self._put(None)
+        await run_in_threadpool(self._thread.join)
+
+    def result(self):
+        """Returns the result of `consume` or raises its exception."""
+        return self._result.result()
+
+
+def _write_upload_file(os_path: str, blocks: Iterable[bytes]):
+    with open(os_path, 'wb') as f:
+        for block in blocks:
+            f.write(block)
+
+
+async def _receive_upload_stream(source_stream, sink: _UploadSink) -> int:
+    """
+    Passes the chunks of `source_stream` to `sink`, closes the sink, and returns the
+    number of received bytes.
+    """
+    uploaded_bytes = 0
+    log_interval = 1e9
+    next_log_at = log_interval
+    start = time.monotonic()
+    try:
+        async for chunk in source_stream:
+            if not chunk:
+                # End of data stream
+                break
+            uploaded_bytes += len(chunk)
+            await sink.write(chunk)
+            if uploaded_bytes > next_log_at:
+                logger.info(
+                    'large upload in progress',
+                    uploaded_bytes=uploaded_bytes,
+                    throughput=uploaded_bytes / (time.monotonic() - start),
+                )
+                next_log_at += log_interval
+    finally:
+        await sink.close()
+
+    duration = time.monotonic() - start
+    logger.info(
+        'upload completed',
+        uploaded_bytes=uploaded_bytes,
+        duration=duration,
+        throughput=uploaded_bytes / duration if duration else None,
+        write_wait_time=sink.wait_time,
+    )
+    return uploaded_bytes
+
+
 async def _asyncronous_file_reader(f):
     """Asynchronous generator to read file-like objects."""
     while True:
@@ -2882,3 +3327,30 @@ def _check_upload_not_processing(upload: Upload):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='The upload is currently being processed, operation not allowed.',
         )
+
+
+def _get_chunked_upload(upload: Upload, session_id: str) -> files.ChunkedUpload:
+    """
+    Returns the chunked upload with the given id, and raises a HTTPException
+    (err code 404) if there is none.
+    """
+    try:
+        return upload.staging_upload_files.chunked_upload(session_id)
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='The specified chunked upload could not be found.',
+        )
+
+
+def _chunked_upload_to_response(
+    upload_id: str, chunked_upload: files.ChunkedUpload
+) -> ChunkedUploadResponse:
+    return ChunkedUploadResponse(
+        upload_id=upload_id,
+        session_id=chunked_upload.session_id,
+        file_name=chunked_upload.file_name,
+        path=chunked_upload.path,
+        n_chunks=chunked_upload.n_chunks,
+        missing_chunks=chunked_upload.missing_chunks(),
+    )
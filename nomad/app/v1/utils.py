@@ -16,17 +16,23 @@
 # limitations under the License.
 #
 
-from typing import List, Dict, Set, Iterator, Any, Optional, Union
+from typing import IO, List, Dict, Set, Iterator, Any, Optional, Tuple, Union
 from types import FunctionType
+from collections import OrderedDict
+import bisect
+import functools
 import urllib
 import io
 import json
 import os
 import inspect
+import struct
+import threading
+import zlib
 from fastapi import Request, Query, HTTPException, status  # pylint: disable=unused-import
 from pydantic import ValidationError, BaseModel  # pylint: disable=unused-import
-import gzip
 import lzma
+from nomad.config import config
 from nomad.files import UploadFiles, StreamedFile, create_zipstream
 
 
@@ -187,6 +193,219 @@ def create_download_stream_zipped(
     return create_zipstream(streamed_files(upload_files), compress=compress)
 
 
+class _GzipIndex:
+    """
+    Gives access to the decompressed data of a gzip file from arbitrary offsets. While
+    the file is read, snapshots of the decompressor (checkpoints) are taken every
+    `config.services.decompression_checkpoint_spacing` bytes of decompressed data, and
+    at the start of each gzip member. Reads start from the nearest checkpoint, rather
+    than from the start of the file.
+
+    Python's zlib does not allow to restore the decompressor state from a stored window,
+    and hence the checkpoints only exist in memory.
+    """
+
+    def __init__(self):
+        self.spacing = config.services.decompression_checkpoint_spacing
+        # (decompressed offset, compressed offset, decompressor or None for a new member)
+        self.checkpoints: List[Tuple[int, int, Any]] = [(0, 0, None)]
+        self._offsets = [0]
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self.checkpoints)
+
+    def _add_checkpoint(self, offset: int, compressed_offset: int, decompressor):
+        with self._lock:
+            if offset >= self._offsets[-1] + (self.spacing if decompressor else 1):
+                self.checkpoints.append((offset, compressed_offset, decompressor))
+                self._offsets.append(offset)
+
+    def read(self, f: IO, offset: int) -> Iterator[bytes]:
+        """Yields the decompressed data of `f` from `offset` until the end."""
+        with self._lock:
+            index = bisect.bisect_right(self._offsets, offset) - 1
+            position, compressed_position, decompressor = self.checkpoints[index]
+        decompressor = decompressor.copy() if decompressor else zlib.decompressobj(31)
+        new_member = False
+        f.seek(compressed_position)
+        data = b''
+        while True:
+            if not data:
+                data = f.read(_chunk_size)
+                if not data and new_member:
+                    return
+            if new_member:
+                # Gzip files can be padded with zeros after a member
+                padding = len(data) - len(data.lstrip(b'\0'))
+                compressed_position += padding
+                data = data[padding:]
+                if not data:
+                    continue
+                new_member = False
+                decompressor = zlib.decompressobj(31)
+                self._add_checkpoint(position, compressed_position, None)
+
+            content = decompressor.decompress(data, _chunk_size)
+            if not data and not content:
+                # The end of the file, a truncated member is ignored
+                return
+            rest = decompressor.unconsumed_tail or decompressor.unused_data
+            compressed_position += len(data) - len(rest)
+            data = rest
+            if position + len(content) > offset:
+                yield content[max(offset - position, 0) :]
+            position += len(content)
+
+            if decompressor.eof:
+                new_member = True
+            elif not data:
+                # The decompressor state is only complete once all data was consumed
+                self._add_checkpoint(position, compressed_position, decompressor.copy())
+
+
+class _XzIndex:
+    """
+    Gives access to the decompressed data of a xz file from arbitrary offsets, based on
+    the index of blocks that every xz stream contains. Reads start from the block that
+    contains the offset. Files compressed with multiple threads consist of many blocks.
+    """
+
+    size = 1
+
+    def __init__(self, f: IO):
+        # (stream header, compressed offset of the first block and of the index)
+        self.streams: List[Tuple[bytes, int, int]] = []
+        # (decompressed offset, compressed offset, stream index)
+        self.blocks: List[Tuple[int, int, int]] = []
+        streams = []
+        end = f.seek(0, io.SEEK_END)
+        while end > 0:
+            if end < 32:
+                raise ValueError('Not a xz file.')
+            f.seek(end - 4)
+            if f.read(4) == bytes(4):
+                # Stream padding
+                end -= 4
+                continue
+            f.seek(end - 12)
+            footer = f.read(12)
+            if footer[10:] != b'YZ':
+                raise ValueError('Not a xz file.')
+            index_size = (struct.unpack('<I', footer[4:8])[0] + 1) * 4
+            index_start = end - 12 - index_size
+            f.seek(index_start)
+            records = _parse_xz_index(f.read(index_size))
+            blocks_start = index_start - sum(
+                (unpadded_size + 3) // 4 * 4 for unpadded_size, _ in records
+            )
+            f.seek(blocks_start - 12)
+            header = f.read(12)
+            if header[:6] != b'\xfd7zXZ\0' or header[6:8] != footer[8:10]:
+                raise ValueError('Not a xz file.')
+            streams.insert(0, (header, blocks_start, index_start, records))
+            end = blocks_start - 12
+
+        position = 0
+        for stream_index, (header, blocks_start, index_start, records) in enumerate(
+            streams
+        ):
+            self.streams.append((header, blocks_start, index_start))
+            compressed_position = blocks_start
+            for unpadded_size, size in records:
+                self.blocks.append((position, compressed_position, stream_index))
+                position += size
+                compressed_position += (unpadded_size + 3) // 4 * 4
+        self._offsets = [block[0] for block in self.blocks]
+
+    def read(self, f: IO, offset: int) -> Iterator[bytes]:
+        """Yields the decompressed data of `f` from `offset` until the end."""
+        index = bisect.bisect_right(self._offsets, offset) - 1
+        if index < 0:
+            return
+        position, compressed_position, first_stream = self.blocks[index]
+        for header, blocks_start, index_start in self.streams[first_stream:]:
+            # A block can be decompressed on its own, if it follows the stream header
+            decompressor = lzma.LZMADecompressor(lzma.FORMAT_XZ)
+            decompressor.decompress(header)
+            compressed_position = max(compressed_position, blocks_start)
+            f.seek(compressed_position)
+            while compressed_position < index_start:
+                data = f.read(min(_chunk_size, index_start - compressed_position))
+                if not data:
+                    return
+                compressed_position += len(data)
+                while True:
+                    content = decompressor.decompress(data, _chunk_size)
+                    data = b''
+                    if position + len(content) > offset:
+                        yield content[max(offset - position, 0) :]
+                    position += len(content)
+                    if decompressor.needs_input:
+                        break
+
+
+def _parse_xz_index(index: bytes) -> List[Tuple[int, int]]:
+    """Returns the unpadded and uncompressed sizes of all blocks in the xz index."""
+
+    def varint(position):
+        value = 0
+        for shift in range(0, 63, 7):
+            if position >= len(index):
+                break
+            byte = index[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, position
+        raise ValueError('Bad xz index.')
+
+    if not index or index[0] != 0:
+        raise ValueError('Bad xz index.')
+    n_records, position = varint(1)
+    records = []
+    for _ in range(n_records):
+        unpadded_size, position = varint(position)
+        size, position = varint(position)
+        records.append((unpadded_size, size))
+    return records
+
+
+_chunk_size = 1024 * 64
+_decompression_indices: 'OrderedDict[Tuple, Any]' = OrderedDict()
+_decompression_indices_lock = threading.Lock()
+
+
+def _decompression_index(upload_files: UploadFiles, path: str, raw_file: IO):
+    """
+    Returns the cached index for the compressed raw file, or creates a new one. The
+    cache is limited to `config.services.decompression_checkpoints` checkpoints.
+    """
+    try:
+        modified = os.fstat(raw_file.fileno()).st_mtime_ns
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        modified = None
+    key = (upload_files.upload_id, path, upload_files.raw_file_size(path), modified)
+
+    with _decompression_indices_lock:
+        index = _decompression_indices.get(key)
+        if index is not None:
+            _decompression_indices.move_to_end(key)
+            return index
+
+    index = _GzipIndex() if path.endswith('.gz') else _XzIndex(raw_file)
+    with _decompression_indices_lock:
+        index = _decompression_indices.setdefault(key, index)
+        size = sum(index.size for index in _decompression_indices.values())
+        while size > config.services.decompression_checkpoints and (
+            len(_decompression_indices) > 1
+        ):
+            _, evicted = _decompression_indices.popitem(last=False)
+            size -= evicted.size
+    return index
+
+
 def create_download_stream_raw_file(
     upload_files: UploadFiles,
     path: str,
@@ -206,40 +425,86 @@ def create_download_stream_raw_file(
         decompress: decompresses if the file is compressed (and of a supported type).
     """
     raw_file: Any = upload_files.raw_file(path, 'rb')
-    if decompress:
-        if path.endswith('.gz'):
-            raw_file = gzip.GzipFile(filename=path[:3], mode='rb', fileobj=raw_file)
-
-        if path.endswith('.xz'):
-            raw_file = lzma.open(filename=raw_file, mode='rb')
 
     assert offset >= 0, 'Invalid offset provided'
     assert (
         length > 0 or length == -1
     ), 'Invalid length provided. Should be > 0 or equal to -1.'
-    if offset > 0:
-        raw_file.seek(offset)
-
-    if length > 0:
-        # Read up to a certain number of bytes
-        remaining = length
-        while remaining:
-            content = raw_file.read(remaining)
-            content_length = len(content)
-            remaining -= content_length
-            if content_length == 0:
-                break  # No more bytes
-            yield content
+
+    content: Iterator[bytes]
+    if decompress and path.endswith(('.gz', '.xz')):
+        try:
+            index = _decompression_index(upload_files, path, raw_file)
+            content = index.read(raw_file, offset)
+        except ValueError:
+            # Not a valid xz file, e.g. one with unsupported features
+            raw_file.seek(0)
+            decompressed_file = lzma.open(filename=raw_file, mode='rb')
+            decompressed_file.seek(offset)
+            content = iter(functools.partial(decompressed_file.read, _chunk_size), b'')
     else:
-        # Read until the end of the file.
-        while True:
-            content = raw_file.read(1024 * 64)
-            if not content:
-                break  # No more bytes
-            yield content
+        if offset > 0:
+            raw_file.seek(offset)
+        content = iter(functools.partial(raw_file.read, _chunk_size), b'')
+
+    try:
+        if length > 0:
+            # Read up to a certain number of bytes
+            remaining = length
+            for chunk in content:
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+                yield chunk
+                if not remaining:
+                    break
+        else:
+            # Read until the end of the file.
+            yield from content
+    finally:
+        raw_file.close()
+        upload_files.close()
 
-    raw_file.close()
-    upload_files.close()
+
+def parse_range_header(
+    range_header: Optional[str], size: int
+) -> Optional[Tuple[int, int]]:
+    """
+    Parses the value of a HTTP ``Range`` header for a file with the given size, and returns
+    the offset and length of the requested bytes. Only a single byte range is supported.
+    For other or invalid headers, None is returned and the whole file should be sent.
+    Raises a HTTPException (416), if the range cannot be satisfied.
+    """
+    if not range_header:
+        return None
+    unit, _, byte_range = range_header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in byte_range:
+        return None
+    first, separator, last = byte_range.strip().partition('-')
+    if not separator:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            if start < 0 or (last and int(last) < start):
+                return None
+        else:
+            # A suffix range with the number of bytes at the end of the file
+            suffix_length = int(last)
+            if suffix_length < 0:
+                return None
+            start = max(size - suffix_length, 0) if suffix_length else size
+            end = size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail='The requested range is not satisfiable.',
+            headers={'Content-Range': f'bytes */{size}'},
+        )
+    return start, end - start + 1
 
 
 def create_stream_from_string(content: str) -> io.BytesIO:
@@ -25,14 +25,12 @@ import math
 import re
 import warnings
 from array import array
-from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
-from itertools import chain
 from string import ascii_uppercase
 from typing import (
     TYPE_CHECKING,
     Any,
-    Callable,
     Dict,
     Iterable,
     List,
@@ -52,11 +50,11 @@ from ase.formula import Formula as ASEFormula
 from ase.utils import pbc2pbc
 from MDAnalysis.core._get_readers import get_reader_for
 from MDAnalysis.core.topology import Topology
+from MDAnalysis.lib.distances import capped_distance
 from MDAnalysis.core.universe import Universe
 from nptyping import Int, NDArray
 from pymatgen.core import Composition
 from pymatgen.core.periodic_table import get_el_sp
-from scipy import sparse
 from scipy.spatial import Voronoi  # pylint: disable=no-name-in-module
 from scipy.stats import linregress
 
@@ -1391,6 +1389,52 @@ def create_empty_universe(
     return universe
 
 
+def create_molecular_universe(
+    n_molecules: int = 100, n_frames: int = 20, box_length: float = 30.0, seed: int = 0
+) -> MDAnalysis.Universe:
+    """
+    Creates a synthetic universe with the given number of diatomic (type A) and
+    triatomic (type B) molecules each, which move randomly in a cubic box. Used for
+    tests and benchmarks of the molecular analyses.
+    """
+    rng = np.random.default_rng(seed)
+    sizes = [2] * n_molecules + [3] * n_molecules
+    moltypes = ['A'] * n_molecules + ['B'] * n_molecules
+    atom_resindex = np.repeat(np.arange(len(sizes)), sizes)
+    n_atoms = len(atom_resindex)
+
+    universe = create_empty_universe(
+        n_atoms,
+        n_frames=n_frames,
+        n_residues=len(sizes),
+        atom_resindex=atom_resindex,
+        residue_segindex=np.zeros(len(sizes), dtype=int),
+        flag_trajectory=True,
+        timestep=1.0,
+    )
+    universe.add_TopologyAttr('masses', np.ones(n_atoms))
+    universe.add_TopologyAttr('moltypes', moltypes)
+    universe.add_TopologyAttr('molnums', np.arange(len(sizes)))
+    starts = np.cumsum([0] + sizes[:-1])
+    universe.add_TopologyAttr(
+        'bonds',
+        [
+            (start + i, start + i + 1)
+            for start, size in zip(starts, sizes)
+            for i in range(size - 1)
+        ],
+    )
+
+    centers = rng.uniform(0, box_length, size=(len(sizes), 3))
+    offsets = rng.normal(scale=0.5, size=(n_atoms, 3))
+    for _ in universe.trajectory:
+        centers += rng.normal(scale=0.5, size=centers.shape)
+        universe.atoms.positions = centers[atom_resindex] + offsets
+        universe.atoms.dimensions = [box_length] * 3 + [90.0] * 3
+
+    return universe
+
+
 def archive_to_universe(
     archive,
     system_index: int = 0,
@@ -1738,103 +1782,37 @@ def __log_indices(first: int, last: int, num: int = 100):
     return np.unique(np.int_(ls) - 1 + first)
 
 
-def __correlation(function, positions: List[float]):
-    iterator = iter(positions)
-    start_frame = next(iterator)
-    return map(lambda f: function(start_frame, f), chain([start_frame], iterator))
-
-
-def shifted_correlation_average(
-    function: Callable,
-    times: NDArray,
-    positions: NDArray,
-    index_distribution: Callable = __log_indices,
-    correlation: Callable = __correlation,
-    segments: int = 10,
-    window: float = 0.5,
-    skip: int = 0,
-) -> tuple[NDArray, NDArray]:
+def mean_squared_displacement_fft(
+    positions: NDArray, max_chunk_elements: int = 2**22
+) -> NDArray:
     """
-    Code adapted from MDevaluate module: https://github.com/mdevaluate/mdevaluate.git
-
-    Calculate the time series for a correlation function.
-
-    The times at which the correlation is calculated are determined automatically by the
-    function given as ``index_distribution``. The default is a logarithmic distribution.
-
-    The function has been edited so that the average is always calculated, i.e., average=True below.
-
-    Args:
-        function:   The function that should be correlated
-        positions:     The coordinates of the simulation data
-        index_distribution (opt.):
-                    A function that returns the indices for which the timeseries
-                    will be calculated
-        correlation (function, opt.):
-                    The correlation function
-        segments (int, opt.):
-                    The number of segments the time window will be shifted
-        window (float, opt.):
-                    The fraction of the simulation the time series will cover
-        skip (float, opt.):
-                    The fraction of the trajectory that will be skipped at the beginning,
-                    if this is None the start index of the frames slice will be used,
-                    which defaults to 0.
-        counter (bool, opt.):
-                    If True, returns length of frames (in general number of particles specified)
-        average (bool, opt.):
-                    If True,
-    Returns:
-        tuple:
-            A list of length N that contains the indices of the frames at which
-            the time series was calculated and a numpy array of shape (segments, N)
-            that holds the (non-avaraged) correlation data
-
-            if has_counter == True: adds number of counts to output tupel.
-                                    if average is returned it will be weighted.
-
-    Example:
-        Calculating the mean square displacement of a coordinates object named ``coords``:
+    Calculates the mean squared displacement for all lag times from the positions
+    of shape (n_frames, n_particles, n_dimensions). The displacements are averaged
+    over all particles and all time origins.
 
-        >>> indices, data = shifted_correlation(msd, coords)
+    The squared displacements are split into the squared positions and the position
+    autocorrelation, which is calculated with FFTs according to the Wiener-Khinchin
+    theorem. The cost is O(n_frames log n_frames) per particle. Particles are processed
+    in chunks of at most `max_chunk_elements` positions to bound the memory usage.
     """
-    if window + skip >= 1:
-        warnings.warn(
-            'Invalid parameters for shifted_correlation(), ' 'resetting to defaults.',
-            UserWarning,
-        )
-        window = 0.5
-        skip = 0
-
-    start_frames = np.unique(
-        np.linspace(
-            len(positions) * skip,
-            len(positions) * (1 - window),
-            num=segments,
-            endpoint=False,
-            dtype=int,
-        )
-    )
-    num_frames = int(len(positions) * (window))
+    n_frames, n_particles, n_dimensions = positions.shape
+    lags = np.arange(n_frames)
+    n_fft = 2 * n_frames
+    chunk_size = max(1, max_chunk_elements // (n_frames * n_dimensions))
 
-    idx = index_distribution(0, num_frames)
+    msd = np.zeros(n_frames)
+    for start in range(0, n_particles, chunk_size):
+        chunk = np.asarray(positions[:, start : start + chunk_size], dtype=np.float64)
+        chunk = chunk - chunk[0]
 
-    def correlate(start_frame):
-        shifted_idx = idx + start_frame
-        return correlation(function, map(positions.__getitem__, shifted_idx))
+        squared = np.concatenate([[0.0], np.cumsum(np.sum(chunk**2, axis=(1, 2)))])
+        msd += squared[n_frames - lags] + squared[n_frames] - squared[lags]
 
-    correlation_times = np.array([times[i] for i in idx]) - times[0]
+        spectrum = np.fft.rfft(chunk, n=n_fft, axis=0)
+        power = np.sum(spectrum.real**2 + spectrum.imag**2, axis=(1, 2))
+        msd -= 2 * np.fft.irfft(power, n=n_fft)[:n_frames]
 
-    result: NDArray
-    for i_start_frame, start_frame in enumerate(start_frames):
-        if i_start_frame == 0:
-            result = np.array(list(correlate(start_frame)))
-        else:
-            result += np.array(list(correlate(start_frame)))
-    result = np.array(result)
-    result = result / len(start_frames)
-
-    return correlation_times, result
+    return msd / (n_frames - lags) / n_particles
 
 
 def _calc_diffusion_constant(
@@ -1870,12 +1848,125 @@ def _get_molecular_bead_groups(
     return bead_groups
 
 
+def _molecular_rdf_histograms(
+    universe: MDAnalysis.Universe,
+    moltypes: List[str],
+    pairs: List[Tuple[int, int]],
+    frames: List[Tuple[int, int]],
+    n_intervals: int,
+    rdf_settings: Dict[str, Any],
+) -> Tuple[NDArray, List[Tuple[int, float]]]:
+    """
+    Histograms the center of mass distances of all given pairs of molecule types
+    for the given (frame, interval) tuples. The centers of mass are calculated once
+    per frame for all pairs. Returns the counts per pair and interval and the box
+    volume of each frame. The counts are the same as those of
+    `MDAnalysis.analysis.rdf.InterRDF`.
+    """
+    bead_groups = _get_molecular_bead_groups(universe, moltypes)
+    counts = np.zeros((len(pairs), n_intervals, rdf_settings['bins']))
+    volumes: List[Tuple[int, float]] = []
+    for frame, interval in frames:
+        ts = universe.trajectory[frame]
+        positions = [bead_groups[moltype].positions for moltype in moltypes]
+        for index, (i, j) in enumerate(pairs):
+            bead_pairs, distances = capped_distance(
+                positions[i],
+                positions[j],
+                rdf_settings['range'][1],
+                box=ts.dimensions,
+            )
+            if i == j:  # remove self-distance
+                distances = distances[bead_pairs[:, 0] != bead_pairs[:, 1]]
+            count, _ = np.histogram(distances, **rdf_settings)
+            counts[index, interval] += count
+        volumes.append((interval, ts.volume))
+
+    return counts, volumes
+
+
+def _calc_molecular_rdf_one_pass(
+    universe: MDAnalysis.Universe,
+    bead_groups: Dict[str, BeadGroup],
+    moltypes: List[str],
+    pairs: List[Tuple[int, int]],
+    frames_start: NDArray,
+    frames_end: NDArray,
+    n_prune: int,
+    rdf_settings: Dict[str, Any],
+    n_processes: int = 1,
+) -> Dict[Tuple[int, int], List[Tuple[NDArray, NDArray]]]:
+    """
+    Calculates the radial distribution functions of all given pairs of molecule
+    types for all trajectory intervals in one pass over the frames. The frames can
+    be split across `n_processes` processes. Returns the bins and values for each
+    interval by pair, normalized in the same way as by
+    `MDAnalysis.analysis.rdf.InterRDF`.
+    """
+    frames = [
+        (frame, interval)
+        for interval in range(len(frames_start))
+        for frame in range(frames_start[interval], frames_end[interval], n_prune)
+    ]
+    n_intervals = len(frames_start)
+    histograms = functools.partial(
+        _molecular_rdf_histograms,
+        universe,
+        moltypes,
+        pairs,
+        n_intervals=n_intervals,
+        rdf_settings=rdf_settings,
+    )
+    if n_processes > 1 and len(frames) > 1:
+        chunks = np.array_split(np.arange(len(frames)), n_processes)
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            results = list(
+                executor.map(
+                    histograms,
+                    [[frames[i] for i in chunk] for chunk in chunks if len(chunk)],
+                )
+            )
+    else:
+        results = [histograms(frames)]
+
+    counts = np.zeros((len(pairs), n_intervals, rdf_settings['bins']))
+    volumes_cum = [0] * n_intervals
+    n_frames = [0] * n_intervals
+    for chunk_counts, chunk_volumes in results:
+        counts += chunk_counts
+        for interval, volume in chunk_volumes:
+            volumes_cum[interval] += volume
+            n_frames[interval] += 1
+
+    _, edges = np.histogram([-1], **rdf_settings)
+    bins = 0.5 * (edges[:-1] + edges[1:])
+    vols = np.power(edges, 3)
+    rdfs: Dict[Tuple[int, int], List[Tuple[NDArray, NDArray]]] = {}
+    for index, (i, j) in enumerate(pairs):
+        n_a = len(bead_groups[moltypes[i]])
+        n_b = len(bead_groups[moltypes[j]])
+        n_pairs = n_a * n_b
+        if i == j:
+            n_pairs -= 1 * 1 * (n_a / 1)
+        rdfs[(i, j)] = []
+        for interval in range(n_intervals):
+            norm = n_frames[interval]
+            norm *= 4 / 3 * np.pi * np.diff(vols)
+            box_vol = volumes_cum[interval] / n_frames[interval]
+            norm *= n_pairs / box_vol
+            rdfs[(i, j)].append((bins, counts[index, interval] / norm))
+
+    return rdfs
+
+
 def calc_molecular_rdf(
     universe: MDAnalysis.Universe,
     n_traj_split: int = 10,
     n_prune: int = 1,
     interval_indices=None,
     max_mols: int = 5000,
+    one_pass: bool = False,
+    n_processes: int = 1,
 ) -> Dict:
     """
     Calculates the radial distribution functions between for each unique pair of
@@ -1883,6 +1974,9 @@ def calc_molecular_rdf(
 
     interval_indices: 2D array specifying the groups of the n_traj_split intervals to be averaged
     max_mols: the maximum number of molecules per bead group for calculating the rdf, for efficiency purposes.
+    one_pass: if True, all pairs and intervals are calculated in one pass over the frames
+        instead of one `InterRDF` run per pair and interval.
+    n_processes: the number of processes to split the frames across in one pass mode.
     """
     # TODO 5k default for max_mols was set after > 50k was giving problems. Should do further testing to see where the appropriate limit should be set.
     if (
@@ -1940,6 +2034,24 @@ def calc_molecular_rdf(
     rdf_results['value'] = []
     rdf_results['frame_start'] = []
     rdf_results['frame_end'] = []
+    if one_pass:
+        pairs = [
+            (i, j)
+            for i, moltype_i in enumerate(moltypes)
+            for j in range(i + 1)
+            if i != j or bead_groups[moltype_i].positions.shape[0] != 1
+        ]
+        one_pass_rdfs = _calc_molecular_rdf_one_pass(
+            universe,
+            bead_groups,
+            moltypes,
+            pairs,
+            frames_start,
+            frames_end,
+            n_prune,
+            dict(bins=n_bins, range=(0, max_rdf_dist)),
+            n_processes=n_processes,
+        )
     for i, moltype_i in enumerate(moltypes):
         for j, moltype_j in enumerate(moltypes):
             if j > i:
@@ -1964,23 +2076,26 @@ def calc_molecular_rdf(
             for i_interval in range(n_traj_split):
                 rdf_results_interval['types'].append(pair_type)
                 rdf_results_interval['variables_name'].append(['distance'])
-                rdf = MDA_RDF.InterRDF(
-                    bead_groups[moltype_i],
-                    bead_groups[moltype_j],
-                    range=(0, max_rdf_dist),
-                    exclusion_block=exclusion_block,
-                    nbins=n_bins,
-                ).run(frames_start[i_interval], frames_end[i_interval], n_prune)
+                if one_pass:
+                    bins, rdf_values = one_pass_rdfs[(i, j)][i_interval]
+                else:
+                    rdf = MDA_RDF.InterRDF(
+                        bead_groups[moltype_i],
+                        bead_groups[moltype_j],
+                        range=(0, max_rdf_dist),
+                        exclusion_block=exclusion_block,
+                        nbins=n_bins,
+                    ).run(frames_start[i_interval], frames_end[i_interval], n_prune)
+                    bins, rdf_values = rdf.results.bins, rdf.results.rdf
                 rdf_results_interval['frame_start'].append(frames_start[i_interval])
                 rdf_results_interval['frame_end'].append(frames_end[i_interval])
 
                 rdf_results_interval['bins'].append(
-                    rdf.results.bins[int(n_smooth / 2) : -int(n_smooth / 2)]
-                    * ureg.angstrom
+                    bins[int(n_smooth / 2) : -int(n_smooth / 2)] * ureg.angstrom
                 )
                 rdf_results_interval['value'].append(
                     np.convolve(
-                        rdf.results.rdf, np.ones((n_smooth,)) / n_smooth, mode='same'
+                        rdf_values, np.ones((n_smooth,)) / n_smooth, mode='same'
                     )[int(n_smooth / 2) : -int(n_smooth / 2)]
                 )
 
@@ -2043,61 +2158,25 @@ def calc_molecular_rdf(
 
 
 def calc_molecular_mean_squared_displacements(
-    universe: MDAnalysis.Universe, max_mols: int = 5000
+    universe: MDAnalysis.Universe, max_mols: int = None
 ) -> Dict:
     """
     Calculates the mean squared displacement for the center of mass of each
-    molecule type.
-
-    max_mols: the maximum number of molecules per bead group for calculating the msd, for efficiency purposes.
-    50k was tested and is very fast and does not seem to have any memory issues.
-    """
-
-    def parse_jumps(
-        universe: MDAnalysis.Universe, selection: MDAnalysis.AtomGroup
-    ):  # TODO Add output declaration
-        """
-        See __get_nojump_positions().
-        """
-        __ = universe.trajectory[0]
-        prev = np.array(selection.positions)
-        box = universe.trajectory[0].dimensions[:3]
-        sparse_data = namedtuple('SparseData', ['data', 'row', 'col'])  # type: ignore[name-match]
-        jump_data = (
-            sparse_data(data=array('b'), row=array('l'), col=array('l')),
-            sparse_data(data=array('b'), row=array('l'), col=array('l')),
-            sparse_data(data=array('b'), row=array('l'), col=array('l')),
-        )
+    molecule type. The mean squared displacements are averaged over all time origins
+    (see `mean_squared_displacement_fft`) and given at logarithmically distributed
+    times up to half of the trajectory.
 
-        for i_frame, _ in enumerate(universe.trajectory[1:]):
-            curr = np.array(selection.positions)
-            delta = ((curr - prev) / box).round().astype(np.int8)
-            prev = np.array(curr)
-            for d in range(3):
-                (col,) = np.where(delta[:, d] != 0)
-                jump_data[d].col.extend(col)
-                jump_data[d].row.extend([i_frame] * len(col))
-                jump_data[d].data.extend(delta[col, d])
+    Earlier versions averaged over 10 time origins only and used at most 5000 random
+    molecules per molecule type. The values, diffusion constants and their errors
+    therefore differ slightly from results of these versions. They are less noisy and
+    reproducible.
 
-        return jump_data
-
-    def generate_nojump_matrices(
-        universe: MDAnalysis.Universe, selection: MDAnalysis.AtomGroup
-    ):  # TODO Add output declaration
-        """
-        See __get_nojump_positions().
-        """
-        jump_data = parse_jumps(universe, selection)
-        n_frames = len(universe.trajectory)
-        n_atoms = selection.positions.shape[0]
-
-        nojump_matrices = tuple(
-            sparse.csr_matrix(
-                (np.array(m.data), (m.row, m.col)), shape=(n_frames, n_atoms)
-            )
-            for m in jump_data
-        )
-        return nojump_matrices
+    max_mols: the maximum number of molecules per bead group for calculating the msd.
+    Larger groups are replaced by a random selection. By default, all molecules are
+    used. Limiting the molecules is no longer needed for efficiency: the cost grows
+    linearly with the number of molecules, and the positions are processed in chunks
+    of bounded memory.
+    """
 
     def get_nojump_positions(
         universe: MDAnalysis.Universe, selection: MDAnalysis.AtomGroup
@@ -2105,27 +2184,12 @@ def calc_molecular_mean_squared_displacements(
         """
         Unwraps the positions to create a continuous trajectory without jumps across periodic boundaries.
         """
-        nojump_matrices = generate_nojump_matrices(universe, selection)
         box = universe.trajectory[0].dimensions[:3]
+        positions = np.array([selection.positions for _ in universe.trajectory])
+        jumps = (np.diff(positions, axis=0) / box).round()
+        delta = np.concatenate([np.zeros_like(positions[:1]), np.cumsum(jumps, axis=0)])
 
-        nojump_positions = []
-        for i_frame, __ in enumerate(universe.trajectory):
-            delta = (
-                np.array(
-                    np.vstack([m[:i_frame, :].sum(axis=0) for m in nojump_matrices]).T
-                )
-                * box
-            )
-            nojump_positions.append(selection.positions - delta)
-
-        return np.array(nojump_positions)
-
-    def mean_squared_displacement(start: NDArray, current: NDArray):
-        """
-        Calculates mean square displacement between current and initial (start) coordinates.
-        """
-        vec = start - current
-        return (vec**2).sum(axis=1).mean()
+        return positions - delta * box
 
     if (
         not universe
@@ -2160,7 +2224,7 @@ def calc_molecular_mean_squared_displacements(
     moltypes = [moltype for moltype in bead_groups.keys()]
     del_list = []
     for i_moltype, moltype in enumerate(moltypes):
-        if bead_groups[moltype]._nbeads > max_mols:
+        if max_mols is not None and bead_groups[moltype]._nbeads > max_mols:
             if max_mols > 50000:
                 warnings.warn(
                     'Calculating mean squared displacements for more than 50k molecules.'
@@ -2204,17 +2268,16 @@ def calc_molecular_mean_squared_displacements(
     msd_results['times'] = []
     msd_results['diffusion_constant'] = []
     msd_results['error_diffusion_constant'] = []
+    lag_indices = __log_indices(0, int(n_frames * 0.5))
     for moltype in moltypes:
         positions = get_nojump_positions(universe, bead_groups[moltype])
-        results = shifted_correlation_average(
-            mean_squared_displacement, times, positions
-        )
-        if results:
-            msd_results['value'].append(results[1])
-            msd_results['times'].append(results[0])
-            diffusion_constant, error = _calc_diffusion_constant(*results)
-            msd_results['diffusion_constant'].append(diffusion_constant)
-            msd_results['error_diffusion_constant'].append(error)
+        lag_times = times[lag_indices] - times[0]
+        values = mean_squared_displacement_fft(positions)[lag_indices]
+        msd_results['value'].append(values)
+        msd_results['times'].append(lag_times)
+        diffusion_constant, error = _calc_diffusion_constant(lag_times, values)
+        msd_results['diffusion_constant'].append(diffusion_constant)
+        msd_results['error_diffusion_constant'].append(error)
 
     msd_results['types'] = moltypes
     msd_results['times'] = np.array(msd_results['times']) * ureg.picosecond
@@ -0,0 +1,200 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import io
+import os
+import tarfile
+import zipfile
+
+import h5py
+import numpy as np
+import pytest
+
+from nomad import utils
+from nomad.datamodel import EntryMetadata
+from nomad.files import (
+    PathObject,
+    PublicUploadFiles,
+    RawZipIndex,
+    StagingUploadFiles,
+    create_tmp_dir,
+    extract_archive_stream,
+)
+
+
+@pytest.fixture(scope='module')
+def tarball(tmp_path_factory):
+    """A tarball with 1000 files of 256 KiB random data in 10 directories."""
+    rng = np.random.default_rng(0)
+    path = tmp_path_factory.mktemp('files') / 'upload.tar'
+    with tarfile.open(path, 'w') as tf:
+        for index in range(1000):
+            info = tarfile.TarInfo(f'dir_{index % 10}/file_{index}.dat')
+            info.size = 256 * 1024
+            tf.addfile(info, io.BytesIO(rng.bytes(info.size)))
+
+    return str(path)
+
+
+def upload_chunks(path):
+    """Simulates the chunks of a received upload."""
+    with open(path, 'rb') as f:
+        while chunk := f.read(64 * 1024):
+            yield chunk
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_add_rawfiles_archive(benchmark, tarball, streaming):
+    def add():
+        upload_files = StagingUploadFiles(utils.create_uuid(), create=True)
+        tmp_dir = create_tmp_dir(upload_files.upload_id)
+        if streaming:
+            path = os.path.join(tmp_dir, 'upload')
+            os.makedirs(path)
+            extract_archive_stream(upload_chunks(tarball), path)
+        else:
+            path = os.path.join(tmp_dir, 'upload.tar')
+            with open(path, 'wb') as f:
+                for chunk in upload_chunks(tarball):
+                    f.write(chunk)
+        upload_files.add_rawfiles(path, cleanup_source_file_and_dir=True)
+        n_files = len(
+            list(upload_files.raw_directory_list(recursive=True, files_only=True))
+        )
+        upload_files.delete()
+        return n_files
+
+    assert benchmark(add) == 1000
+
+
+@pytest.fixture(scope='module')
+def public_upload_files():
+    """A published upload with a single stored 256 MiB raw file."""
+    rng = np.random.default_rng(0)
+    upload_files = PublicUploadFiles(utils.create_uuid(), create=True)
+    zip_path = PublicUploadFiles._create_raw_zip_file_object(
+        upload_files, 'public'
+    ).os_path
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        with zf.open('trajectory.dat', 'w', force_zip64=True) as f:
+            for _ in range(256):
+                f.write(rng.bytes(1024 * 1024))
+
+    yield upload_files
+    upload_files.close()
+    upload_files.delete()
+
+
+def open_raw_file(upload_files, direct):
+    if direct:
+        return upload_files.raw_file('trajectory.dat', 'rb')
+    return upload_files._open_raw_zip_file().open('trajectory.dat')
+
+
+@pytest.mark.parametrize('direct', [False, True])
+def test_read_raw_file(benchmark, public_upload_files, direct):
+    def read():
+        size = 0
+        with open_raw_file(public_upload_files, direct) as f:
+            while block := f.read(1024 * 1024):
+                size += len(block)
+        return size
+
+    assert benchmark(read) == 256 * 1024 * 1024
+
+
+@pytest.mark.parametrize('direct', [False, True])
+def test_read_raw_file_ranges(benchmark, public_upload_files, direct):
+    rng = np.random.default_rng(0)
+    offsets = rng.integers(0, 255 * 1024 * 1024, 100)
+
+    def read_ranges():
+        with open_raw_file(public_upload_files, direct) as f:
+            for offset in offsets:
+                f.seek(int(offset))
+                assert len(f.read(1024 * 1024)) == 1024 * 1024
+
+    benchmark(read_ranges)
+
+
+@pytest.fixture(scope='module')
+def public_upload_files_many():
+    """A published upload with 100000 raw files in 100 directories and an index."""
+    upload_files = PublicUploadFiles(utils.create_uuid(), create=True)
+    zip_path = PublicUploadFiles._create_raw_zip_file_object(
+        upload_files, 'public'
+    ).os_path
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        for index in range(100000):
+            zf.writestr(f'dir_{index % 100}/file_{index}.dat', b'data')
+    RawZipIndex.write(
+        PublicUploadFiles._create_raw_zip_index_file_object(
+            upload_files, 'public'
+        ).os_path,
+        zip_path,
+    )
+
+    yield upload_files
+    upload_files.delete()
+
+
+@pytest.mark.parametrize('with_index', [False, True])
+def test_raw_directory_page(
+    benchmark, monkeypatch, public_upload_files_many, with_index
+):
+    if not with_index:
+        monkeypatch.setattr(PublicUploadFiles, '_open_raw_zip_index', lambda _: None)
+
+    def list_page():
+        # A new upload files object per request, like in the API
+        upload_files = PublicUploadFiles(public_upload_files_many.upload_id)
+        assert upload_files.raw_path_exists('dir_42')
+        page, total, _ = upload_files.raw_directory_page('dir_42', 500, 510)
+        upload_files.close()
+        return len(page), total
+
+    assert benchmark(list_page) == (10, 1000)
+
+
+@pytest.fixture(scope='module')
+def staging_upload_files_hdf5():
+    """A staging upload with 100 entries, each with 50 small and one 8 MiB dataset."""
+    rng = np.random.default_rng(0)
+    upload_files = StagingUploadFiles(utils.create_uuid(), create=True)
+    entries = []
+    for index in range(100):
+        entry = EntryMetadata(entry_id=f'entry_{index}')
+        with h5py.File(upload_files.archive_hdf5_file(entry.entry_id), 'w') as f:
+            for dataset in range(50):
+                f.create_dataset(f'data/small_{dataset}', data=rng.random(16))
+            f.create_dataset('data/large', data=rng.random(1024 * 1024))
+        entries.append(entry)
+
+    yield upload_files, entries
+    upload_files.delete()
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_pack_archive_hdf5_files(
+    benchmark, monkeypatch, tmp_path, staging_upload_files_hdf5, workers
+):
+    monkeypatch.setattr('nomad.config.process.hdf5_pack_workers', workers)
+    upload_files, entries = staging_upload_files_hdf5
+    file_object = PathObject(str(tmp_path / 'archive-public.h5'))
+
+    benchmark(upload_files._pack_archive_hdf5_files, file_object, entries)
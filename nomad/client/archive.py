@@ -138,6 +138,8 @@ class ArchiveQuery:
         sleep_time (float): sleep time for retry, default: 4.
         semaphore (int): number of concurrent downloads, this depends on server settings, default: 4
         max_requests_per_second (int): maximum requests per second, default: 999999
+        lazy (bool): only deserialize the subsections of downloaded archives when they
+            are accessed, default: False
     """
 
     def __init__(
@@ -157,6 +159,7 @@ class ArchiveQuery:
         from_api: bool = False,
         semaphore: int = 8,
         max_requests_per_second: int = 20,
+        lazy: bool = False,
     ):
         self._owner: str = owner
         self._required = required if required is not None else '*'
@@ -177,6 +180,7 @@ class ArchiveQuery:
         self._semaphore = min(10, semaphore) if semaphore > 0 else 4
         self._results_actual: int = 0
         self._max_requests_per_second: int = max_requests_per_second
+        self._lazy: bool = lazy
 
         self._start_time: float = 0.0
         self._accumulated_requests: int = 0
@@ -465,7 +469,7 @@ class ArchiveQuery:
                 entry_id, upload_id = ids[index]
                 context = ClientContext(self._url, upload_id=upload_id, auth=self._auth)
                 result = EntryArchive.m_from_dict(
-                    response_json[index]['archive'], m_context=context
+                    response_json[index]['archive'], m_context=context, lazy=self._lazy
                 )
 
                 if not result:
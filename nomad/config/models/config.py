@@ -164,6 +164,62 @@ class Services(ConfigBaseModel):
         amount, the user cannot add more uploads.
     """,
     )
+    upload_block_size = Field(
+        1024 * 1024,
+        description="""
+        Received upload data is coalesced into blocks of this size (in bytes), before
+        it is written to disk (or extracted) by a separate thread.
+    """,
+    )
+    upload_queue_size = Field(
+        16,
+        description="""
+        The maximum number of blocks per upload that are received, but not yet
+        written. If the disk cannot keep up, receiving the upload is slowed down.
+    """,
+    )
+    chunked_upload_max_chunks = Field(
+        10000,
+        description="""
+        The maximum number of chunks a file can be uploaded in with a chunked upload.
+    """,
+    )
+    chunked_upload_max_chunk_size = Field(
+        1024**3,
+        description="""
+        The maximum size (in bytes) of a single chunk of a chunked upload.
+    """,
+    )
+    chunked_upload_max_age = Field(
+        7 * 24 * 3600,
+        description="""
+        Chunked uploads that have not received any chunks for this many seconds are
+        considered abandoned and are removed when the upload is cleaned up.
+    """,
+    )
+    decompression_checkpoint_spacing = Field(
+        16 * 1024 * 1024,
+        description="""
+        When compressed (gzip) raw files are read from an offset, the state of the
+        decompression is remembered every this many (decompressed) bytes. Subsequent
+        reads start from the nearest of these checkpoints.
+    """,
+    )
+    decompression_checkpoints = Field(
+        1000,
+        description="""
+        The maximum number of decompression checkpoints that are kept in memory (each
+        takes about 40 KB) for all compressed raw files.
+    """,
+    )
+    h5grove_open_files = Field(
+        32,
+        description="""
+        The maximum number of HDF5 files that the h5grove app keeps open per process.
+        Subsequent requests for the same file reuse the open file, until the file is
+        modified.
+    """,
+    )
     force_raw_file_decoding = Field(
         False,
         description="""
@@ -408,6 +464,7 @@ class Elastic(ConfigBaseModel):
     bulk_timeout = 600
     bulk_size = 1000
     entries_per_material_cap = 1000
+    material_delta_updates = False
     entries_index = 'nomad_entries_v1'
     materials_index = 'nomad_materials_v1'
     username: Optional[str]
@@ -536,6 +593,33 @@ class Normalize(ConfigBaseModel):
             ),
         )
     )
+    normalizer_time_budget: Optional[float] = Field(
+        None,
+        description="""
+            The default time budget in seconds for each normalizer. A normalizer that
+            exceeds its budget is interrupted with a warning, its partial results are
+            removed, and processing continues with the next normalizer. Budgets are
+            only enforced if the normalizers run in the main thread. Long running
+            calls into C extensions (e.g. zeo++, spglib, MatID) are only interrupted
+            once they return. No budget is applied if not set.
+        """,
+    )
+    normalizer_time_budgets: Dict[str, float] = Field(
+        {},
+        description="""
+            Time budgets in seconds for individual normalizers by normalizer name, e.g.
+            `PorosityNormalizer`. Overrides the default `normalizer_time_budget`. Use
+            0 to disable the budget for a normalizer.
+        """,
+    )
+    normalizer_workers = Field(
+        1,
+        description="""
+            The number of threads that run independent normalizers concurrently.
+            Normalizers are independent if they declare read and write sets that do not
+            overlap and have no time budget. With 1, all normalizers run sequentially.
+        """,
+    )
     system_classification_with_clusters_threshold = Field(
         64,
         description="""
@@ -561,6 +645,28 @@ class Normalize(ConfigBaseModel):
             https://pymatgen.org/pymatgen.symmetry.html#pymatgen.symmetry.analyzer.SpacegroupAnalyzer
         """,
     )
+    symmetry_cache_size = Field(
+        1000,
+        description="""
+            The number of symmetry analysis results that are cached in memory per
+            process. Structures that are equal within the symmetry tolerance share
+            the cached results. Set to 0 to disable the cache.
+        """,
+    )
+    symmetry_cache_directory: Optional[str] = Field(
+        None,
+        description="""
+            An optional directory to also store the cached symmetry analysis results
+            in. This allows to share them between processes.
+        """,
+    )
+    porosity_workers = Field(
+        1,
+        description="""
+            The number of processes that run the zeo++ volume, surface area and free
+            sphere calculations of the porosity normalizer in parallel.
+        """,
+    )
     prototype_symmetry_tolerance = Field(
         0.1,
         description="""
@@ -700,6 +806,30 @@ class Process(ConfigBaseModel):
         processing (e.g. created by parsers or normalizers) as log entries.
     """,
     )
+    hdf5_compression: Optional[str] = Field(
+        None,
+        description="""
+        The compression filter (e.g. `gzip` or `lzf`) for the HDF5 datasets that are
+        written while an entry is processed. Compressed datasets are chunked
+        automatically. No compression is used by default.
+    """,
+    )
+    hdf5_compression_min_size: int = Field(
+        64 * 1024,
+        description="""
+        Only HDF5 datasets with at least this many bytes are compressed.
+    """,
+    )
+    hdf5_pack_workers: int = Field(
+        1,
+        description="""
+        The number of forked processes that copy the HDF5 files of the entries into
+        the HDF5 file of a packed upload. With more than one, each process copies a
+        share of the entries into its own file and these files are merged afterwards.
+        The merge copies most of the data a second time. This only pays off if reading
+        the entry files is slow, e.g. on network file systems.
+    """,
+    )
     rfc3161_skip_published = False  # skip published entries, regardless of timestamp
 
 
@@ -912,6 +1042,14 @@ class Archive(ConfigBaseModel):
         To identify numerical lists.
         """,
     )
+    lazy_loading = Field(
+        False,
+        description="""
+        When enabled, archives that are loaded to resolve references and the archive
+        metadata of published uploads are only deserialized when their sections are
+        accessed. The archive file remains open as long as the loaded archive is used.
+        """,
+    )
 
 
 class Config(ConfigBaseModel):
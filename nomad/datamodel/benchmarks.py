@@ -0,0 +1,74 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+import pytest
+
+from nomad import files, processing, utils
+from nomad.datamodel import EntryArchive, EntryData, EntryMetadata
+from nomad.datamodel.context import ServerContext
+from nomad.datamodel.hdf5 import HDF5Dataset, hdf5_write_session
+from nomad.metainfo import MSection, Quantity, SubSection
+
+
+class Dataset(MSection):
+    value = Quantity(type=HDF5Dataset)
+
+
+class Datasets(EntryData):
+    small = SubSection(sub_section=Dataset, repeats=True)
+    large = SubSection(sub_section=Dataset, repeats=True)
+
+
+@pytest.fixture(scope='module')
+def hdf5_context():
+    upload_id = utils.create_uuid()
+    upload_files = files.StagingUploadFiles(upload_id, create=True)
+    context = ServerContext(upload=processing.Upload(upload_id=upload_id))
+    yield context
+    context.close()
+    upload_files.delete()
+
+
+@pytest.mark.parametrize('session', [False, True])
+def test_serialize_hdf5_datasets(benchmark, hdf5_context, session):
+    """An entry with 500 small and 4 large (6 MB) HDF5 datasets."""
+    rng = np.random.default_rng(0)
+    data = Datasets()
+    for _ in range(500):
+        data.m_add_sub_section(Datasets.small, Dataset(value=rng.normal(size=10)))
+    for _ in range(4):
+        data.m_add_sub_section(
+            Datasets.large, Dataset(value=rng.normal(size=(256, 1000, 3)))
+        )
+    archive = EntryArchive(
+        m_context=hdf5_context,
+        metadata=EntryMetadata(upload_id=hdf5_context.upload_id),
+        data=data,
+    )
+
+    def serialize():
+        # Each round writes a new archive HDF5 file
+        archive.metadata.entry_id = utils.create_uuid()
+        if session:
+            with hdf5_write_session(hdf5_context):
+                return archive.m_to_dict()
+        return archive.m_to_dict()
+
+    serialized = benchmark(serialize)
+    assert serialized['data']['large'][0]['value'].endswith('/data/large/0/value')
@@ -16,7 +16,7 @@
 # limitations under the License.
 #
 
-from typing import Dict, Any
+from typing import Any, Dict, List
 from urllib.parse import urlsplit, urlunsplit
 import re
 import os.path
@@ -59,6 +59,7 @@ class Context(MetainfoContext):
         self.archives: Dict[str, MSection] = {}
         self.urls: Dict[MSection, str] = {}
         self.file_handles: Dict[str, Any] = {}
+        self.hdf5_write_session = None
 
     @property
     def upload_id(self):
@@ -275,6 +276,7 @@ class ServerContext(Context):
         super().__init__()
         self.upload = upload
         self.file_handles = {}
+        self.archive_readers: List[Any] = []
 
     @property
     def upload_files(self):
@@ -308,10 +310,20 @@ class ServerContext(Context):
         upload_files = self._get_upload_files(upload_id, installation_url)
 
         try:
-            with upload_files.read_archive(entry_id) as reader:
-                from nomad.archive import to_json
+            if config.archive.lazy_loading:
+                # the lazy archive keeps reading from the reader, it is closed
+                # together with this context
+                reader = upload_files.read_archive(entry_id)
+                if entry_id not in reader:
+                    reader.close()
+                    raise KeyError(entry_id)
+                self.archive_readers.append(reader)
+                archive_dict = reader[entry_id]
+            else:
+                with upload_files.read_archive(entry_id) as reader:
+                    from nomad.archive import to_json
 
-                archive_dict = to_json(reader[entry_id])
+                    archive_dict = to_json(reader[entry_id])
         except KeyError:
             if upload_id != self.upload_id:
                 raise MetainfoReferenceError(
@@ -329,7 +341,9 @@ class ServerContext(Context):
 
             context = ServerContext(Upload(upload_id=upload_id))
 
-        return EntryArchive.m_from_dict(archive_dict, m_context=context)
+        return EntryArchive.m_from_dict(
+            archive_dict, m_context=context, lazy=config.archive.lazy_loading
+        )
 
     def load_raw_file(
         self, path: str, upload_id: str, installation_url: str, url: str = None
@@ -449,6 +463,9 @@ class ServerContext(Context):
         for hdf5_file in self.file_handles.values():
             hdf5_file.close()
         self.file_handles = {}
+        for reader in self.archive_readers:
+            reader.close()
+        self.archive_readers = []
 
     def __enter__(self):
         return self
@@ -1193,8 +1193,8 @@ class EntryArchive(ArchiveSection):
         if not archive.metadata.entry_name and archive.metadata.mainfile:
             archive.metadata.entry_name = os.path.basename(archive.metadata.mainfile)
 
-    def m_update_from_dict(self, dct) -> None:
-        super().m_update_from_dict(dct)
+    def m_update_from_dict(self, dct, lazy: bool = False) -> None:
+        super().m_update_from_dict(dct, lazy=lazy)
         if self.definitions is not None:
             self.definitions.archive = self
 
@@ -15,10 +15,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import Any, cast
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Tuple, cast
 import h5py
 import re
 
+from nomad.config import config
 from nomad.utils import get_logger
 from nomad.metainfo import DataType, MSection, Quantity
 
@@ -45,9 +47,10 @@ def read_hdf5_dataset(hdf5_file: h5py.File, path: str) -> h5py.Dataset:
     )[match['path']]
 
 
-def write_hdf5_dataset(value: Any, hdf5_file: h5py.File, path: str) -> None:
+def write_hdf5_dataset(value: Any, hdf5_file: h5py.File, path: str, **kwargs) -> None:
     """
-    Write data to HDF5 file.
+    Write data to HDF5 file. Additional kwargs (e.g. chunks, compression) are passed to
+    the dataset creation.
     """
     segments = path.rsplit('/', 1)
     group = hdf5_file.require_group(segments[0]) if len(segments) == 2 else hdf5_file
@@ -55,10 +58,103 @@ def write_hdf5_dataset(value: Any, hdf5_file: h5py.File, path: str) -> None:
         segments[-1],
         shape=value.shape if hasattr(value, 'shape') else (),
         dtype=value.dtype if hasattr(value, 'dtype') else None,
+        **kwargs,
     )
     dataset[...] = value.magnitude if hasattr(value, 'magnitude') else value
 
 
+class HDF5WriteSession:
+    """
+    Keeps the HDF5 files that are written while an entry is processed open. Each file
+    is opened once, all datasets of the entry are written to the same handle, and
+    the file is flushed and closed once when the session is closed.
+
+    Datasets of at least `compression_min_size` bytes are created with the given
+    `compression` filter and `chunks` (automatic chunking by default).
+    """
+
+    def __init__(
+        self,
+        compression: str = None,
+        compression_opts: Any = None,
+        compression_min_size: int = 0,
+        chunks: Any = True,
+    ):
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.compression_min_size = compression_min_size
+        self.chunks = chunks
+        self._files: Dict[Tuple[str, str], Tuple[IO, h5py.File]] = {}
+
+    def dataset_options(self, value: Any) -> Dict[str, Any]:
+        """The additional options for creating a dataset for the given value."""
+        shape = getattr(value, 'shape', ())
+        if not self.compression or not shape:
+            return {}  # Scalar datasets cannot be chunked
+        if getattr(value, 'nbytes', 0) < self.compression_min_size:
+            return {}
+        return dict(
+            chunks=self.chunks,
+            compression=self.compression,
+            compression_opts=self.compression_opts,
+        )
+
+    def get(self, upload_id: str, file_id: str) -> Optional[h5py.File]:
+        """Returns the file, if it was opened in this session."""
+        hdf5_file = self._files.get((upload_id, file_id))
+        return hdf5_file[1] if hdf5_file else None
+
+    def open(
+        self, upload_id: str, file_id: str, open_file_object: Callable[[], IO]
+    ) -> h5py.File:
+        """
+        Returns the open file with the given id (a raw path or an entry id). If it
+        is not open yet, it is opened from the file object returned by `open_file_object`.
+        """
+        key = (upload_id, file_id)
+        if key not in self._files:
+            file_object = open_file_object()
+            try:
+                self._files[key] = (file_object, h5py.File(file_object, 'a'))
+            except Exception:
+                file_object.close()
+                raise
+        return self._files[key][1]
+
+    def close(self):
+        files, self._files = self._files, {}
+        for file_object, hdf5_file in files.values():
+            try:
+                hdf5_file.close()
+            except Exception as e:
+                LOGGER.error('Cannot write HDF5 file', exc_info=e)
+            finally:
+                file_object.close()
+
+
+@contextmanager
+def hdf5_write_session(context) -> Iterator[HDF5WriteSession]:
+    """
+    Uses one :class:`HDF5WriteSession` for all HDF5 files that are written with the
+    given context (e.g. while an entry is processed). Nested calls use the already
+    open session.
+    """
+    if getattr(context, 'hdf5_write_session', None) is not None:
+        yield context.hdf5_write_session
+        return
+
+    session = HDF5WriteSession(
+        compression=config.process.hdf5_compression,
+        compression_min_size=config.process.hdf5_compression_min_size,
+    )
+    context.hdf5_write_session = session
+    try:
+        yield session
+    finally:
+        context.hdf5_write_session = None
+        session.close()
+
+
 class _HDF5Reference(DataType):
     @staticmethod
     def _get_upload_files(archive, path: str):
@@ -82,8 +178,21 @@ class _HDF5Reference(DataType):
         """
 
         match, upload_files = HDF5Reference._get_upload_files(archive, path)
-        mode = 'r+b' if upload_files.raw_path_is_file(match['file_id']) else 'wb'
-        with h5py.File(upload_files.raw_file(match['file_id'], mode), 'a') as f:
+        file_id = match['file_id']
+
+        def open_file_object():
+            mode = 'r+b' if upload_files.raw_path_is_file(file_id) else 'w+b'
+            return upload_files.raw_file(file_id, mode)
+
+        session = getattr(archive.m_context, 'hdf5_write_session', None)
+        if session is not None:
+            hdf5_file = session.open(upload_files.upload_id, file_id, open_file_object)
+            write_hdf5_dataset(
+                value, hdf5_file, match['path'], **session.dataset_options(value)
+            )
+            return
+
+        with h5py.File(open_file_object(), 'a') as f:
             write_hdf5_dataset(value, f, match['path'])
 
     @staticmethod
@@ -93,6 +202,13 @@ class _HDF5Reference(DataType):
         filename.h5#/path/to/dataset. upload_id is resolved from archive.
         """
         match, upload_files = HDF5Reference._get_upload_files(archive, path)
+        session = getattr(archive.m_context, 'hdf5_write_session', None)
+        if session is not None:
+            # Datasets written in this session are not flushed yet
+            hdf5_file = session.get(upload_files.upload_id, match['file_id'])
+            if hdf5_file is not None:
+                return read_hdf5_dataset(hdf5_file, path)[()]
+
         with h5py.File(upload_files.raw_file(match['file_id'], 'rb')) as f:
             return read_hdf5_dataset(f, path)[()]
 
@@ -117,6 +233,22 @@ class _HDF5Dataset(DataType):
         path = f'{section.m_path()}/{quantity_def.name}'
         upload_id, entry_id = ServerContext._get_ids(section.m_root(), required=True)
 
+        session = getattr(context, 'hdf5_write_session', None)
+        if session is not None:
+            try:
+                hdf5_file = session.open(
+                    upload_id,
+                    entry_id,
+                    lambda: context.open_hdf5_file(section, quantity_def, value, 'w'),
+                )
+                write_hdf5_dataset(
+                    value, hdf5_file, path, **session.dataset_options(value)
+                )
+                return f'/uploads/{upload_id}/archive/{entry_id}#{path}'
+            except Exception as e:
+                LOGGER.error('Cannot write HDF5 dataset', exc_info=e)
+                return None
+
         with context.open_hdf5_file(section, quantity_def, value, 'w') as file_object:
             hdf5_file = h5py.File(file_object, 'a')
             try:
@@ -147,6 +279,15 @@ class _HDF5Dataset(DataType):
 
         context = cast(Context, section_root.m_context)
 
+        session = getattr(context, 'hdf5_write_session', None)
+        if session is not None:
+            # Datasets written in this session are not flushed yet
+            hdf5_file = session.get(
+                match['upload_id'] or context.upload_id, match['file_id']
+            )
+            if hdf5_file is not None:
+                return read_hdf5_dataset(hdf5_file, value)
+
         file_object = context.open_hdf5_file(section, quantity_def, value, 'r')
         hdf5_file = context.file_handles.get(file_object.name)
         if not hdf5_file:
@@ -2237,6 +2237,7 @@ class MolecularDynamicsResults(ThermodynamicsResults):
                 n_traj_split=n_traj_split,
                 n_prune=n_prune,
                 interval_indices=interval_indices,
+                one_pass=True,
             )
             if rdf_results:
                 sec_rdfs = RadialDistributionFunction()
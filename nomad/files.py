@@ -55,20 +55,27 @@ from typing import (
     Any,
     NamedTuple,
     Callable,
+    Optional,
 )
 from pydantic import BaseModel
 from datetime import datetime
 import os.path
 import os
 import shutil
+import struct
 import tarfile
+import time
 import zipstream
 import hashlib
 import io
 import json
+import mmap
 import yaml
 import magic
 import zipfile
+import zlib
+import bz2
+import lzma
 
 from nomad import utils, datamodel
 from nomad.config import config
@@ -201,6 +208,383 @@ def is_safe_relative_path(path: str) -> bool:
     # return True
 
 
+_zip_local_header = struct.Struct('<4s5H3L2H')
+_zip_local_header_signature = b'PK\x03\x04'
+_zip_end_signatures = (b'PK\x01\x02', b'PK\x05\x06', b'PK\x06\x06')
+_zip_descriptor_signature = b'PK\x07\x08'
+_stream_chunk_size = 1024 * 1024
+
+
+class _ChunkStream(io.RawIOBase):
+    """
+    A readable, non seekable file object on top of an iterable of byte chunks. Allows
+    to push back data that was read, but not consumed.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b'')
+
+    def readable(self):
+        return True
+
+    def _fill(self, size: int):
+        parts = [self._buffer]
+        available = len(self._buffer)
+        while available < size:
+            chunk = next(self._chunks, None)
+            if not chunk:
+                break
+            parts.append(chunk)
+            available += len(chunk)
+        if len(parts) > 1:
+            self._buffer = memoryview(b''.join(parts))
+
+    def readinto(self, b) -> int:
+        # tarfile expects reads to only return less than requested at the end
+        view = memoryview(b).cast('B')
+        size = 0
+        while size < len(view):
+            if not self._buffer:
+                self._buffer = memoryview(next(self._chunks, None) or b'')
+                if not self._buffer:
+                    break
+            length = min(len(view) - size, len(self._buffer))
+            view[size : size + length] = self._buffer[:length]
+            self._buffer = self._buffer[length:]
+            size += length
+        return size
+
+    def peek(self, size: int) -> bytes:
+        self._fill(size)
+        return bytes(self._buffer[:size])
+
+    def read_exact(self, size: int) -> bytes:
+        self._fill(size)
+        if len(self._buffer) < size:
+            raise ValueError('Cannot extract file. Unexpected end of archive.')
+        data = bytes(self._buffer[:size])
+        self._buffer = self._buffer[size:]
+        return data
+
+    def read1(self, size: int = -1):
+        if not self._buffer:
+            return next(self._chunks, None) or b''
+        data, self._buffer = self._buffer, memoryview(b'')
+        return data
+
+    def unread(self, data: bytes):
+        self._buffer = memoryview(bytes(data) + bytes(self._buffer))
+
+
+def _archive_member_os_path(os_target_dir: str, name: str, is_dir: bool) -> str:
+    """
+    Returns the os path for the archive member `name` in `os_target_dir` and creates
+    the necessary directories. Returns None for members that denote the root directory.
+    Raises a ValueError for unsafe names and if files and directories collide.
+    """
+    elements = [element for element in name.split('/') if element not in ('', '.')]
+    if not elements:
+        return None
+    if not all(is_safe_basename(element) for element in elements):
+        raise ValueError(f'Cannot extract file. Unsafe path in archive: {name}')
+
+    os_path = os.path.join(os_target_dir, *elements)
+    try:
+        os.makedirs(os_path if is_dir else os.path.dirname(os_path), exist_ok=True)
+        conflict = not is_dir and os.path.isdir(os_path)
+    except (FileExistsError, NotADirectoryError):
+        conflict = True
+    if conflict:
+        raise ValueError(
+            f'Cannot merge a file with a directory or vice versa: {"/".join(elements)}'
+        )
+
+    return os_path
+
+
+def _extract_tar_stream(stream: _ChunkStream, os_target_dir: str):
+    try:
+        with tarfile.open(fileobj=stream, mode='r|*') as tf:
+            for member in tf:
+                if not (member.isdir() or member.isfile()):
+                    continue  # Skip links and special files, could pose security risk
+                os_path = _archive_member_os_path(
+                    os_target_dir, member.name, member.isdir()
+                )
+                if os_path is None or member.isdir():
+                    continue
+                with open(os_path, 'wb') as f:
+                    shutil.copyfileobj(tf.extractfile(member), f, _stream_chunk_size)
+    except (tarfile.TarError, EOFError) as e:
+        raise ValueError(
+            'Cannot extract file. Bad file format or file extension?'
+        ) from e
+
+
+def _zip64_sizes(extra: bytes, size: int, compressed_size: int):
+    """
+    Reads the sizes from the zip64 extra field, if present. Returns if the field was
+    present and the (updated) size and compressed size.
+    """
+    offset = 0
+    while offset + 4 <= len(extra):
+        tag, length = struct.unpack_from('<2H', extra, offset)
+        if tag == 1:
+            values = iter(struct.unpack_from(f'<{length // 8}Q', extra, offset + 4))
+            if size == 0xFFFFFFFF:
+                size = next(values, size)
+            if compressed_size == 0xFFFFFFFF:
+                compressed_size = next(values, compressed_size)
+            return True, size, compressed_size
+        offset += 4 + length
+
+    return False, size, compressed_size
+
+
+def _read_zip_data_descriptor(stream: _ChunkStream, zip64: bool):
+    """Reads a data descriptor and returns its crc, compressed size, and size."""
+    crc = stream.read_exact(4)
+    if crc == _zip_descriptor_signature:
+        crc = stream.read_exact(4)
+    sizes = struct.unpack(
+        '<2Q' if zip64 else '<2L', stream.read_exact(16 if zip64 else 8)
+    )
+    return (struct.unpack('<L', crc)[0], *sizes)
+
+
+def _copy_zip_member(stream: _ChunkStream, f: IO, compressed_size: int):
+    """
+    Copies a stored member of known size and returns its crc, compressed size,
+    and size.
+    """
+    crc = 0
+    remaining = compressed_size
+    while remaining > 0:
+        data = stream.read1()
+        if not data:
+            raise ValueError('Cannot extract file. Unexpected end of archive.')
+        if len(data) > remaining:
+            stream.unread(data[remaining:])
+            data = data[:remaining]
+        f.write(data)
+        crc = zlib.crc32(data, crc)
+        remaining -= len(data)
+
+    return crc, compressed_size, compressed_size
+
+
+def _inflate_zip_member(stream: _ChunkStream, f: IO):
+    """
+    Inflates a deflated member until the end of its compressed data and returns
+    its crc, compressed size, and size.
+    """
+    crc, size, compressed_size = 0, 0, 0
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    while not decompressor.eof:
+        data = stream.read1()
+        if not data:
+            raise ValueError('Cannot extract file. Unexpected end of archive.')
+        compressed_size += len(data)
+        while data:
+            try:
+                # limit the output to not inflate highly compressed data into memory
+                out = decompressor.decompress(data, _stream_chunk_size)
+            except zlib.error as e:
+                raise ValueError('Cannot extract file. Bad compressed data.') from e
+            f.write(out)
+            crc = zlib.crc32(out, crc)
+            size += len(out)
+            data = decompressor.unconsumed_tail
+    stream.unread(decompressor.unused_data)
+
+    return crc, compressed_size - len(decompressor.unused_data), size
+
+
+def _lzma_zip_decompressor(stream: _ChunkStream):
+    """
+    Reads the header of a lzma compressed member and returns a decompressor for the
+    raw lzma data that follows it and the size of the header.
+    """
+    _, properties_size = struct.unpack('<2H', stream.read_exact(4))
+    properties = stream.read_exact(properties_size)
+    if properties_size != 5:
+        raise ValueError('Cannot extract file. Bad compressed data.')
+    lclppb, dict_size = struct.unpack('<BL', properties)
+    lzma_filter = dict(
+        id=lzma.FILTER_LZMA1,
+        dict_size=dict_size,
+        lc=lclppb % 9,
+        lp=lclppb // 9 % 5,
+        pb=lclppb // 45,
+    )
+    decompressor = lzma.LZMADecompressor(lzma.FORMAT_RAW, filters=[lzma_filter])
+    return decompressor, 4 + properties_size
+
+
+def _decompress_zip_member(
+    stream: _ChunkStream,
+    f: IO,
+    decompressor,
+    header_size: int = 0,
+    compressed_size: int = None,
+):
+    """
+    Decompresses a bzip2 or lzma compressed member with the given decompressor and
+    returns its crc, compressed size, and size. The member ends with the end of the
+    compressed data, or after the given compressed size, if its data has no end marker.
+    """
+    crc, size, consumed = 0, 0, header_size
+    while not decompressor.eof:
+        data = b''
+        if decompressor.needs_input:
+            if compressed_size is not None and consumed == compressed_size:
+                break
+            data = stream.read1()
+            if not data:
+                raise ValueError('Cannot extract file. Unexpected end of archive.')
+            if compressed_size is not None and consumed + len(data) > compressed_size:
+                stream.unread(data[compressed_size - consumed :])
+                data = data[: compressed_size - consumed]
+            consumed += len(data)
+        try:
+            # limit the output to not decompress highly compressed data into memory
+            out = decompressor.decompress(data, _stream_chunk_size)
+        except (OSError, EOFError, lzma.LZMAError) as e:
+            raise ValueError('Cannot extract file. Bad compressed data.') from e
+        f.write(out)
+        crc = zlib.crc32(out, crc)
+        size += len(out)
+    stream.unread(decompressor.unused_data)
+
+    return crc, consumed - len(decompressor.unused_data), size
+
+
+def _scan_zip_member(stream: _ChunkStream, f: IO, zip64: bool):
+    """
+    Copies a stored member of unknown size. The end of the data is found by
+    scanning for a data descriptor that matches the data before it. Returns the crc,
+    compressed size, and size from the descriptor.
+    """
+    descriptor = struct.Struct('<4sL2Q' if zip64 else '<4s3L')
+    crc, size = 0, 0
+    pending = b''
+    while True:
+        data = stream.read1()
+        if not data:
+            raise ValueError('Cannot extract file. Unexpected end of archive.')
+        pending += data
+        position = pending.find(_zip_descriptor_signature)
+        while position != -1 and position + descriptor.size <= len(pending):
+            _, descriptor_crc, compressed_size, descriptor_size = (
+                descriptor.unpack_from(pending, position)
+            )
+            if (
+                compressed_size == descriptor_size == size + position
+                and zlib.crc32(pending[:position], crc) == descriptor_crc
+            ):
+                f.write(pending[:position])
+                stream.unread(pending[position + descriptor.size :])
+                return descriptor_crc, compressed_size, descriptor_size
+            position = pending.find(_zip_descriptor_signature, position + 1)
+
+        # everything before an incomplete descriptor candidate is member data
+        end = (
+            len(pending) - len(_zip_descriptor_signature) + 1
+            if position == -1
+            else position
+        )
+        if end > 0:
+            f.write(pending[:end])
+            crc = zlib.crc32(pending[:end], crc)
+            size += end
+            pending = pending[end:]
+
+
+def _extract_zip_stream(stream: _ChunkStream, os_target_dir: str):
+    """
+    Extracts a zip file based on its local file headers, i.e. without the central
+    directory at the end of the file.
+    """
+    while True:
+        signature = stream.read_exact(4)
+        if signature in _zip_end_signatures:
+            return
+        if signature != _zip_local_header_signature:
+            raise ValueError('Cannot extract file. Bad file format or file extension?')
+
+        header = _zip_local_header.unpack(signature + stream.read_exact(26))
+        flags, method = header[2:4]
+        crc, compressed_size, size, name_length, extra_length = header[6:]
+        name = stream.read_exact(name_length).decode(
+            'utf-8' if flags & 0x800 else 'cp437'
+        )
+        zip64, size, compressed_size = _zip64_sizes(
+            stream.read_exact(extra_length), size, compressed_size
+        )
+        if flags & 0x1:
+            raise ValueError(f'Cannot extract file. Encrypted zip member: {name}')
+        if method not in (
+            zipfile.ZIP_STORED,
+            zipfile.ZIP_DEFLATED,
+            zipfile.ZIP_BZIP2,
+            zipfile.ZIP_LZMA,
+        ):
+            raise ValueError(f'Cannot extract file. Unsupported compression: {name}')
+        # lzma data without end marker can only be extracted with a known size
+        if method == zipfile.ZIP_LZMA and not flags & 0x2 and flags & 0x8:
+            raise ValueError(f'Cannot extract file. Unsupported compression: {name}')
+
+        is_dir = name.endswith('/')
+        os_path = _archive_member_os_path(os_target_dir, name, is_dir)
+        scan = method == zipfile.ZIP_STORED and flags & 0x8 and compressed_size == 0
+        with open(os.devnull if is_dir or os_path is None else os_path, 'wb') as f:
+            if scan:
+                actual = _scan_zip_member(stream, f, zip64)
+            elif method == zipfile.ZIP_DEFLATED:
+                actual = _inflate_zip_member(stream, f)
+            elif method == zipfile.ZIP_BZIP2:
+                actual = _decompress_zip_member(stream, f, bz2.BZ2Decompressor())
+            elif method == zipfile.ZIP_LZMA:
+                actual = _decompress_zip_member(
+                    stream,
+                    f,
+                    *_lzma_zip_decompressor(stream),
+                    compressed_size=None if flags & 0x2 else compressed_size,
+                )
+            else:
+                actual = _copy_zip_member(stream, f, compressed_size)
+
+        if scan:
+            expected = actual
+        elif flags & 0x8:
+            expected = _read_zip_data_descriptor(stream, zip64)
+        else:
+            expected = (crc, compressed_size, size)
+        if actual != expected:
+            raise ValueError(f'Cannot extract file. Bad CRC or size: {name}')
+
+
+def extract_archive_stream(chunks: Iterable[bytes], os_target_dir: str) -> str:
+    """
+    Extracts the zip or tar archive (tar also gzip, bzip2, or lzma compressed), that
+    is given as an iterable of byte chunks, into the directory `os_target_dir`. The
+    archive is decoded while the chunks are consumed, e.g. while they are received. The
+    extraction applies the same rules as :func:`StagingUploadFiles.add_rawfiles`: links
+    are skipped, and files and directories with the same path cannot be merged.
+
+    Returns the archive format ('zip' or 'tar'). Raises a ValueError if the archive
+    cannot be extracted.
+    """
+    stream = _ChunkStream(chunks)
+    if stream.peek(4) in (_zip_local_header_signature, *_zip_end_signatures):
+        _extract_zip_stream(stream, os_target_dir)
+        return 'zip'
+
+    _extract_tar_stream(stream, os_target_dir)
+    return 'tar'
+
+
 class PathObject:
     """
     Object storage-like abstraction for paths in general.
@@ -593,6 +977,39 @@ def create_zipstream(
     return iter(zip_stream)
 
 
+def _copy_archive_hdf5_files(
+    os_path: str, sources: List[Tuple[str, Optional[str], int]]
+) -> str:
+    """
+    Copies the contents of the given HDF5 files into a new HDF5 file with one group per
+    entry. The sources are tuples of entry id, path (or None for entries without HDF5
+    data), and size. Returns the path of the created file.
+    """
+    import h5py
+
+    with h5py.File(os_path, 'w') as hdf5_target:
+        for entry_id, source_os_path, _ in sources:
+            group = hdf5_target.create_group(entry_id)
+            if source_os_path is None:
+                continue
+            with h5py.File(source_os_path, 'r') as hdf5_source:
+                for key in hdf5_source.keys():
+                    hdf5_source.copy(key, group)
+
+    return os_path
+
+
+def _merge_hdf5_files(os_path: str, other_os_paths: List[str]):
+    """Copies all top-level objects of the other HDF5 files into the first one."""
+    import h5py
+
+    with h5py.File(os_path, 'a') as hdf5_target:
+        for other_os_path in other_os_paths:
+            with h5py.File(other_os_path, 'r') as hdf5_source:
+                for key in hdf5_source.keys():
+                    hdf5_source.copy(key, hdf5_target)
+
+
 def _versioned_archive_file_object(
     target_dir: DirectoryObject, file_name: Callable[[str], str], fallback: bool
 ) -> PathObject:
@@ -624,6 +1041,114 @@ def _versioned_archive_file_object(
     return target_dir.join_file(file_name(f'-{version_suffixes[0]}'))
 
 
+class ChunkedUpload(DirectoryObject):
+    """
+    A file that is uploaded in numbered chunks. Chunks can be put in any order and
+    repeatedly, e.g. to resume an interrupted upload, and are only kept if their
+    SHA-256 checksum matches. The chunks are stored in the staging upload files
+    (see :func:`StagingUploadFiles.create_chunked_upload`) until the file is
+    assembled with :func:`read_chunks`.
+
+    Attributes:
+        session_id: The id of this chunked upload.
+        file_name: The name of the uploaded file.
+        path: The raw directory the file is added to.
+        n_chunks: The number of chunks the file is uploaded in.
+    """
+
+    session_file_name = 'session.json'
+
+    def __init__(self, os_path: str):
+        super().__init__(os_path)
+        session_os_path = os.path.join(os_path, ChunkedUpload.session_file_name)
+        try:
+            with open(session_os_path) as f:
+                session = json.load(f)
+        except FileNotFoundError:
+            raise KeyError(os.path.basename(os_path))
+
+        self.session_id = os.path.basename(os_path)
+        self.file_name: str = session['file_name']
+        self.path: str = session['path']
+        self.n_chunks: int = session['n_chunks']
+
+    @classmethod
+    def create(
+        cls, os_path: str, file_name: str, path: str, n_chunks: int
+    ) -> 'ChunkedUpload':
+        assert is_safe_basename(file_name), 'Bad file name provided'
+        assert is_safe_relative_path(path), 'Bad path provided'
+        assert n_chunks > 0, 'At least one chunk is needed'
+        assert (
+            n_chunks <= config.services.chunked_upload_max_chunks
+        ), 'Too many chunks requested'
+        os.makedirs(os_path)
+        with open(os.path.join(os_path, ChunkedUpload.session_file_name), 'w') as f:
+            json.dump(dict(file_name=file_name, path=path, n_chunks=n_chunks), f)
+        return cls(os_path)
+
+    def _chunk_os_path(self, index: int) -> str:
+        return os.path.join(self.os_path, f'chunk_{index}')
+
+    def put_chunk(self, index: int, blocks: Iterable[bytes], checksum: str) -> int:
+        """
+        Writes the chunk with the given index from the given blocks of data and returns
+        its size. A chunk that was received before is replaced. Raises ValueError, if
+        the SHA-256 hex digest of the data does not match `checksum`, or if the chunk
+        is larger than `services.chunked_upload_max_chunk_size`.
+        """
+        max_size = config.services.chunked_upload_max_chunk_size
+        assert 0 <= index < self.n_chunks, 'Bad chunk index provided'
+        # Chunks are written under a unique name first, so that concurrent or
+        # interrupted requests never leave a partial chunk behind.
+        chunk_os_path = self._chunk_os_path(index)
+        tmp_os_path = f'{chunk_os_path}.{utils.create_uuid()}.part'
+        hash = hashlib.sha256()
+        size = 0
+        try:
+            with open(tmp_os_path, 'wb') as f:
+                for block in blocks:
+                    size += len(block)
+                    if size > max_size:
+                        raise ValueError(
+                            f'Chunk {index} is larger than {max_size} bytes.'
+                        )
+                    hash.update(block)
+                    f.write(block)
+            if hash.hexdigest() != checksum.lower():
+                raise ValueError(
+                    f'The data of chunk {index} does not match the given checksum.'
+                )
+            os.replace(tmp_os_path, chunk_os_path)
+        finally:
+            if os.path.exists(tmp_os_path):
+                os.remove(tmp_os_path)
+
+        return size
+
+    def missing_chunks(self) -> List[int]:
+        """The indices of all chunks that were not yet received."""
+        received = set(os.listdir(self.os_path))
+        return [
+            index for index in range(self.n_chunks) if f'chunk_{index}' not in received
+        ]
+
+    @property
+    def last_modified(self) -> float:
+        """The time (seconds since the epoch) the session or a chunk was last written."""
+        paths = [os.path.join(self.os_path, name) for name in os.listdir(self.os_path)]
+        return max(os.path.getmtime(path) for path in [self.os_path, *paths])
+
+    def read_chunks(self) -> Iterator[bytes]:
+        """Yields the data of the whole file in blocks, chunk by chunk."""
+        assert not self.missing_chunks(), 'Not all chunks were received'
+        block_size = config.services.upload_block_size
+        for index in range(self.n_chunks):
+            with open(self._chunk_os_path(index), 'rb') as f:
+                while block := f.read(block_size):
+                    yield block
+
+
 class UploadFiles(DirectoryObject, metaclass=ABCMeta):
     """Abstract base class for upload files."""
 
@@ -727,6 +1252,24 @@ class UploadFiles(DirectoryObject, metaclass=ABCMeta):
         """
         raise NotImplementedError()
 
+    def raw_directory_page(
+        self, path: str, start: int, end: int
+    ) -> Tuple[List[RawPathInfo], int, int]:
+        """
+        Returns the elements of the directory specified by `path` from index `start` to
+        `end` (exclusive), together with the total number of elements and their total
+        size.
+        """
+        page: List[RawPathInfo] = []
+        total = 0
+        total_size = 0
+        for index, path_info in enumerate(self.raw_directory_list(path)):
+            total += 1
+            total_size += path_info.size
+            if start <= index < end:
+                page.append(path_info)
+        return page, total, total_size
+
     def raw_file(self, file_path: str, *args, **kwargs) -> IO:
         """
         Opens a raw file and returns a file-like object. Additional args, kwargs are
@@ -815,6 +1358,10 @@ class UploadFiles(DirectoryObject, metaclass=ABCMeta):
     def archive_hdf5_file(self, entry_id: str) -> IO:
         raise NotImplementedError()
 
+    def archive_hdf5_file_object(self, entry_id: str) -> PathObject:
+        """The file that contains the HDF5 archive data of the given entry."""
+        raise NotImplementedError()
+
 
 class StagingUploadFiles(UploadFiles):
     def __init__(self, upload_id: str, create: bool = False):
@@ -876,6 +1423,55 @@ class StagingUploadFiles(UploadFiles):
         assert path and is_safe_relative_path(path), 'Bad path provided'
         os.makedirs(os.path.join(self._raw_dir.os_path, path))
 
+    def create_chunked_upload(
+        self, file_name: str, path: str, n_chunks: int
+    ) -> ChunkedUpload:
+        """
+        Creates a new chunked upload of a file with the given name, that will be added
+        to the raw directory `path`.
+        """
+        chunked_dir = self.join_dir('chunked', create=True)
+        return ChunkedUpload.create(
+            os.path.join(chunked_dir.os_path, utils.create_uuid()),
+            file_name,
+            path,
+            n_chunks,
+        )
+
+    def chunked_upload(self, session_id: str) -> ChunkedUpload:
+        """Returns the chunked upload with the given id, or raises KeyError."""
+        if not is_safe_basename(session_id):
+            raise KeyError(session_id)
+        return ChunkedUpload(self.join_dir('chunked').join_dir(session_id).os_path)
+
+    def delete_abandoned_chunked_uploads(self, max_age: float = None) -> int:
+        """
+        Deletes the chunked uploads that were not written to for `max_age` seconds
+        (default is ``services.chunked_upload_max_age``), e.g. because the client
+        never committed them. Returns the number of deleted chunked uploads.
+        """
+        if max_age is None:
+            max_age = config.services.chunked_upload_max_age
+        chunked_dir = self.join_dir('chunked')
+        if not chunked_dir.exists():
+            return 0
+
+        deleted = 0
+        for session_id in os.listdir(chunked_dir.os_path):
+            session_dir = chunked_dir.join_dir(session_id)
+            try:
+                last_modified = ChunkedUpload(session_dir.os_path).last_modified
+            except KeyError:
+                # without session file, e.g. interrupted while it was created
+                last_modified = os.path.getmtime(session_dir.os_path)
+            except FileNotFoundError:
+                continue  # deleted concurrently
+            if time.time() - last_modified > max_age:
+                shutil.rmtree(session_dir.os_path, ignore_errors=True)
+                deleted += 1
+
+        return deleted
+
     def raw_directory_list(
         self,
         path: str = '',
@@ -940,10 +1536,13 @@ class StagingUploadFiles(UploadFiles):
         return self._raw_dir.join_file(file_path)
 
     def archive_hdf5_file(self, entry_id: str) -> IO:
-        file_object = self.join_dir('archive').join_file(f'{entry_id}.h5')
-        farg = 'r+b' if file_object.exists() else 'wb'
+        file_object = self.archive_hdf5_file_object(entry_id)
+        farg = 'r+b' if file_object.exists() else 'w+b'
         return self._file(file_object, farg)
 
+    def archive_hdf5_file_object(self, entry_id: str) -> PathObject:
+        return self.join_dir('archive').join_file(f'{entry_id}.h5')
+
     def write_archive(self, entry_id: str, data: Any) -> int:
         """Writes the data as archive file and returns the archive file size."""
         archive_file_object = self._archive_file_object(entry_id)
@@ -1293,16 +1892,7 @@ class StagingUploadFiles(UploadFiles):
             file_object = PublicUploadFiles._create_archive_hdf5_file_object(
                 target_dir, access
             )
-            import h5py
-
-            with h5py.File(file_object.os_path, 'w') as hdf5_target:
-                for entry in entries:
-                    with h5py.File(
-                        self.archive_hdf5_file(entry.entry_id), 'a'
-                    ) as hdf5_source:
-                        group = hdf5_target.create_group(entry.entry_id)
-                        for key in hdf5_source.keys():
-                            hdf5_source.copy(key, group)
+            self._pack_archive_hdf5_files(file_object, entries)
             other_file_object = PublicUploadFiles._create_archive_hdf5_file_object(
                 target_dir, other_access
             )
@@ -1315,6 +1905,51 @@ class StagingUploadFiles(UploadFiles):
 
         return number_of_entries
 
+    def _pack_archive_hdf5_files(
+        self, file_object: PathObject, entries: List[datamodel.EntryMetadata]
+    ):
+        """
+        Copies the HDF5 files of the given entries into one group per entry of the
+        given file. With `config.process.hdf5_pack_workers` > 1, forked processes copy
+        shares of similar size into shard files next to the target. The first shard
+        absorbs all others and is renamed to the target afterwards.
+        """
+        sources = []
+        for entry in entries:
+            source_object = self.archive_hdf5_file_object(entry.entry_id)
+            size = source_object.size if source_object.exists() else 0
+            sources.append(
+                (entry.entry_id, source_object.os_path if size > 0 else None, size)
+            )
+
+        workers = min(config.process.hdf5_pack_workers, len(sources))
+        if workers <= 1:
+            _copy_archive_hdf5_files(file_object.os_path, sources)
+            return
+
+        shards: List[List[Tuple[str, Optional[str], int]]] = [
+            [] for _ in range(workers)
+        ]
+        shard_sizes = [0] * workers
+        for source in sorted(sources, key=lambda source: source[2], reverse=True):
+            index = shard_sizes.index(min(shard_sizes))
+            shards[index].append(source)
+            shard_sizes[index] += source[2]
+
+        shard_os_paths = [
+            f'{file_object.os_path}.shard-{index}' for index in range(workers)
+        ]
+        try:
+            utils.fork_map(
+                _copy_archive_hdf5_files, list(zip(shard_os_paths, shards)), workers
+            )
+            _merge_hdf5_files(shard_os_paths[0], shard_os_paths[1:])
+            os.replace(shard_os_paths[0], file_object.os_path)
+        finally:
+            for shard_os_path in shard_os_paths:
+                if os.path.exists(shard_os_path):
+                    os.remove(shard_os_path)
+
     def _pack_raw_files(
         self, target_dir: DirectoryObject, access: str, other_access: str
     ):
@@ -1333,12 +1968,25 @@ class StagingUploadFiles(UploadFiles):
                     raw_zip.write(
                         self._raw_dir.join_file(path_info.path).os_path, path_info.path
                     )
+            RawZipIndex.write(
+                PublicUploadFiles._create_raw_zip_index_file_object(
+                    target_dir, access
+                ).os_path,
+                raw_zip_file_object.os_path,
+            )
             # Remove the zip file with the opposite access, if it exists
             other_raw_zip_file_object = PublicUploadFiles._create_raw_zip_file_object(
                 target_dir, other_access
             )
             if other_raw_zip_file_object.exists():
                 other_raw_zip_file_object.delete()  # This file should be empty, if it exists
+            other_raw_zip_index_file_object = (
+                PublicUploadFiles._create_raw_zip_index_file_object(
+                    target_dir, other_access
+                )
+            )
+            if other_raw_zip_index_file_object.exists():
+                other_raw_zip_index_file_object.delete()
         except Exception as e:
             self.logger.error('exception during packing raw files', exc_info=e)
             raise
@@ -1431,12 +2079,262 @@ class StagingUploadFiles(UploadFiles):
             yield bundle_file_source.sub_source(bundle_info_filename)
 
 
+class _FileRegion(io.RawIOBase):
+    """
+    A read-only, seekable file object for a region of a file, e.g. the data of a stored
+    zip member. The region is read with `os.pread`, i.e. without a shared file position,
+    buffering, or CRC checks.
+    """
+
+    def __init__(self, os_path: str, offset: int, size: int, name: str = None):
+        self._fd = os.open(os_path, os.O_RDONLY)
+        self._offset = offset
+        self._size = size
+        self._position = 0
+        self.name = name
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, position: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            position += self._position
+        elif whence == io.SEEK_END:
+            position += self._size
+        if position < 0:
+            raise ValueError('Negative seek position')
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = max(self._size - self._position, 0)
+        if size < 0 or size > remaining:
+            size = remaining
+        data = os.pread(self._fd, size, self._offset + self._position)
+        self._position += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, b) -> int:
+        size = min(len(b), max(self._size - self._position, 0))
+        if not size:
+            return 0
+        with memoryview(b) as view:
+            n = os.preadv(self._fd, [view[:size]], self._offset + self._position)
+        self._position += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            os.close(self._fd)
+        super().close()
+
+
+def _zip_member_data_offset(fd: int, info: zipfile.ZipInfo) -> Optional[int]:
+    """
+    Determines the offset of the data of a stored (i.e. not compressed) zip member
+    from its local file header, or returns None if the member is compressed or encrypted.
+    """
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    # The data follows the local file header, which can have different extra fields
+    # than the central directory
+    header = os.pread(fd, 30, info.header_offset)
+    if header[:4] != b'PK\x03\x04':
+        return None
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    return info.header_offset + 30 + name_length + extra_length
+
+
+class RawZipIndex:
+    """
+    A memory-mapped index of the files and directories in a published raw zip file.
+
+    The index is written next to the raw zip file when packing. It has a header, one
+    fixed-size record per path (path offset and length, file or directory, size
+    and the data offset of stored files), and the utf-8 encoded paths. The records
+    are sorted by parent directory and name, which puts the content of each directory
+    into one consecutive range. Looking up paths and directory contents therefore
+    only needs a binary search and never touches the central directory of the zip
+    file. The root directory is the first record.
+
+    The header also stores the size and the last bytes of the zip file, which are
+    used to detect indices that do not match the zip file anymore.
+    """
+
+    _magic = b'NOMADRZI'
+    _version = 1
+    _header = struct.Struct('<8sIIQQ32s')
+    _record = struct.Struct('<QIIQQ')
+
+    def __init__(self, os_path: str, zip_os_path: str):
+        with open(os_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mmap) < self._header.size:
+                raise ValueError('Raw zip index is truncated')
+            magic_bytes, version, _, self._length, zip_size, zip_tail = (
+                self._header.unpack_from(self._mmap)
+            )
+            if magic_bytes != self._magic or version != self._version:
+                raise ValueError('Not a raw zip index or unsupported version')
+            self._paths_offset = self._header.size + self._length * self._record.size
+            if len(self._mmap) < self._paths_offset:
+                raise ValueError('Raw zip index is truncated')
+            if (zip_size, zip_tail) != RawZipIndex._zip_fingerprint(zip_os_path):
+                raise ValueError('Raw zip index does not match the raw zip file')
+        except Exception:
+            self._mmap.close()
+            raise
+
+    @staticmethod
+    def _zip_fingerprint(zip_os_path: str) -> Tuple[int, bytes]:
+        with open(zip_os_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            tail = os.pread(f.fileno(), 32, max(size - 32, 0))
+        return size, tail.ljust(32, b'\0')
+
+    @staticmethod
+    def _key(path: bytes) -> Tuple[bytes, bytes]:
+        separator = path.rfind(b'/')
+        if separator < 0:
+            return b'', path
+        return path[:separator], path[separator + 1 :]
+
+    @classmethod
+    def write(cls, os_path: str, zip_os_path: str):
+        """Creates the index for the given raw zip file."""
+        directory_sizes: Dict[str, int] = {'': 0}
+        files: Dict[str, Tuple[int, int]] = {}
+        with zipfile.ZipFile(zip_os_path) as zf:
+            fd = zf.fp.fileno()
+            for info in zf.infolist():
+                path = info.filename
+                file_name = os.path.basename(path)
+                directory_path = os.path.dirname(path)
+                size = info.file_size if file_name else 0
+                directory_sizes[''] += size
+                if directory_path:
+                    # Ensure that all parent directories are added
+                    sub_path = ''
+                    for directory in directory_path.split(os.path.sep):
+                        sub_path = os.path.join(sub_path, directory)
+                        directory_sizes[sub_path] = (
+                            directory_sizes.get(sub_path, 0) + size
+                        )
+                if file_name:
+                    data_offset = _zip_member_data_offset(fd, info)
+                    files[path] = (size, data_offset or 0)
+
+        entries = [
+            (path.encode(), False, size, 0) for path, size in directory_sizes.items()
+        ]
+        entries.extend(
+            (path.encode(), True, size, data_offset)
+            for path, (size, data_offset) in files.items()
+        )
+        entries.sort(key=lambda entry: cls._key(entry[0]))
+
+        tmp_os_path = f'{os_path}.{utils.create_uuid()}.tmp'
+        with open(tmp_os_path, 'wb') as f:
+            f.write(
+                cls._header.pack(
+                    cls._magic,
+                    cls._version,
+                    0,
+                    len(entries),
+                    *cls._zip_fingerprint(zip_os_path),
+                )
+            )
+            path_offset = 0
+            for path, is_file, size, data_offset in entries:
+                f.write(
+                    cls._record.pack(path_offset, len(path), is_file, size, data_offset)
+                )
+                path_offset += len(path)
+            for path, *_ in entries:
+                f.write(path)
+        os.replace(tmp_os_path, os_path)
+
+    def close(self):
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _path(self, index: int) -> bytes:
+        path_offset, path_length = struct.unpack_from(
+            '<QI', self._mmap, self._header.size + index * self._record.size
+        )
+        start = self._paths_offset + path_offset
+        return self._mmap[start : start + path_length]
+
+    def _bisect(self, key: Tuple[bytes, bytes], right: bool = False) -> int:
+        low, high = 0, self._length
+        while low < high:
+            middle = (low + high) // 2
+            middle_key = self._key(self._path(middle))
+            if middle_key < key or (right and middle_key == key):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def path_info(self, index: int, access: str) -> RawPathInfo:
+        """Returns the path info of the record with the given index."""
+        _, _, is_file, size, _ = self._record.unpack_from(
+            self._mmap, self._header.size + index * self._record.size
+        )
+        return RawPathInfo(
+            path=self._path(index).decode(),
+            is_file=bool(is_file),
+            size=size,
+            access=access,
+        )
+
+    def data_offset(self, index: int) -> int:
+        """
+        Returns the offset of the data of a stored file in the raw zip file, or 0 for
+        directories and compressed files.
+        """
+        return self._record.unpack_from(
+            self._mmap, self._header.size + index * self._record.size
+        )[4]
+
+    def lookup(self, path: str) -> Optional[int]:
+        """Returns the index of the given path or None if it does not exist."""
+        key = self._key(path.encode())
+        index = self._bisect(key)
+        if index < self._length and self._key(self._path(index)) == key:
+            return index
+        return None
+
+    def children(self, path: str) -> range:
+        """Returns the range of indices with the content of the given directory."""
+        encoded_path = path.encode()
+        return range(
+            self._bisect((encoded_path, b''), right=True),
+            self._bisect((encoded_path + b'\0', b'')),
+        )
+
+
 class PublicUploadFiles(UploadFiles):
     def __init__(self, upload_id: str, create: bool = False):
         super().__init__(upload_id, create)
         self._directories: Dict[str, Dict[str, RawPathInfo]] = None
         self._raw_zip_file_object: PathObject = None
         self._raw_zip_file: zipfile.ZipFile = None
+        self._raw_zip_data_offsets: Dict[str, int] = {}
+        self._raw_zip_index: RawZipIndex = None
+        self._raw_zip_index_opened = False
         self._archive_hdf5_file_object: PathObject = None
         self._archive_hdf5_file: IO = None
         self._archive_msg_file_object: PathObject = None
@@ -1459,6 +2357,11 @@ class PublicUploadFiles(UploadFiles):
         if self._raw_zip_file is not None:
             self._raw_zip_file.close()
 
+        if self._raw_zip_index is not None:
+            self._raw_zip_index.close()
+            self._raw_zip_index = None
+            self._raw_zip_index_opened = False
+
         if self._archive_msg_file is not None:
             self._archive_msg_file.close()
 
@@ -1536,6 +2439,36 @@ class PublicUploadFiles(UploadFiles):
     ) -> PathObject:
         return target_dir.join_file(f'raw-{access}.plain.zip')
 
+    @staticmethod
+    def _create_raw_zip_index_file_object(
+        target_dir: DirectoryObject, access: str
+    ) -> PathObject:
+        return target_dir.join_file(f'raw-{access}.plain.zip.index')
+
+    def _open_raw_zip_index(self) -> Optional[RawZipIndex]:
+        """
+        Opens the index of the raw zip file. Returns None for uploads that were packed
+        without index or if the index does not match the raw zip file.
+        """
+        if self._raw_zip_index_opened:
+            return self._raw_zip_index
+
+        self._raw_zip_index_opened = True
+        try:
+            index_file_object = PublicUploadFiles._create_raw_zip_index_file_object(
+                self, self.access
+            )
+            if index_file_object.exists():
+                self._raw_zip_index = RawZipIndex(
+                    index_file_object.os_path, self.raw_zip_file_object().os_path
+                )
+        except (KeyError, OSError):
+            pass
+        except ValueError as e:
+            self.logger.warning('cannot use raw zip index', exc_info=e)
+
+        return self._raw_zip_index
+
     def raw_zip_file_object(self) -> PathObject:
         """
         Gets the raw zip file, either public or restricted, depending on which one is used.
@@ -1570,6 +2503,9 @@ class PublicUploadFiles(UploadFiles):
     def archive_hdf5_file(self, entry_id: str) -> IO:
         return self._open_archive_hdf5_file()
 
+    def archive_hdf5_file_object(self, entry_id: str) -> PathObject:
+        return PublicUploadFiles._create_archive_hdf5_file_object(self, self.access)
+
     @staticmethod
     def _create_archive_hdf5_file_object(
         target_dir: DirectoryObject, access: str, fallback: bool = False
@@ -1695,6 +2631,9 @@ class PublicUploadFiles(UploadFiles):
                 )
 
     def is_empty(self) -> bool:
+        raw_zip_index = self._open_raw_zip_index()
+        if raw_zip_index is not None:
+            return len(raw_zip_index) <= 1  # Only the root folder
         self._parse_content()
         return not self._directories.get('')
 
@@ -1705,9 +2644,18 @@ class PublicUploadFiles(UploadFiles):
             return (
                 not path  # We consider the empty path (i.e. root) to always "exists".
             )
-        self._parse_content()
         explicit_directory_path = path.endswith(os.path.sep)
         path = path.rstrip(os.path.sep)
+        raw_zip_index = self._open_raw_zip_index()
+        if raw_zip_index is not None:
+            index = raw_zip_index.lookup(path)
+            if index is None:
+                return False
+            return not (
+                explicit_directory_path
+                and raw_zip_index.path_info(index, self.access).is_file
+            )
+        self._parse_content()
         base_name = os.path.basename(path)
         directory_path = os.path.dirname(path)
         directory_content = self._directories.get(directory_path)
@@ -1724,11 +2672,18 @@ class PublicUploadFiles(UploadFiles):
     def raw_path_is_file(self, path: str) -> bool:
         if not is_safe_relative_path(path) or self.missing_raw_files:
             return False
-        self._parse_content()
         base_name = os.path.basename(path)
         directory_path = os.path.dirname(path)
         if not base_name:
             return False  # Requested path is an explicit directory path
+        raw_zip_index = self._open_raw_zip_index()
+        if raw_zip_index is not None:
+            index = raw_zip_index.lookup(path)
+            return (
+                index is not None
+                and raw_zip_index.path_info(index, self.access).is_file
+            )
+        self._parse_content()
         directory_content = self._directories.get(directory_path)
         if directory_content and base_name in directory_content:
             path_info = directory_content[base_name]
@@ -1747,13 +2702,23 @@ class PublicUploadFiles(UploadFiles):
             return
         if not path and self.missing_raw_files:
             return
-        self._parse_content()
         path = path.rstrip(os.path.sep)
-        directory_content = self._directories.get(path)
+        raw_zip_index = self._open_raw_zip_index()
+        if raw_zip_index is not None:
+            directory_content = self._raw_zip_index_directory_content(
+                raw_zip_index, path
+            )
+        else:
+            self._parse_content()
+            directory_content = self._directories.get(path)
+            if directory_content is not None:
+                if isinstance(directory_content, RawPathInfo):
+                    directory_content = {directory_content.path: directory_content}
+                directory_content = [
+                    path_info for __, path_info in sorted(directory_content.items())
+                ]
         if directory_content is not None:
-            if isinstance(directory_content, RawPathInfo):
-                directory_content = {directory_content.path: directory_content}
-            for __, path_info in sorted(directory_content.items()):
+            for path_info in directory_content:
                 if not files_only or path_info.is_file:
                     if not path_prefix or path_info.path.startswith(path_prefix):
                         yield path_info
@@ -1766,6 +2731,41 @@ class PublicUploadFiles(UploadFiles):
                         ):
                             yield sub_path_info
 
+    def _raw_zip_index_directory_content(
+        self, raw_zip_index: RawZipIndex, path: str
+    ) -> Optional[Iterable[RawPathInfo]]:
+        index = raw_zip_index.lookup(path)
+        if index is None:
+            return None
+        path_info = raw_zip_index.path_info(index, self.access)
+        if path_info.is_file:
+            return [path_info]
+        return (
+            raw_zip_index.path_info(child_index, self.access)
+            for child_index in raw_zip_index.children(path)
+        )
+
+    def raw_directory_page(
+        self, path: str, start: int, end: int
+    ) -> Tuple[List[RawPathInfo], int, int]:
+        raw_zip_index = None
+        if is_safe_relative_path(path) and not self.missing_raw_files:
+            raw_zip_index = self._open_raw_zip_index()
+        if raw_zip_index is not None:
+            path = path.rstrip(os.path.sep)
+            index = raw_zip_index.lookup(path)
+            if index is not None:
+                path_info = raw_zip_index.path_info(index, self.access)
+                if not path_info.is_file:
+                    children = raw_zip_index.children(path)
+                    page = [
+                        raw_zip_index.path_info(child_index, self.access)
+                        for child_index in children[start:end]
+                    ]
+                    return page, len(children), path_info.size
+
+        return super().raw_directory_page(path, start, end)
+
     def scandir(self, path: str = '', depth: int = -1):
         raise NotImplementedError()
 
@@ -1777,8 +2777,12 @@ class PublicUploadFiles(UploadFiles):
         mode = mode if mode else 'rb'
 
         try:
-            zf = self._open_raw_zip_file()
-            f = zf.open(file_path, 'r', **kwargs)
+            if kwargs:
+                f = self._open_raw_zip_file().open(file_path, 'r', **kwargs)
+            else:
+                f = self._open_stored_raw_file(
+                    file_path
+                ) or self._open_raw_zip_file().open(file_path, 'r')
             if 't' in mode:
                 return io.TextIOWrapper(f)
             else:
@@ -1792,8 +2796,57 @@ class PublicUploadFiles(UploadFiles):
 
         raise KeyError(file_path)
 
+    def _open_stored_raw_file(self, file_path: str) -> IO:
+        """
+        Opens the data of a stored (i.e. not compressed) raw zip member directly, or returns
+        None if the member is compressed or encrypted.
+        """
+        raw_zip_index = self._open_raw_zip_index()
+        if raw_zip_index is not None:
+            index = raw_zip_index.lookup(file_path)
+            if index is None:
+                raise KeyError(file_path)
+            path_info = raw_zip_index.path_info(index, self.access)
+            if not path_info.is_file:
+                raise IsADirectoryError(file_path)
+            offset = raw_zip_index.data_offset(index)
+            if not offset:
+                return None
+            return io.BufferedReader(
+                _FileRegion(
+                    self.raw_zip_file_object().os_path,
+                    offset,
+                    path_info.size,
+                    name=file_path,
+                )
+            )
+
+        zf = self._open_raw_zip_file()
+        info = zf.getinfo(file_path)
+        if info.is_dir():
+            raise IsADirectoryError(file_path)
+
+        offset = self._raw_zip_data_offsets.get(file_path)
+        if offset is None:
+            offset = _zip_member_data_offset(zf.fp.fileno(), info)
+            if offset is None:
+                return None
+            self._raw_zip_data_offsets[file_path] = offset
+
+        return io.BufferedReader(
+            _FileRegion(zf.filename, offset, info.file_size, name=file_path)
+        )
+
     def raw_file_size(self, file_path: str) -> int:
         assert is_safe_relative_path(file_path)
+        raw_zip_index = self._open_raw_zip_index()
+        if raw_zip_index is not None:
+            index = raw_zip_index.lookup(file_path)
+            if index is not None:
+                path_info = raw_zip_index.path_info(index, self.access)
+                if path_info.is_file:
+                    return path_info.size
+            raise KeyError(file_path)
         try:
             zf = self._open_raw_zip_file()
             info = zf.getinfo(file_path)
@@ -1847,6 +2900,16 @@ class PublicUploadFiles(UploadFiles):
             if raw_zip_file_object_new.exists():
                 raw_zip_file_object_new.delete()  # We have checked that the file is empty anyway
             os.rename(raw_zip_file_object.os_path, raw_zip_file_object_new.os_path)
+        raw_zip_index_file_object = PublicUploadFiles._create_raw_zip_index_file_object(
+            self, self.access
+        )
+        if raw_zip_index_file_object.exists():
+            os.rename(
+                raw_zip_index_file_object.os_path,
+                PublicUploadFiles._create_raw_zip_index_file_object(
+                    self, new_access
+                ).os_path,
+            )
         hdf5_file_object = PublicUploadFiles._create_archive_hdf5_file_object(
             self, self.access
         )
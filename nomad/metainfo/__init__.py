@@ -72,5 +72,7 @@ from .metainfo import (
     SectionProxy,
     derived,
     constraint,
+    get_column,
+    get_columns,
     units,
 )
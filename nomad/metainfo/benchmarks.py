@@ -16,7 +16,32 @@
 # limitations under the License.
 #
 
-from nomad.metainfo import MSection, Quantity
+import tracemalloc
+from io import BytesIO
+
+import numpy as np
+import pytest
+from elasticsearch import Elasticsearch
+
+from nomad import infrastructure
+from nomad.archive.storage_v2 import ArchiveReader, to_json, write_archive
+from nomad.config import config
+from nomad.datamodel import EntryArchive, EntryMetadata
+from nomad.datamodel.results import Material, Results
+from nomad.metainfo import (
+    MSection,
+    Quantity,
+    Reference,
+    SubSection,
+    get_column,
+    get_columns,
+)
+from nomad.metainfo.elasticsearch_extension import (
+    delete_indices,
+    index_entries_with_materials,
+    update_materials,
+)
+from nomad.metainfo.example import SCC, Run, System
 
 
 class Section(MSection):
@@ -93,3 +118,259 @@ def test_python_dct(benchmark):
 
 def test_python_prop(benchmark):
     benchmark(python_property)
+
+
+class Frame(MSection):
+    step = Quantity(type=int)
+    volume = Quantity(type=np.float64, unit='m**3')
+    temperature = Quantity(type=float, unit='K')
+    positions = Quantity(type=np.float64, shape=['*', 3], unit='m')
+    n_atoms = Quantity(
+        type=int, derived=lambda frame: len(frame.positions), cached=True
+    )
+
+
+frames = [
+    Frame(
+        step=step,
+        volume=1e-27,
+        temperature=300.0,
+        positions=np.zeros((100, 3)),
+    )
+    for step in range(1000)
+]
+
+
+def read_frames(quantity):
+    for frame in frames:
+        getattr(frame, quantity)
+
+
+def read_frames_magnitude(quantity):
+    quantity_def = Frame.m_def.all_quantities[quantity]
+    for frame in frames:
+        quantity_def.get_magnitude(frame)
+
+
+@pytest.mark.parametrize(
+    'quantity', ['step', 'volume', 'temperature', 'positions', 'n_atoms']
+)
+def test_read(benchmark, quantity):
+    benchmark(read_frames, quantity)
+
+
+@pytest.mark.parametrize('quantity', ['volume', 'temperature', 'positions'])
+def test_read_magnitude(benchmark, quantity):
+    benchmark(read_frames_magnitude, quantity)
+
+
+trajectory = dict(
+    step=np.arange(1000),
+    volume=np.full(1000, 1e-27),
+    temperature=np.full(1000, 300.0),
+    positions=np.zeros((1000, 100, 3)),
+)
+
+
+def create_frames():
+    return [
+        Frame(
+            step=int(trajectory['step'][index]),
+            volume=trajectory['volume'][index],
+            temperature=float(trajectory['temperature'][index]),
+            positions=trajectory['positions'][index],
+        )
+        for index in range(1000)
+    ]
+
+
+def create_frames_from_columns():
+    return Frame.m_from_columns(**trajectory)
+
+
+def test_create_frames(benchmark):
+    benchmark(create_frames)
+
+
+def test_create_frames_from_columns(benchmark):
+    benchmark(create_frames_from_columns)
+
+
+class Trajectory(MSection):
+    frames = SubSection(sub_section=Frame, repeats=True)
+
+
+def create_trajectory(columnar):
+    section = Trajectory()
+    section.m_create_many(Frame, columnar=columnar, **trajectory)
+    return section
+
+
+def traverse_trajectory(section):
+    for _ in section.m_traverse():
+        pass
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_create_trajectory(benchmark, columnar):
+    tracemalloc.start()
+    section = create_trajectory(columnar)
+    benchmark.extra_info['memory'] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del section
+
+    benchmark(create_trajectory, columnar)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_trajectory_to_dict(benchmark, columnar):
+    benchmark(lambda: create_trajectory(columnar).m_to_dict())
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_trajectory_traverse(benchmark, columnar):
+    benchmark(lambda: traverse_trajectory(create_trajectory(columnar)))
+
+
+class MolecularDynamics(MSection):
+    frames = SubSection(sub_section=Frame, repeats=True)
+    frames_ref = Quantity(type=Reference(Frame.m_def), shape=['*'])
+
+
+def create_frame_references():
+    section = MolecularDynamics()
+    section.frames_ref = section.m_create_many(Frame, **trajectory)
+    return MolecularDynamics.m_from_dict(section.m_to_dict()).frames_ref
+
+
+column_paths = ['step', 'volume', 'temperature', 'positions']
+
+
+def read_columns(frames_ref, method):
+    if method == 'resolved':
+        frames_ref = [frame_ref.m_proxy_resolve() for frame_ref in frames_ref]
+    if method == 'get_columns':
+        return get_columns(frames_ref, column_paths)
+    return {path: get_column(frames_ref, path) for path in column_paths}
+
+
+@pytest.mark.parametrize('method', ['resolved', 'get_column', 'get_columns'])
+def test_read_columns(benchmark, method):
+    expected = read_columns(create_frame_references(), 'resolved')
+    result = read_columns(create_frame_references(), method)
+    for path in column_paths:
+        assert np.array_equal(result[path][0], expected[path][0])
+        assert np.array_equal(result[path][1], expected[path][1])
+
+    benchmark.pedantic(
+        read_columns,
+        setup=lambda: ((create_frame_references(), method), {}),
+        rounds=10,
+    )
+
+
+@pytest.fixture(scope='module')
+def archive_file():
+    run = Run(code_name='code')
+    for _ in range(100):
+        system = run.m_create(
+            System, atom_labels=['H'] * 100, atom_positions=np.zeros((100, 3))
+        )
+        run.m_create(SCC, energy_total=1.0, system=system)
+
+    f = BytesIO()
+    write_archive(f, [('entry_id', run.m_to_dict())])
+    return f
+
+
+partial_access = dict(
+    root=lambda run: run.code_name,
+    reference=lambda run: run.sccs[-1].system.m_proxy_resolve().atom_labels,
+    full=lambda run: run.m_to_dict(),
+)
+
+
+def read_run(archive_file, lazy, access):
+    with ArchiveReader(BytesIO(archive_file.getbuffer())) as reader:
+        if lazy:
+            run = Run.m_from_dict(reader['entry_id'], lazy=True)
+        else:
+            run = Run.m_from_dict(to_json(reader['entry_id']))
+        partial_access[access](run)
+
+
+@pytest.mark.parametrize('access', list(partial_access))
+@pytest.mark.parametrize('lazy', [False, True])
+def test_read_archive(benchmark, archive_file, lazy, access):
+    benchmark(read_run, archive_file, lazy, access)
+
+
+def create_skewed_entries(n_entries=10000, n_materials=100):
+    """
+    Creates entries with materials that follow a Zipf-like distribution, i.e. the
+    first material has the most entries and the n-th material has 1/n of that.
+    """
+    weights = [1 / (index + 1) for index in range(n_materials)]
+    total = sum(weights)
+    entries = []
+    for index, weight in enumerate(weights):
+        material_id = f'material_{index}'
+        for _ in range(max(1, int(n_entries * weight / total))):
+            entries.append(
+                EntryArchive(
+                    metadata=EntryMetadata(entry_id=f'entry_{len(entries)}'),
+                    results=Results(
+                        material=Material(material_id=material_id, elements=['H', 'O'])
+                    ),
+                )
+            )
+    return entries
+
+
+def elastic_available() -> bool:
+    try:
+        return Elasticsearch(
+            hosts=['%s:%d' % (config.elastic.host, config.elastic.port)], timeout=1
+        ).ping()
+    except Exception:
+        return False
+
+
+@pytest.fixture(scope='module')
+def skewed_materials_index():
+    """
+    Indexes skewed entries into separate benchmark indices of the configured
+    elasticsearch. Skips if elasticsearch is not available.
+    """
+    if not elastic_available():
+        pytest.skip('Elasticsearch is not available')
+
+    entries_index, materials_index = (
+        config.elastic.entries_index,
+        config.elastic.materials_index,
+    )
+    config.elastic.entries_index = 'nomad_entries_v1_benchmark'
+    config.elastic.materials_index = 'nomad_materials_v1_benchmark'
+    try:
+        infrastructure.setup_elastic()
+        entries = create_skewed_entries()
+        index_entries_with_materials(entries, refresh=True)
+        yield entries
+        delete_indices()
+    finally:
+        config.elastic.entries_index = entries_index
+        config.elastic.materials_index = materials_index
+
+
+@pytest.mark.parametrize('material_id', ['material_0', 'material_99'])
+@pytest.mark.parametrize('delta', [False, True])
+def test_update_materials(
+    benchmark, monkeypatch, skewed_materials_index, delta, material_id
+):
+    monkeypatch.setattr('nomad.config.elastic.material_delta_updates', delta)
+    entry = next(
+        entry
+        for entry in skewed_materials_index
+        if entry.results.material.material_id == material_id
+    )
+    benchmark(update_materials, [entry])
@@ -168,6 +168,7 @@ from typing import (
     Tuple,
     Optional,
     DefaultDict,
+    Iterable,
 )
 from collections import defaultdict
 import numpy as np
@@ -1271,6 +1272,9 @@ def index_entries(entries: List, refresh: bool = False) -> Dict[str, str]:
 
 
 def update_materials(entries: List, refresh: bool = False):
+    if config.elastic.material_delta_updates:
+        return update_materials_delta(entries, refresh=refresh)
+
     # split into reasonably sized problems
     if len(entries) > config.elastic.bulk_size:
         for entries_part in [
@@ -1522,6 +1526,231 @@ def update_materials(entries: List, refresh: bool = False):
         material_index.refresh()
 
 
+_material_delta_update_script = """
+if (params.material != null) {
+    ctx._source.putAll(params.material);
+}
+List entries = ctx._source.entries;
+if (entries == null) {
+    entries = new ArrayList();
+}
+Map updated = new LinkedHashMap();
+for (entry in params.entries) {
+    updated.put(entry.entry_id, entry);
+}
+Set removed = new HashSet(params.removed_entry_ids);
+List result = new ArrayList();
+for (entry in entries) {
+    def entry_id = entry.entry_id;
+    if (removed.contains(entry_id)) {
+        continue;
+    }
+    if (updated.containsKey(entry_id)) {
+        result.add(updated.remove(entry_id));
+    } else {
+        result.add(entry);
+    }
+}
+result.addAll(updated.values());
+if (result.isEmpty()) {
+    ctx.op = 'delete';
+} else {
+    ctx._source.n_entries = result.size();
+    if (result.size() > params.cap) {
+        result = new ArrayList(result.subList(0, params.cap));
+    }
+    ctx._source.entries = result;
+}
+"""
+
+
+def create_material_delta_actions(
+    entries: List, moved_from_material_ids: Iterable[str] = None, logger=None
+) -> List[Dict[str, Any]]:
+    """
+    Creates the bulk actions (action and body pairs) that apply the changes of the
+    given entries to the materials index via scripted partial updates. Each affected
+    material gets exactly one scripted upsert. The script replaces or appends the
+    given material entry docs, removes entries that moved to other materials, and
+    deletes materials that run empty. The size of the actions only depends on the
+    given entries and not on the number of entries already stored in a material.
+
+    Arguments:
+        entries: The entries that have changed.
+        moved_from_material_ids: The ids of materials that currently contain at least
+            one of the given entries that now belongs to a different material
+            (or no material at all).
+    """
+    if logger is None:
+        logger = utils.get_logger('nomad.search')
+
+    entry_ids: List[str] = []
+    material_docs: Dict[str, Dict[str, Any]] = {}
+    material_entry_docs: Dict[str, List[Dict[str, Any]]] = {}
+    material_entry_ids: Dict[str, Set[str]] = {}
+    for entry in entries:
+        entry_ids.append(entry.entry_id)
+        try:
+            material = entry.results.material
+            material_id = material.material_id
+        except AttributeError:
+            continue
+        if material_id is None:
+            continue
+
+        material_entry_docs.setdefault(material_id, [])
+        material_entry_ids.setdefault(material_id, set()).add(entry.entry_id)
+        try:
+            material_docs.setdefault(material_id, {}).update(
+                **material_type.create_index_doc(material)
+            )
+        except Exception as e:
+            logger.error('could not create material index doc', exc_info=e)
+        try:
+            material_entry_docs[material_id].append(
+                material_entry_type.create_index_doc(entry)
+            )
+        except Exception as e:
+            logger.error('could not create material entry index doc', exc_info=e)
+
+    material_ids = list(material_entry_ids.keys())
+    if moved_from_material_ids is not None:
+        material_ids += [
+            material_id
+            for material_id in moved_from_material_ids
+            if material_id not in material_entry_ids
+        ]
+    moved_from_material_ids = set(moved_from_material_ids or [])
+
+    actions: List[Dict[str, Any]] = []
+    for material_id in material_ids:
+        own_entry_ids = material_entry_ids.get(material_id, set())
+        removed_entry_ids = []
+        if material_id in moved_from_material_ids:
+            removed_entry_ids = [
+                entry_id for entry_id in entry_ids if entry_id not in own_entry_ids
+            ]
+        material_doc = material_docs.get(material_id)
+        actions.append(dict(update=dict(_id=material_id, retry_on_conflict=3)))
+        actions.append(
+            dict(
+                scripted_upsert=True,
+                upsert={},
+                script=dict(
+                    source=_material_delta_update_script,
+                    lang='painless',
+                    params=dict(
+                        material=material_doc,
+                        entries=material_entry_docs.get(material_id, []),
+                        removed_entry_ids=removed_entry_ids,
+                        cap=config.elastic.entries_per_material_cap,
+                    ),
+                ),
+            )
+        )
+
+    return actions
+
+
+def update_materials_delta(entries: List, refresh: bool = False):
+    """
+    Updates the materials index for the given entries with scripted partial updates.
+    In contrast to :func:`update_materials`, the existing material documents are
+    never loaded. Only the ids of materials that lose entries to other materials are
+    searched for.
+    """
+    # split into reasonably sized problems
+    if len(entries) > config.elastic.bulk_size:
+        for entries_part in [
+            entries[i : i + config.elastic.bulk_size]
+            for i in range(0, len(entries), config.elastic.bulk_size)
+        ]:
+            update_materials_delta(entries_part, refresh=refresh)
+        return
+
+    if len(entries) == 0:
+        return
+
+    logger = utils.get_logger('nomad.search', n_entries=len(entries))
+
+    # Group the entry ids by their (new) material id. Entries without material are
+    # grouped under None.
+    entry_ids_by_material: Dict[Optional[str], List[str]] = {}
+    for entry in entries:
+        try:
+            material_id = entry.results.material.material_id
+        except AttributeError:
+            material_id = None
+        entry_ids_by_material.setdefault(material_id, []).append(entry.entry_id)
+
+    # Get the ids of materials that contain an entry that now belongs to a different
+    # material. Only ids are fetched, the material docs are never transferred.
+    with utils.timer(
+        logger, 'get old materials', lnr_event='failed to get old materials'
+    ):
+        moved_from_material_ids: Set[str] = set()
+        groups = list(entry_ids_by_material.items())
+        # The number of clauses is limited by the elasticsearch max clause count.
+        for i in range(0, len(groups), 500):
+            should = []
+            for material_id, entry_ids in groups[i : i + 500]:
+                clause: Dict[str, Any] = {
+                    'nested': {
+                        'path': 'entries',
+                        'query': {'terms': {'entries.entry_id': entry_ids}},
+                    }
+                }
+                if material_id is not None:
+                    clause = {
+                        'bool': {
+                            'must': clause,
+                            'must_not': {'term': {'material_id': material_id}},
+                        }
+                    }
+                should.append(clause)
+            elasticsearch_results = material_index.search(
+                body={
+                    'size': len(entries),
+                    '_source': False,
+                    'query': {'bool': {'should': should, 'minimum_should_match': 1}},
+                }
+            )
+            moved_from_material_ids.update(
+                hit['_id'] for hit in elasticsearch_results['hits']['hits']
+            )
+
+    actions = create_material_delta_actions(
+        entries, moved_from_material_ids=moved_from_material_ids, logger=logger
+    )
+
+    timer_kwargs: Dict[str, Any] = {}
+    try:
+        import json
+
+        timer_kwargs['size'] = len(json.dumps(actions))
+        timer_kwargs['n_actions'] = len(actions) // 2
+    except Exception:
+        pass
+
+    with utils.timer(
+        logger,
+        'perform bulk update of materials',
+        lnr_event='failed to bulk update materials',
+        **timer_kwargs,
+    ):
+        if actions:
+            material_index.bulk(
+                body=actions,
+                refresh=False,
+                timeout=f'{config.elastic.bulk_timeout}s',
+                request_timeout=config.elastic.bulk_timeout,
+            )
+
+    if refresh:
+        entry_index.refresh()
+        material_index.refresh()
+
+
 def get_searchable_quantity_value_field(
     annotation: Elasticsearch, aggregation: bool = False
 ):
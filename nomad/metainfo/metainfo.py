@@ -39,6 +39,7 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    Sequence,
     Generator,
     cast,
     ClassVar,
@@ -59,7 +60,11 @@ from nomad.metainfo.util import (
     MQuantity,
     MRegEx,
     MSubSectionList,
+    MColumnarSubSectionList,
+    MLazySubSection,
+    MLazySubSectionList,
     MTypes,
+    _not_materialized,
     ReferenceURL,
     SectionAnnotation,
     _delta_symbols,
@@ -68,6 +73,7 @@ from nomad.metainfo.util import (
     convert_to,
     default_hash,
     dict_to_named_list,
+    normalize_column,
     normalize_complex,
     normalize_datetime,
     resolve_variadic_name,
@@ -96,6 +102,12 @@ _unset_value = '__UNSET__'
 _HASH_OBJ = Type['hashlib._Hash']  # type: ignore
 
 
+def _to_json(value: Any) -> Any:
+    # lazy dicts and lists of archive readers
+    to_json = getattr(value, 'to_json', None)
+    return value if to_json is None else to_json()
+
+
 def _check_definition_id(target_id, tgt_section: MSectionBound) -> MSectionBound:
     """
     Ensure section definition id matches the target id.
@@ -1757,6 +1769,13 @@ class MSection(
 
         return self.__dict__[quantity_def.name]
 
+    def m_get_magnitude(self, quantity_def: Quantity) -> Any:
+        """
+        Retrieve the value for the given quantity without unit. See
+        :func:`Quantity.get_magnitude`.
+        """
+        return quantity_def.get_magnitude(self)
+
     def m_get_quantity_definition(self, quantity_name: str, hint: Optional[str] = None):
         """
         Get the definition of the quantity with the target name.
@@ -1785,6 +1804,16 @@ class MSection(
             self.__dict__[sub_section_def.name] = sub_section_lst
         return sub_section_lst
 
+    def _get_sub_section(self, sub_section_def: SubSection) -> Optional[MSection]:
+        sub_section = self.__dict__.get(sub_section_def.name)
+        if sub_section.__class__ is MLazySubSection:
+            sub_section = sub_section.create()
+            sub_section.m_parent = self
+            sub_section.m_parent_sub_section = sub_section_def
+            sub_section.m_parent_index = -1
+            self.__dict__[sub_section_def.name] = sub_section
+        return sub_section
+
     def _on_add_sub_section(
         self, sub_section_def: SubSection, sub_section: MSection, parent_index: int
     ) -> None:
@@ -1818,7 +1847,7 @@ class MSection(
 
             sub_section_lst = self._get_sub_sections(sub_section_def)
             sub_section_lst.append(sub_section)
-            if sub_section_lst.__class__ != MSubSectionList:
+            if not isinstance(sub_section_lst, MSubSectionList):
                 self._on_add_sub_section(
                     sub_section_def, sub_section, len(sub_section_lst) - 1
                 )
@@ -1830,7 +1859,9 @@ class MSection(
             self.__dict__[sub_section_name] = sub_section
             if sub_section is not None:
                 self._on_add_sub_section(sub_section_def, sub_section, -1)
-            if old_sub_section is not None:
+            if old_sub_section is not None and not isinstance(
+                old_sub_section, MLazySubSection
+            ):
                 self._on_remove_sub_section(sub_section_def, old_sub_section)
 
     def m_remove_sub_section(self, sub_section_def: SubSection, index: int) -> None:
@@ -1846,6 +1877,8 @@ class MSection(
         else:
             sub_section = self.__dict__[sub_section_def.name]
             del self.__dict__[sub_section_def.name]
+            if isinstance(sub_section, MLazySubSection):
+                return
 
         self._on_remove_sub_section(sub_section_def, sub_section)
 
@@ -1854,7 +1887,7 @@ class MSection(
     ) -> Optional[MSection]:
         """Retrieves a single subsection of the given subsection definition."""
         if not sub_section_def.repeats:
-            return self.__dict__.get(sub_section_def.name, None)
+            return self._get_sub_section(sub_section_def)
 
         if isinstance(index, int):
             return self.__dict__[sub_section_def.name][index]
@@ -1882,11 +1915,11 @@ class MSection(
         if sub_section_def.repeats:
             return self._get_sub_sections(sub_section_def)
 
-        try:
-            return [self.__dict__[sub_section_def.name]]
-        except KeyError:
+        if sub_section_def.name not in self.__dict__:
             return []
 
+        return [self._get_sub_section(sub_section_def)]
+
     def m_sub_section_count(self, sub_section_def: SubSection) -> int:
         """Returns the number of subsections for the given subsection definition."""
         try:
@@ -2039,6 +2072,62 @@ class MSection(
                 this must be used to explicitly state the subsection definition.
         """
 
+        sub_section_def = self.__resolve_sub_section_def(section_cls, sub_section_def)
+        sub_section = section_cls(**kwargs)
+        self.m_add_sub_section(sub_section_def, sub_section)
+
+        return cast(MSectionBound, sub_section)
+
+    def m_create_many(
+        self,
+        section_cls: Type[MSectionBound],
+        sub_section_def: SubSection = None,
+        columnar: bool = False,
+        **columns,
+    ) -> List[MSectionBound]:
+        """Creates many section instances from columnar values and adds them to this
+        section provided there is a corresponding repeating subsection. See
+        :func:`m_from_columns`.
+
+        Args:
+            section_cls: The section class for the subsections to create
+            sub_section_def: If there are multiple subsections for the given class,
+                this must be used to explicitly state the subsection definition.
+            columnar: Keep the given columns as the storage of the subsections and
+                only create the section instances when they are accessed.
+                This requires that there are no subsections yet, that all columns
+                can be normalized as a whole, and that there are no event handlers
+                for adding subsections or setting values. Otherwise, all section
+                instances are created right away.
+        """
+        sub_section_def = self.__resolve_sub_section_def(section_cls, sub_section_def)
+        if not sub_section_def.repeats:
+            raise MetainfoError(
+                f'The subsection {sub_section_def} does not repeat, '
+                'cannot add many sections.'
+            )
+
+        if columnar and self.m_sub_section_count(sub_section_def) == 0:
+            n_sections, columns_and_defs = section_cls._m_normalize_columns(columns)
+            if all(normalized for _, _, normalized in columns_and_defs) and not any(
+                handler.__name__.startswith('on_add_sub_section')
+                for handler in self.m_def.event_handlers
+            ):
+                self.m_mod_count += 1
+                sub_sections = MColumnarSubSectionList(
+                    self, sub_section_def, section_cls, columns_and_defs, n_sections
+                )
+                self.__dict__[sub_section_def.name] = sub_sections
+                return sub_sections
+
+        sub_sections = section_cls.m_from_columns(**columns)
+        self._get_sub_sections(sub_section_def).extend(sub_sections)
+
+        return sub_sections
+
+    def __resolve_sub_section_def(
+        self, section_cls: Type[MSection], sub_section_def: Optional[SubSection]
+    ) -> SubSection:
         section_def = section_cls.m_def
         sub_section_defs = self.m_def.all_sub_sections_by_section.get(section_def, [])
         n_sub_section_defs = len(sub_section_defs)
@@ -2062,10 +2151,82 @@ class MSection(
         if sub_section_def is None:
             sub_section_def = sub_section_defs[0]
 
-        sub_section = section_cls(**kwargs)
-        self.m_add_sub_section(sub_section_def, sub_section)
+        return sub_section_def
 
-        return cast(MSectionBound, sub_section)
+    @classmethod
+    def m_from_columns(cls: Type[MSectionBound], **columns) -> List[MSectionBound]:
+        """Creates many instances of this section class from columnar values.
+
+        Each keyword argument gives the values of one quantity for all sections as
+        a list or array with the section index as its first dimension, e.g. the
+        positions of all frames of a trajectory as one array with shape
+        ``(n_frames, n_atoms, 3)``. Values are converted and validated once per
+        column instead of once per section. Arrays are not copied, the sections
+        hold views into the given (or converted) column arrays. ``None`` values
+        leave the quantity unset for the respective section. Columns that cannot be
+        handled as a whole fall back to :func:`m_set` for each section.
+        """
+        n_sections, columns_and_defs = cls._m_normalize_columns(columns)
+
+        return [
+            cls._m_from_column_values(columns_and_defs, index)
+            for index in range(n_sections)
+        ]
+
+    @classmethod
+    def _m_normalize_columns(
+        cls, columns: Dict[str, Any]
+    ) -> Tuple[int, List[Tuple[Quantity, Sequence, bool]]]:
+        m_def = cls.m_def
+        n_sections = None
+        columns_and_defs = []
+        for name, column in columns.items():
+            quantity_def = m_def.all_aliases.get(name, None)
+            if not isinstance(quantity_def, Quantity):
+                raise KeyError(f'{name} is not a quantity of section {m_def}')
+            if quantity_def.derived is not None:
+                raise MetainfoError(
+                    f'The quantity {quantity_def} is derived and cannot be set.'
+                )
+
+            values, normalized = normalize_column(quantity_def, column)
+            if n_sections is None:
+                n_sections = len(values)
+            elif len(values) != n_sections:
+                raise MetainfoError(
+                    f'The column for {quantity_def} has {len(values)} values, '
+                    f'but {n_sections} were expected.'
+                )
+            columns_and_defs.append((quantity_def, values, normalized))
+
+        # event handlers need to see every value being set
+        if any(
+            handler.__name__.startswith('on_set') for handler in m_def.event_handlers
+        ):
+            columns_and_defs = [
+                (quantity_def, values, False)
+                for quantity_def, values, _ in columns_and_defs
+            ]
+
+        return n_sections or 0, columns_and_defs
+
+    @classmethod
+    def _m_from_column_values(
+        cls: Type[MSectionBound],
+        columns_and_defs: List[Tuple[Quantity, Sequence, bool]],
+        index: int,
+    ) -> MSectionBound:
+        section = cls()
+        section.m_mod_count += 1
+        section_dict = section.__dict__
+        for quantity_def, values, normalized in columns_and_defs:
+            value = values[index]
+            if not normalized:
+                section.m_set(quantity_def, value)
+            elif value is not None:
+                section_dict[quantity_def.name] = value
+
+        return section
 
     def m_update(self, m_ignore_additional_keys: bool = False, **kwargs):
         """Updates all quantities and subsections with the given arguments."""
@@ -2589,6 +2750,9 @@ class MSection(
                     if self.m_sub_section_count(sub_section_def) > 0:
                         is_set = True
                         subsections = self.m_get_sub_sections(sub_section_def)
+                        if isinstance(subsections, MLazySubSectionList):
+                            # do not keep the subsections created for serialization
+                            subsections = subsections.views()
                         if subsection_as_dict:
                             subsection_keys: list = [
                                 item.m_key
@@ -2667,10 +2831,15 @@ class MSection(
 
         return quantity_value
 
-    def m_update_from_dict(self, dct: Dict[str, Any]) -> None:
+    def m_update_from_dict(self, dct: Dict[str, Any], lazy: bool = False) -> None:
         """
         Updates this section with the serialized data from the given dict, e.g. data
         produced by :func:`m_to_dict`.
+
+        With ``lazy``, subsections are only deserialized when they are accessed. The
+        given data can then also be a lazy dict-like from an archive reader
+        (e.g. :class:`nomad.archive.storage_v2.ArchiveDict`). It is only read on
+        access and has to remain readable for the lifetime of this section.
         """
         section_def = self.m_def
         section = self
@@ -2680,10 +2849,17 @@ class MSection(
             definition_def = section_def.all_aliases['definitions']
             definition_cls = definition_def.sub_section.section_cls
             definition_section = definition_cls.m_from_dict(
-                dct['definitions'], m_parent=self, m_context=m_context
+                _to_json(dct['definitions']) if lazy else dct['definitions'],
+                m_parent=self,
+                m_context=m_context,
             )
             section.m_add_sub_section(definition_def, definition_section)
 
+        lazy = lazy and not any(
+            handler.__name__.startswith('on_add_sub_section')
+            for handler in section_def.event_handlers
+        )
+
         for name, property_def in section_def.all_aliases.items():
             if name not in dct or name == 'definitions':
                 continue
@@ -2692,7 +2868,14 @@ class MSection(
                 sub_section_def = property_def
                 sub_section_value = dct.get(name)
                 sub_section_cls = sub_section_def.sub_section.section_cls
-                if sub_section_def.repeats:
+                if lazy and (
+                    not sub_section_def.repeats
+                    or self.m_sub_section_count(sub_section_def) == 0
+                ):
+                    self.__add_lazy_sub_section(
+                        sub_section_def, sub_section_value, m_context
+                    )
+                elif sub_section_def.repeats:
                     for sub_section_dct in (
                         sub_section_value
                         if isinstance(sub_section_value, list)
@@ -2712,7 +2895,7 @@ class MSection(
 
             if isinstance(property_def, Quantity):
                 quantity_def = property_def
-                quantity_value = dct[name]
+                quantity_value = _to_json(dct[name]) if lazy else dct[name]
 
                 if quantity_def.virtual:
                     # We silently ignore this, similar to how we ignore additional values.
@@ -2748,9 +2931,37 @@ class MSection(
                     )
 
         if 'm_attributes' in dct:
-            for attr_key, attr_value in dct['m_attributes'].items():
+            m_attributes = (
+                _to_json(dct['m_attributes']) if lazy else dct['m_attributes']
+            )
+            for attr_key, attr_value in m_attributes.items():
                 section.m_set_section_attribute(attr_key, attr_value)
 
+    def __add_lazy_sub_section(
+        self, sub_section_def: SubSection, value: Any, m_context: Context
+    ) -> None:
+        sub_section_cls = sub_section_def.sub_section.section_cls
+
+        def create(sub_section_value):
+            if sub_section_value is None:
+                return None
+            return sub_section_cls.m_from_dict(
+                sub_section_value, m_parent=self, m_context=m_context, lazy=True
+            )
+
+        self.m_mod_count += 1
+        if not sub_section_def.repeats:
+            self.__dict__[sub_section_def.name] = MLazySubSection(lambda: create(value))
+            return
+
+        # repeating subsections might be serialized as dict by key
+        values = value
+        if not isinstance(value, list) and hasattr(value, 'values'):
+            values = list(value.values())
+        self.__dict__[sub_section_def.name] = MLazySubSectionList(
+            self, sub_section_def, lambda index: create(values[index]), len(values)
+        )
+
     @classmethod
     def m_from_dict(
         cls: Type[MSectionBound], data: Dict[str, Any], **kwargs
@@ -2769,6 +2980,7 @@ class MSection(
         cls: Type[MSectionBound] = None,
         m_parent: MSection = None,
         m_context: 'Context' = None,
+        lazy: bool = False,
         **kwargs,
     ) -> MSectionBound:
         """Creates a section from the given serializable data dictionary.
@@ -2776,7 +2988,8 @@ class MSection(
         This is the 'opposite' of :func:`m_to_dict`. It is similar to the classmethod
         `m_from_dict`, but does not require a specific class. You can provide a class
         through the optional parameter. Otherwise, the section definition is read from
-        the `m_def` key in the section data.
+        the `m_def` key in the section data. With `lazy`, subsections are only
+        deserialized when they are accessed, see :func:`m_update_from_dict`.
         """
         if 'm_ref_archives' in dct and isinstance(m_context, Context):
             # dct['m_ref_archives'] guarantees that 'm_def' exists
@@ -2784,10 +2997,11 @@ class MSection(
                 m_context.cache_archive(
                     entry_url,
                     MSection.from_dict(
-                        archive_json, m_parent=m_parent, m_context=m_context
+                        archive_json, m_parent=m_parent, m_context=m_context, lazy=lazy
                     ),
                 )
-            del dct['m_ref_archives']
+            if isinstance(dct, dict):
+                del dct['m_ref_archives']
 
         # first try to find a m_def in the data
         if 'm_def' in dct:
@@ -2831,7 +3045,9 @@ class MSection(
         section.m_parent = m_parent
 
         if 'm_annotations' in dct:
-            m_annotations = dct['m_annotations']
+            m_annotations = (
+                _to_json(dct['m_annotations']) if lazy else dct['m_annotations']
+            )
             if not isinstance(m_annotations, dict):
                 raise MetainfoError(
                     f'The provided m_annotations is of a wrong type. {type(m_annotations).__name__} was provided.'
@@ -2839,7 +3055,10 @@ class MSection(
             section.m_annotations.update(m_annotations)
             section.m_parse_annotations()
 
-        section.m_update_from_dict(dct)
+        if lazy:
+            section.m_update_from_dict(dct, lazy=True)
+        else:
+            section.m_update_from_dict(dct)
         return section
 
     def m_to_json(self, **kwargs):
@@ -3239,6 +3458,7 @@ class MSection(
                     copy.__dict__[sub_section_def.name] = sub_sections_copy
                 else:
                     if len(sub_sections_copy) == 1:
+                        sub_sections_copy[0].m_parent_index = -1
                         copy.__dict__[sub_section_def.name] = sub_sections_copy[0]
                     else:
                         copy.__dict__[sub_section_def.name] = None
@@ -3824,20 +4044,79 @@ class Quantity(Property):
         if self.derived is not None:
             self.virtual = True  # type: ignore
 
-        # replace the quantity implementation with an optimized version for the most
-        # primitive quantities if applicable
-        is_primitive = not self.derived and not self.use_full_storage
-        is_primitive = is_primitive and len(self.shape) <= 1
-        is_primitive = is_primitive and self.type in [str, bool, float, int]
-        is_primitive = is_primitive and self.type not in MTypes.num_numpy
-        if is_primitive:
-            self._default = self.default
-            self._name = self.name
+        self._specialize()
+
+        check_dimensionality(self, self.unit)
+
+    def _specialize(self):
+        """
+        Replaces the quantity implementation with an optimized version that only
+        implements what is necessary for this definition (e.g. primitive, plain, unit,
+        derived, full storage). This is re-done whenever the definition changes.
+        Quantity subclasses with custom implementations are not replaced.
+        """
+        if self.__class__ not in _specializable_quantity_classes:
+            return
+
+        self._name = self.name
+        self._default = self.default
+        self._unit = (
+            self.unit if self.unit is not None and self.type in MTypes.num else None
+        )
+        self._derived = self.derived
+        self._cached = self.cached
+        self._cache_key = self.name + '_cached' if self.name else None
+
+        if self._derived is not None:
+            self.__class__ = DerivedQuantity
+        elif (
+            isinstance(self.type, DataType)
+            and self.type.get_normalize != DataType.get_normalize
+        ):
+            self.__class__ = Quantity
+        elif self.use_full_storage:
+            self.__class__ = FullStorageQuantity
+        elif (
+            len(self.shape) <= 1
+            and self.type in [str, bool, float, int]
+            and self.type not in MTypes.num_numpy
+        ):
             self._type = self.type
             self._list = len(self.shape) == 1
             self.__class__ = PrimitiveQuantity
+        elif self._unit is not None:
+            self.__class__ = UnitQuantity
+        else:
+            self.__class__ = PlainQuantity
 
-        check_dimensionality(self, self.unit)
+        self._specialized = True
+
+    def m_set(self, quantity_def: Quantity, value: Any) -> None:
+        super().m_set(quantity_def, value)
+        if self.__dict__.get('_specialized', False):
+            self._specialize()
+
+    def _on_add_sub_section(
+        self, sub_section_def: SubSection, sub_section: MSection, parent_index: int
+    ) -> None:
+        super()._on_add_sub_section(sub_section_def, sub_section, parent_index)
+        if self.__dict__.get('_specialized', False):
+            self._specialize()
+
+    def get_magnitude(self, section: MSection) -> Any:
+        """
+        Returns the value of this quantity in the given section without wrapping it
+        into a pint quantity. Values of quantities with units are given in the unit of
+        this quantity. Depending on the quantity implementation, this might return the
+        stored value itself. It must not be modified. This is meant for hot loops that
+        read many values.
+        """
+        value = self.__get__(section, Quantity)
+        if isinstance(value, pint.Quantity):
+            if self.unit is not None:
+                return value.to(self.unit).magnitude
+            return value.magnitude
+        return value
 
     def __get__(self, obj, cls):
         try:
@@ -4014,6 +4293,174 @@ def derived(**kwargs):
     return decorator
 
 
+def get_column(
+    sections: Iterable[MSection],
+    path: str,
+    dtype: Any = np.float64,
+    fill_value: Any = np.nan,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the values of a quantity for many sections as one numpy array with the
+    section index as first dimension. The path points to the quantity relative to the
+    sections, e.g. ``energy.total.value``, and may only contain not repeating
+    subsections. Values are given without units in the unit of the quantity.
+
+    Returns the array of values and a boolean mask of the sections that have a value.
+    Values of sections without a value are filled with ``fill_value``.
+
+    This is meant to read a quantity from many sections, e.g. all steps of a
+    trajectory. Values are not wrapped into pint quantities. Columns of subsections
+    that were created with :func:`MSection.m_create_many` are used as they are.
+    Use :func:`get_columns` to read multiple quantities from the same sections.
+    """
+    return get_columns(sections, [path], dtype, fill_value)[path]
+
+
+def get_columns(
+    sections: Iterable[MSection],
+    paths: Iterable[str],
+    dtype: Any = np.float64,
+    fill_value: Any = np.nan,
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Returns the values of multiple quantities for many sections like
+    :func:`get_column` as a dictionary with the quantity paths as keys.
+
+    The sections may be references (proxies). References to repeating subsections
+    within the same archive, e.g. ``#/run/0/calculation/1``, are not resolved one by
+    one. Their list of subsections is looked up once, and values of subsections that
+    were not created yet are read from the columns of the list.
+    """
+    paths = list(paths)
+    definitions: Dict[Tuple[Section, str], List[Property]] = {}
+    sub_section_lists: Dict[Tuple[int, str], Optional[MSubSectionList]] = {}
+
+    def locate(proxy: MProxy) -> Optional[Tuple[MSubSectionList, int]]:
+        value = proxy.m_proxy_value
+        if (
+            proxy.m_proxy_resolved is not None
+            or type(proxy.m_proxy_type) is not Reference
+            or proxy.m_proxy_section is None
+            or not isinstance(value, str)
+            or '@' in value
+            or not (
+                value.startswith('#/') or (value.startswith('/') and '#' not in value)
+            )
+        ):
+            return None
+
+        list_path, _, index = value.lstrip('#').rpartition('/')
+        if not index.isdigit():
+            return None
+
+        root = proxy.m_proxy_section.m_root()
+        key = (id(root), list_path)
+        if key not in sub_section_lists:
+            try:
+                sub_sections = root.m_resolve(list_path)
+            except MetainfoReferenceError:
+                sub_sections = None
+            if not isinstance(sub_sections, MSubSectionList):
+                sub_sections = None
+            sub_section_lists[key] = sub_sections
+
+        sub_sections = sub_section_lists[key]
+        if sub_sections is None or int(index) >= len(sub_sections):
+            return None
+        return sub_sections, int(index)
+
+    def resolve_path(section_def: Section, path: str) -> List[Property]:
+        try:
+            return definitions[(section_def, path)]
+        except KeyError:
+            pass
+
+        path_defs: List[Property] = []
+        names = path.split('.')
+        for index, name in enumerate(names):
+            definition = (
+                path_defs[-1].sub_section if path_defs else section_def
+            ).all_properties.get(name)
+            is_last = index == len(names) - 1
+            if not isinstance(definition, Quantity if is_last else SubSection):
+                raise KeyError(f'{path} is not a quantity path of {section_def}')
+            if not is_last and definition.repeats:
+                raise MetainfoError(f'{name} in {path} is a repeating subsection')
+            path_defs.append(definition)
+
+        definitions[(section_def, path)] = path_defs
+        return path_defs
+
+    def get_value(section, path):
+        path_defs = resolve_path(section.m_def, path)
+        for sub_section_def in path_defs[:-1]:
+            if sub_section_def.name not in section.__dict__:
+                return None
+            section = section._get_sub_section(sub_section_def)
+            if section is None:
+                return None
+
+        return path_defs[-1].get_magnitude(section)
+
+    result: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    if isinstance(sections, MColumnarSubSectionList):
+        for path in paths:
+            values, normalized = sections.columns.get(path, (None, False))
+            if not normalized or not isinstance(values, np.ndarray):
+                continue
+            column = np.full((len(sections),) + values.shape[1:], fill_value, dtype)
+            column[: len(values)] = values[: len(sections)]
+            mask = np.ones(len(sections), dtype=bool)
+            for index, section in enumerate(list.__iter__(sections)):
+                if section is _not_materialized:
+                    continue
+                value = get_value(section, path)
+                mask[index] = value is not None
+                column[index] = fill_value if value is None else value
+            result[path] = column, mask
+
+    def get_located_value(sub_sections: MSubSectionList, index: int, path: str):
+        section = list.__getitem__(sub_sections, index)
+        if section is _not_materialized:
+            if isinstance(sub_sections, MColumnarSubSectionList):
+                values, normalized = sub_sections.columns.get(path, (None, False))
+                if normalized and isinstance(values, np.ndarray):
+                    return values[index]
+            section = sub_sections[index]
+        return get_value(section, path)
+
+    remaining = [path for path in paths if path not in result]
+    if remaining:
+        locations: List[Tuple[Any, Optional[int]]] = []
+        for section in sections:
+            location = locate(section) if isinstance(section, MProxy) else None
+            if location is None:
+                if isinstance(section, MProxy):
+                    section = section.m_proxy_resolve()
+                location = section, None
+            locations.append(location)
+
+        for path in remaining:
+            values = [
+                get_value(section, path)
+                if index is None
+                else get_located_value(section, index, path)
+                for section, index in locations
+            ]
+            mask = np.fromiter(
+                (value is not None for value in values), bool, len(values)
+            )
+            present = [value for value in values if value is not None]
+            shape = np.shape(present[0]) if present else ()
+            column = np.full((len(values),) + shape, fill_value, dtype)
+            if present:
+                column[mask] = present
+            result[path] = column, mask
+
+    return result
+
+
 class DirectQuantity(Quantity):
     """Used for quantities that would cause indefinite loops due to bootstrapping."""
 
@@ -4043,8 +4490,103 @@ class DirectQuantity(Quantity):
         obj.m_mod_count += 1
         obj.__dict__[self._name] = value
 
+        # the implementation of (already initialized) quantity definitions depends on
+        # their attributes
+        if obj.__dict__.get('_specialized', False):
+            obj._specialize()
+
+
+class PlainQuantity(Quantity):
+    """
+    An optimized replacement for Quantity suitable for quantities with values that
+    are returned as they are stored, i.e. without unit and type specific normalization.
+    """
+
+    def __get__(self, obj, cls):
+        try:
+            return obj.__dict__[self._name]
+        except KeyError:
+            value = self._default
+        except AttributeError:
+            return self
+        if isinstance(value, (dict, list)):
+            return value.copy()
+        return value
+
+    def get_magnitude(self, section: MSection) -> Any:
+        try:
+            return section.__dict__[self._name]
+        except KeyError:
+            return self._default
 
-class PrimitiveQuantity(Quantity):
+
+class UnitQuantity(PlainQuantity):
+    """
+    An optimized replacement for Quantity suitable for numerical quantities with units.
+    Values are wrapped into pint quantities with the pre-resolved unit.
+    """
+
+    def __get__(self, obj, cls):
+        try:
+            value = obj.__dict__[self._name]
+        except KeyError:
+            value = self._default
+        except AttributeError:
+            return self
+        if value is None:
+            return None
+        # same as value * unit, i.e. arrays are copied and numpy scalars promoted,
+        # but without pint's arithmetic overhead
+        return units.Quantity(1 * value, self._unit)
+
+
+class DerivedQuantity(Quantity):
+    """An optimized replacement for Quantity suitable for derived quantities."""
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        try:
+            if self._cached:
+                cached = obj.__dict__.setdefault(self._cache_key, [-1, None])
+                if cached[0] != obj.m_mod_count:
+                    cached[0] = obj.m_mod_count
+                    cached[1] = self._derived(obj)
+                return cached[1]
+
+            return self._derived(obj)
+        except Exception as e:
+            raise DeriveError(f'Could not derive value for {self}: {str(e)}')
+
+
+class FullStorageQuantity(Quantity):
+    """
+    An optimized replacement for Quantity suitable for quantities that use the full
+    storage, i.e. that store their values wrapped in :class:`MQuantity`.
+    """
+
+    def __get__(self, obj, cls):
+        try:
+            value = obj.__dict__[self._name]
+        except KeyError:
+            value = self._default
+            if isinstance(value, (dict, list)):
+                return value.copy()
+        except AttributeError:
+            return self
+        else:
+            if isinstance(value, dict) and self._name in value:
+                m_quantity = value[self._name]
+                if m_quantity.unit:
+                    return units.Quantity(m_quantity.value, m_quantity.unit)
+                return m_quantity.value
+
+        if value is not None and self._unit is not None:
+            return value * self._unit
+        return value
+
+
+class PrimitiveQuantity(PlainQuantity):
     """An optimized replacement for Quantity suitable for primitive properties."""
 
     def __get__(self, obj, cls):
@@ -4054,8 +4596,8 @@ class PrimitiveQuantity(Quantity):
             value = self._default
         except AttributeError:
             return self
-        if value is not None and self.unit is not None and self.type in MTypes.num:
-            return value * self.unit  # type: ignore
+        if value is not None and self._unit is not None:
+            return units.Quantity(value, self._unit)
         return value
 
     def __set__(self, obj, value):
@@ -4111,6 +4653,16 @@ class PrimitiveQuantity(Quantity):
             )
 
 
+_specializable_quantity_classes = (
+    Quantity,
+    PlainQuantity,
+    UnitQuantity,
+    DerivedQuantity,
+    FullStorageQuantity,
+    PrimitiveQuantity,
+)
+
+
 class SubSection(Property):
     """
     Like quantities, subsections are defined in a `section class` as attributes
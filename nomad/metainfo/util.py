@@ -23,8 +23,8 @@ import re
 from dataclasses import dataclass
 from datetime import date, datetime
 from difflib import SequenceMatcher
-from functools import reduce
-from typing import Any, Dict, Optional, Sequence, Tuple, Union
+from functools import partial, reduce
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 from urllib.parse import SplitResult, urlsplit, urlunsplit
 
 import aniso8601
@@ -460,6 +460,164 @@ class MSubSectionList(list):
             self.section._on_remove_sub_section(self.sub_section_def, old_value)
 
 
+_not_materialized = object()
+
+
+class MLazySubSectionList(MSubSectionList):
+    """
+    A list of repeating subsections that only creates the subsection instances when
+    they are accessed. The given ``create`` function creates the subsection for an
+    index. Once created, subsections are kept and behave like any other subsection.
+    Subsections can still be appended as usual.
+
+    Removing subsections creates all remaining subsection instances first, because
+    the source of the subsections cannot follow the changed indices.
+    """
+
+    def __init__(
+        self, section, sub_section_def, create: Callable[[int], Any], length: int
+    ):
+        super().__init__(section, sub_section_def)
+        self.create = create
+        list.extend(self, [_not_materialized] * length)
+
+    def _create(self, index: int):
+        sub_section = self.create(index)
+        if sub_section is not None:
+            sub_section.m_parent = self.section
+            sub_section.m_parent_sub_section = self.sub_section_def
+            sub_section.m_parent_index = index
+        return sub_section
+
+    def _materialize(self, index: int):
+        sub_section = list.__getitem__(self, index)
+        if sub_section is _not_materialized:
+            if index < 0:
+                index += len(self)
+            sub_section = self._create(index)
+            list.__setitem__(self, index, sub_section)
+        return sub_section
+
+    def _materialize_all(self):
+        for index in range(len(self)):
+            self._materialize(index)
+        self.create = None
+
+    def views(self) -> '_SubSectionViews':
+        """
+        Returns an iterable over all subsections that does not keep the instances of
+        subsections that were not accessed before. Only for read-only access,
+        e.g. serialization.
+        """
+        return _SubSectionViews(self)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._materialize(index) for index in range(len(self))[item]]
+        if isinstance(item, str):
+            return super().__getitem__(item)
+
+        return self._materialize(item)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._materialize(index)
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self._materialize(index)
+
+    def __contains__(self, item):
+        # subsections that were not created yet cannot be contained elsewhere
+        return any(
+            sub_section is item
+            for sub_section in list.__iter__(self)
+            if sub_section is not _not_materialized
+        )
+
+    def __delitem__(self, key):
+        self._materialize_all()
+        super().__delitem__(key)
+
+    def __eq__(self, other):
+        self._materialize_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __repr__(self):
+        self._materialize_all()
+        return super().__repr__()
+
+    def index(self, *args, **kwargs):
+        self._materialize_all()
+        return super().index(*args, **kwargs)
+
+    def count(self, value):
+        self._materialize_all()
+        return super().count(value)
+
+    def copy(self):
+        return list(self)
+
+    def clear(self):
+        self._materialize_all()
+        super().clear()
+
+
+class MColumnarSubSectionList(MLazySubSectionList):
+    """
+    A lazy list of repeating subsections that keeps the quantity values of its
+    subsections in columns, i.e. one list or array per quantity with the subsection
+    index as first dimension. The columns only hold the values of subsections that
+    were not created yet.
+    """
+
+    def __init__(self, section, sub_section_def, section_cls, columns, length: int):
+        super().__init__(
+            section,
+            sub_section_def,
+            partial(section_cls._m_from_column_values, columns),
+            length,
+        )
+        self.columns = {
+            quantity_def.name: (values, normalized)
+            for quantity_def, values, normalized in columns
+        }
+
+
+class MLazySubSection:
+    """
+    A placeholder for a not repeating subsection that is only created, with the
+    given ``create`` function, when it is accessed.
+    """
+
+    def __init__(self, create: Callable[[], Any]):
+        self.create = create
+
+
+class _SubSectionViews:
+    def __init__(self, sub_sections: MLazySubSectionList):
+        self.sub_sections = sub_sections
+
+    def __len__(self):
+        return len(self.sub_sections)
+
+    def __iter__(self):
+        sub_sections = self.sub_sections
+        for index, sub_section in enumerate(list.__iter__(sub_sections)):
+            if sub_section is _not_materialized:
+                # noinspection PyProtectedMember
+                sub_section = sub_sections._create(index)
+            yield sub_section
+
+
 @dataclass
 class ReferenceURL:
     fragment: str
@@ -801,6 +959,53 @@ def to_numpy(np_type, shape: list, unit: Optional[pint.Unit], definition, value:
     return value
 
 
+def normalize_column(definition, value: Any) -> Tuple[Sequence, bool]:
+    """
+    Normalizes the values of the given quantity definition for many sections at once.
+    The given value is a sequence or array with the section index as first dimension.
+
+    Returns the sequence of per-section values and whether these values are already
+    normalized and validated. If not, the values have to be set one by one.
+    """
+    if definition.use_full_storage:
+        return list(value), False
+
+    np_type = definition.type
+    shape = definition.shape
+
+    if np_type in MTypes.numpy and np_type not in MTypes.complex:
+        try:
+            values = to_numpy(
+                np_type, ['*'] + shape, definition.unit, definition, value
+            )
+        except (TypeError, ValueError):
+            # e.g. ragged arrays or values with individual units
+            return list(value), False
+        if not isinstance(values, np.ndarray) or values.dtype == object:
+            return list(value), False
+        if len(shape) == 0 and values.dtype != np_type:
+            values = values.astype(np_type)
+        return values, True
+
+    if np_type in (str, int, float, bool) and len(shape) <= 1:
+        if isinstance(value, pint.Quantity):
+            if definition.unit is None or np_type is not float:
+                return list(value), False
+            value = value.to(definition.unit).magnitude
+        values = value.tolist() if isinstance(value, np.ndarray) else list(value)
+        if len(shape) == 0:
+            valid = all(v is None or type(v) is np_type for v in values)
+        else:
+            valid = all(
+                v is None
+                or (isinstance(v, list) and all(type(i) is np_type for i in v))
+                for v in values
+            )
+        return values, valid
+
+    return list(value), False
+
+
 def __validate_shape(section, dimension: Union[str, int], length: int) -> bool:
     if isinstance(dimension, int):
         return dimension == length
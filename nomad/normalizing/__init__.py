@@ -37,10 +37,23 @@ There is one ABC for all normalizer:
 """
 
 import importlib
-from typing import Any, Iterator
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from collections import UserList
 
+try:
+    import resource
+except ImportError:  # not available on windows
+    resource = None
+
 from nomad.config import config
+from nomad.metainfo import MSection
+from nomad.metainfo.util import MSubSectionList
 
 from nomad.config.models.plugins import (
     Normalizer as OldNormalizerPlugin,
@@ -57,6 +70,292 @@ def import_normalizer(class_name: str):
         raise ImportError(f'Cannot import normalizer {class_name}', e)
 
 
+class NormalizerTimeout(BaseException):
+    """
+    Raised within a normalizer that exceeds its time budget. It is not derived from
+    ``Exception`` to pass through the generic exception handling within normalizers.
+    """
+
+    pass
+
+
+def get_time_budget(normalizer_name: str) -> Optional[float]:
+    """Returns the configured time budget in seconds for the given normalizer."""
+    budget = config.normalize.normalizer_time_budgets.get(
+        normalizer_name, config.normalize.normalizer_time_budget
+    )
+    return budget if budget else None
+
+
+@contextmanager
+def time_budget(seconds: Optional[float]):
+    """
+    A context manager that raises :class:`NormalizerTimeout` in its body once the
+    given number of seconds has passed. It uses ``SIGALRM`` and the budget is only
+    enforced in the main thread of POSIX systems.
+
+    Python only handles signals between bytecode instructions. Long running calls
+    into C extensions, e.g. zeo++ in the porosity normalizer or spglib and MatID in
+    the system normalizer, cannot be interrupted. The timeout is raised once the call
+    returns.
+    """
+    if (
+        not seconds
+        or not hasattr(signal, 'setitimer')
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    active = True
+
+    def handler(signum, frame):
+        if active:
+            raise NormalizerTimeout(f'exceeded the time budget of {seconds}s')
+
+    previous_handler = signal.signal(signal.SIGALRM, handler)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        active = False
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _get_peak_rss() -> int:
+    """Returns the peak resident set size of this process in bytes."""
+    if resource is None:
+        return 0
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS bytes
+    return peak_rss if os.uname().sysname == 'Darwin' else peak_rss * 1024
+
+
+_ArchiveSnapshot = List[Tuple[MSection, Dict[str, Any], Dict[str, Tuple[list, dict]]]]
+
+
+def _snapshot_archive(archive: MSection) -> _ArchiveSnapshot:
+    """
+    Returns shallow copies of the properties of all created sections of the archive.
+    Subsections that were not created yet, e.g. in lists created with
+    ``m_create_many``, are not created.
+    """
+    snapshot: _ArchiveSnapshot = []
+    sections = [archive]
+    while sections:
+        section = sections.pop()
+        properties = dict(section.__dict__)
+        sub_section_lists = {}
+        for name in section.m_def.all_sub_sections:
+            value = properties.get(name)
+            if isinstance(value, MSubSectionList):
+                items = list(list.__iter__(value))
+                sub_section_lists[name] = (items, dict(value.__dict__))
+                sections.extend(item for item in items if isinstance(item, MSection))
+            elif isinstance(value, MSection):
+                sections.append(value)
+        snapshot.append((section, properties, sub_section_lists))
+
+    return snapshot
+
+
+def _restore_archive(snapshot: _ArchiveSnapshot):
+    """
+    Restores the sections of a snapshot. This removes all subsections and quantity
+    values that were added after the snapshot was taken and resets replaced values.
+    In place modifications of values, e.g. of numpy arrays, are not reverted.
+    """
+    for section, properties, sub_section_lists in snapshot:
+        section.__dict__.clear()
+        section.__dict__.update(properties)
+        for name, (items, attributes) in sub_section_lists.items():
+            sub_sections = properties[name]
+            list.__setitem__(sub_sections, slice(None), items)
+            sub_sections.__dict__.clear()
+            sub_sections.__dict__.update(attributes)
+
+
+def run_normalizer(normalizer, archive, logger=None) -> Dict[str, Any]:
+    """
+    Runs the given normalizer (an element of :data:`normalizers`) on the archive
+    within its configured time budget. Returns the wall time, CPU time (both in
+    seconds), the increase of the process' peak RSS (in bytes), and whether the
+    normalizer was interrupted. Interrupted normalizers are logged as a warning,
+    all other exceptions are passed on.
+
+    If a budget is configured, the archive is restored to its state before the
+    normalizer ran, when the normalizer is interrupted. This removes the partial
+    results of the normalizer.
+    """
+    budget = get_time_budget(normalizer.__name__)
+    peak_rss = _get_peak_rss()
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    snapshot = _snapshot_archive(archive) if budget else None
+    interrupted = False
+    try:
+        with time_budget(budget):
+            normalizer(archive).normalize(logger=logger)
+    except NormalizerTimeout:
+        interrupted = True
+        _restore_archive(snapshot)
+        if logger is not None:
+            logger.warning(
+                'normalizer exceeded its time budget and was interrupted, its '
+                'partial results were removed',
+                time_budget=budget,
+            )
+
+    return dict(
+        normalizer=normalizer.__name__,
+        wall_time=time.perf_counter() - start_wall,
+        cpu_time=time.process_time() - start_cpu,
+        peak_rss_increase=_get_peak_rss() - peak_rss,
+        time_budget=budget,
+        interrupted=interrupted,
+    )
+
+
+def _paths_overlap(path: str, other: str) -> bool:
+    return path == other or path.startswith(f'{other}.') or other.startswith(f'{path}.')
+
+
+def are_independent(normalizer, other) -> bool:
+    """
+    Two normalizers are independent if both declare their read and write sets
+    (``reads`` and ``writes``) and neither writes a path that the other reads or
+    writes. Normalizers without read or write sets depend on all other normalizers.
+    """
+    if any(
+        paths is None
+        for paths in (normalizer.reads, normalizer.writes, other.reads, other.writes)
+    ):
+        return False
+
+    for writes, paths in (
+        (normalizer.writes, [*other.reads, *other.writes]),
+        (other.writes, [*normalizer.reads, *normalizer.writes]),
+    ):
+        if any(_paths_overlap(write, path) for write in writes for path in paths):
+            return False
+
+    return True
+
+
+def schedule_normalizers(normalizers) -> List[List[Any]]:
+    """
+    Groups the given normalizers into stages that run one after another. Each stage
+    contains consecutive normalizers that are independent from each other and can
+    run concurrently. Normalizers with a time budget always form their own stage,
+    because budgets are only enforced in the main thread.
+    """
+    stages: List[List[Any]] = []
+    for normalizer in normalizers:
+        if (
+            stages
+            and get_time_budget(normalizer.__name__) is None
+            and all(
+                get_time_budget(other.__name__) is None
+                and are_independent(normalizer, other)
+                for other in stages[-1]
+            )
+        ):
+            stages[-1].append(normalizer)
+        else:
+            stages.append([normalizer])
+
+    return stages
+
+
+def _create_write_parents(archive: MSection, normalizers) -> List[MSection]:
+    """
+    Creates the missing parent sections of all paths written by the given
+    normalizers. Otherwise, concurrent normalizers could replace each other's
+    sections when they create shared parents, e.g. ``results`` for
+    ``results.material.topology`` and ``results.properties``. Returns the created
+    sections.
+    """
+    created: List[MSection] = []
+    for normalizer in normalizers:
+        for path in normalizer.writes:
+            section = archive
+            for name in path.split('.')[:-1]:
+                sub_section_def = section.m_def.all_sub_sections[name]
+                if sub_section_def.repeats:
+                    raise ValueError(
+                        f'{normalizer.__name__} writes {path}, which contains the '
+                        f'repeating subsection {name}'
+                    )
+                sub_section = section.m_get_sub_section(sub_section_def, -1)
+                if sub_section is None:
+                    sub_section = sub_section_def.sub_section.section_cls()
+                    section.m_add_sub_section(sub_section_def, sub_section)
+                    created.append(sub_section)
+                section = sub_section
+
+    return created
+
+
+def _remove_empty(sections: List[MSection]):
+    """Removes the given sections, if nothing was added to them."""
+    for section in reversed(sections):
+        if not any(name in section.__dict__ for name in section.m_def.all_properties):
+            section.m_parent.m_remove_sub_section(section.m_parent_sub_section, -1)
+
+
+def run_normalizers(
+    normalizers,
+    archive: MSection,
+    get_logger: Callable[[Any], Any],
+    max_workers: int = None,
+) -> Iterator[Tuple[Any, Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Runs the given normalizers on the archive and yields each normalizer with its
+    stats (see :func:`run_normalizer`) and the exception if it failed. The caller
+    should stop iterating after a failed normalizer.
+
+    Independent normalizers (see :func:`schedule_normalizers`) run concurrently in
+    threads on the same archive. Before, the missing parents of their written paths
+    are created, and parents that stay empty are removed afterwards. The resulting
+    archive is the same as for a sequential run. Only normalizers that release the
+    GIL for most of their work, e.g. in numpy or compiled extensions, gain from
+    this. CPU time and peak RSS of concurrent normalizers are measured for the whole
+    process.
+
+    If not given, the number of threads is taken from the ``normalize`` configuration.
+    """
+    if max_workers is None:
+        max_workers = config.normalize.normalizer_workers
+
+    for stage in schedule_normalizers(normalizers):
+        if len(stage) == 1 or max_workers <= 1:
+            for normalizer in stage:
+                try:
+                    stats = run_normalizer(normalizer, archive, get_logger(normalizer))
+                except Exception as e:
+                    yield normalizer, None, e
+                    return
+                yield normalizer, stats, None
+            continue
+
+        created = _create_write_parents(archive, stage)
+        with ThreadPoolExecutor(min(max_workers, len(stage))) as executor:
+            futures = [
+                executor.submit(
+                    run_normalizer, normalizer, archive, get_logger(normalizer)
+                )
+                for normalizer in stage
+            ]
+        _remove_empty(created)
+
+        for normalizer, future in zip(stage, futures):
+            error = future.exception()
+            yield normalizer, None if error else future.result(), error
+            if error:
+                return
+
+
 class SortedNormalizers(UserList):
     def __iter__(self) -> Iterator:
         self.sort(key=lambda x: x.normalizer_level)
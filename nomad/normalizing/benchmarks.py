@@ -0,0 +1,159 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import ase.io
+import pytest
+
+from nomad.atomutils import (
+    calc_molecular_mean_squared_displacements,
+    calc_molecular_rdf,
+    create_molecular_universe,
+)
+from nomad.datamodel import EntryArchive
+from nomad.datamodel.results import RadialDistributionFunction, Relation, System
+from nomad.normalizing import NormalizerInterfaceNew, mof_deconstructor, run_normalizers
+from nomad.normalizing.normalizer import Normalizer
+from nomad.utils import get_logger
+
+mof_file = 'tests/data/normalizers/mofs/SARSUC.cif'
+
+
+@pytest.fixture(scope='module')
+def mof():
+    return ase.io.read(mof_file)
+
+
+@pytest.mark.parametrize('size', [1, 2, 3])
+def test_compute_ase_neighbour(benchmark, mof, size):
+    supercell = mof * (size, size, size)
+    benchmark(mof_deconstructor.compute_ase_neighbour, supercell)
+
+
+@pytest.mark.parametrize('size', [1, 2, 3])
+def test_connected_components(benchmark, mof, size):
+    _, bond_matrix = mof_deconstructor.compute_ase_neighbour(mof * (size, size, size))
+
+    def connected_components():
+        graph = mof_deconstructor.matrix2dict(bond_matrix)
+        return mof_deconstructor.connected_components(graph)
+
+    benchmark(connected_components)
+
+
+@pytest.mark.parametrize('size', [1, 2])
+def test_secondary_building_units(benchmark, mof, size):
+    supercell = mof * (size, size, size)
+    benchmark(mof_deconstructor.secondary_building_units, supercell)
+
+
+@pytest.mark.parametrize('size', [1, 2])
+def test_ligands_and_metal_clusters(benchmark, mof, size):
+    supercell = mof * (size, size, size)
+    benchmark(mof_deconstructor.ligands_and_metal_clusters, supercell)
+
+
+@pytest.fixture(scope='module')
+def universe():
+    return create_molecular_universe(n_molecules=500, n_frames=50)
+
+
+@pytest.mark.parametrize('one_pass, n_processes', [(False, 1), (True, 1), (True, 4)])
+def test_calc_molecular_rdf(benchmark, universe, one_pass, n_processes):
+    benchmark(
+        calc_molecular_rdf,
+        universe,
+        n_traj_split=5,
+        one_pass=one_pass,
+        n_processes=n_processes,
+    )
+
+
+def test_calc_molecular_mean_squared_displacements(benchmark, universe):
+    benchmark(calc_molecular_mean_squared_displacements, universe)
+
+
+class BuildingUnitsNormalizer(Normalizer):
+    """Adds the secondary building units of the given MOF to the topology."""
+
+    reads = []
+    writes = ['results.material.topology']
+
+    def __init__(self, atoms, **kwargs):
+        super().__init__(**kwargs)
+        self.atoms = atoms
+
+    def normalize(self, archive, logger=None):
+        components = mof_deconstructor.secondary_building_units(self.atoms)[0]
+        material = archive.m_setdefault('results.material')
+        for component in components:
+            material.topology.append(
+                System(
+                    label='building unit',
+                    method='porosity',
+                    structural_type='group',
+                    system_relation=Relation(type='group'),
+                    indices=[sorted(component)],
+                )
+            )
+
+
+class MolecularRDFNormalizer(Normalizer):
+    """Adds the molecular radial distribution functions of the given universe."""
+
+    reads = []
+    writes = ['results.properties.structural']
+
+    def __init__(self, universe, **kwargs):
+        super().__init__(**kwargs)
+        self.universe = universe
+
+    def normalize(self, archive, logger=None):
+        rdf = calc_molecular_rdf(self.universe, n_traj_split=5, one_pass=True)
+        structural = archive.m_setdefault('results.properties.structural')
+        for index, types in enumerate(rdf['types']):
+            structural.radial_distribution_function.append(
+                RadialDistributionFunction(
+                    type=rdf['type'],
+                    label='-'.join(types),
+                    bins=rdf['bins'][index],
+                    value=rdf['value'][index],
+                    frame_start=rdf['frame_start'][index],
+                    frame_end=rdf['frame_end'][index],
+                )
+            )
+
+
+def run_mof_and_md_normalizers(mof, universe, max_workers):
+    normalizers = [
+        NormalizerInterfaceNew(BuildingUnitsNormalizer(mof * (2, 2, 2)), level=0),
+        NormalizerInterfaceNew(MolecularRDFNormalizer(universe), level=0),
+    ]
+    logger = get_logger(__name__)
+    archive = EntryArchive()
+    for _, _, error in run_normalizers(
+        normalizers, archive, lambda _: logger, max_workers
+    ):
+        assert error is None
+    return archive
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_run_normalizers(benchmark, mof, universe, max_workers):
+    expected = run_mof_and_md_normalizers(mof, universe, 1).m_to_dict()
+    archive = benchmark(run_mof_and_md_normalizers, mof, universe, max_workers)
+    assert archive.m_to_dict() == expected
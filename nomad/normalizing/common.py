@@ -21,13 +21,13 @@ from ase import Atoms
 from typing import List, Set, Any, Optional, Dict, Union
 from nptyping import NDArray
 import MDAnalysis as mda
-from matid import SymmetryAnalyzer  # pylint: disable=import-error
 from matid.symmetry.wyckoffset import WyckoffSet as WyckoffSetMatID  # pylint: disable=import-error
 import matid.geometry  # pylint: disable=import-error
 
 from nomad import atomutils
 from nomad.config import config
 from nomad.utils import hash
+from nomad.normalizing.symmetry import symmetry_analysis
 from nomad.units import ureg
 from nomad.datamodel.metainfo.system import Atoms as NOMADAtoms
 from nomad.datamodel.optimade import Species
@@ -359,7 +359,7 @@ def structures_2d(original_atoms, logger=None):
             # for SymmetryAnalyzer to use the symmetry analysis designed for 2D
             # systems.
             symm_system.set_pbc(periodicity)
-        symmetry_analyzer = SymmetryAnalyzer(
+        symmetry_analyzer = symmetry_analysis(
             symm_system,
             0.4,  # The value is increased here to better match 2D materials.
             config.normalize.flat_dim_threshold,
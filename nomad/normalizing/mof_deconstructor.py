@@ -16,6 +16,8 @@
 # limitations under the License.
 #
 
+import numpy as np
+from scipy import sparse
 from ase import neighborlist, geometry
 from ase.data import chemical_symbols, covalent_radii, atomic_numbers
 from pymatgen.io.ase import AseAtomsAdaptor
@@ -71,11 +73,13 @@ def transition_metals():
     return metal
 
 
-def inter_atomic_distance_check(ase_atom):
+def inter_atomic_distance_check(ase_atom, cutoff=0.90):
     """
-    Check that no two atoms are within a distance of 1.0 Amstrong unless it is an X-H bond
+    Check that no two atoms are within the cutoff distance (0.90 Amstrong) unless
+    both are hydrogens
 
-    As simple script to convert from ase atom object to pybel
+    Only pairs within the cutoff are found with a neighbour list, instead of
+    computing all distances.
     Parameters
     ----------
     ase_atom : ASE atoms object
@@ -84,16 +88,11 @@ def inter_atomic_distance_check(ase_atom):
     -------
     boolean
     """
-    valid = True
-    distances = ase_atom.get_all_distances(mic=True)
-    for i in range(len(distances)):
-        if ase_atom[i].symbol != 'H':
-            for j in range(len(distances[i])):
-                if i != j:
-                    if distances[i, j] < 0.90:
-                        valid = False
-                        break
-    return valid
+    i, j = neighborlist.neighbor_list('ij', ase_atom, cutoff)
+    close = i != j
+    if not np.any(close):
+        return True
+    return bool(np.all(ase_atom.numbers[i[close]] == 1))
 
 
 def covalent_radius(element):
@@ -199,6 +198,7 @@ def compute_ase_neighbour(ase_atom):
     are the indices of it neigbours.
     e.g.
     atom_neighbors ={0:[1,2,3,4], 1:[3,4,5]...}
+    and the bond matrix as sparse nxn CSR matrix.
     """
     atom_neighbors = {}
     cutOff = neighborlist.natural_cutoffs(ase_atom)
@@ -207,7 +207,7 @@ def compute_ase_neighbour(ase_atom):
         cutOff, self_interaction=False, bothways=True
     )
     neighborList.update(ase_atom)
-    matrix = neighborList.get_connectivity_matrix(sparse=False)
+    matrix = sparse.csr_matrix(neighborList.get_connectivity_matrix(sparse=True))
 
     for atoms in ase_atom:
         connectivity, _ = neighborList.get_neighbors(atoms.index)
@@ -222,27 +222,104 @@ def matrix2dict(bond_matrix):
     Parameters:
     -----------
     Bond matrix
-    type: nxn ndarray
+    type: nxn ndarray or scipy sparse matrix
 
     Returns
     -------
     python dictionary
     """
-    graph = {}
-    for idx, row in enumerate(bond_matrix):
-        temp = []
-        for r in range(len(row)):
-            if row[r] != 0:
-                temp.append(r)
-        graph[idx] = temp
-    return graph
+    bond_matrix = sparse.csr_matrix(bond_matrix, copy=True)
+    bond_matrix.eliminate_zeros()
+    bond_matrix.sort_indices()
+    indptr = bond_matrix.indptr.tolist()
+    indices = bond_matrix.indices.tolist()
+    return {
+        idx: indices[indptr[idx] : indptr[idx + 1]]
+        for idx in range(bond_matrix.shape[0])
+    }
+
+
+def remove_bonds(bond_matrix, bonds):
+    """
+    Remove bonds in both directions from a bond matrix. Only the first two
+    entries of each bond are used as the indices of the bonded atoms.
+    Parameters:
+    -----------
+    bond_matrix: nxn scipy sparse matrix
+    bonds: list of bonds, e.g. [[0, 1], [3, 4]]
+
+    Returns
+    -------
+    a new CSR bond matrix without the given bonds
+    """
+    bond_matrix = sparse.csr_matrix(bond_matrix, copy=True)
+    if len(bonds) == 0:
+        return bond_matrix
+    pairs = np.array([[bond[0], bond[1]] for bond in bonds], dtype=np.int64)
+    n_atoms = bond_matrix.shape[0]
+    removed = np.concatenate(
+        [pairs[:, 0] * n_atoms + pairs[:, 1], pairs[:, 1] * n_atoms + pairs[:, 0]]
+    )
+    rows = np.repeat(np.arange(n_atoms, dtype=np.int64), np.diff(bond_matrix.indptr))
+    stored = rows * n_atoms + bond_matrix.indices
+    bond_matrix.data[np.isin(stored, removed)] = 0
+    bond_matrix.eliminate_zeros()
+    return bond_matrix
+
+
+def remove_long_bonds(ase_atom, bond_matrix, skin):
+    """
+    Remove all bonds that are longer than the sum of the covalent radii
+    of the bonded atoms plus a skin.
+    Parameters:
+    -----------
+    ase_atom: ASE atoms
+    bond_matrix: nxn scipy sparse matrix
+    skin: tolerance added to the sum of covalent radii
+
+    Returns
+    -------
+    a new CSR bond matrix without the long bonds
+    """
+    bond_matrix = sparse.csr_matrix(bond_matrix)
+    rows, columns = bond_matrix.nonzero()
+    radii = covalent_radii[ase_atom.get_atomic_numbers()]
+    positions = ase_atom.positions
+    bonds = np.round(np.linalg.norm(positions[columns] - positions[rows], axis=1), 2)
+    check = radii[rows] + radii[columns] + skin
+    long_bonds = bonds > check
+    return remove_bonds(
+        bond_matrix, np.stack([rows[long_bonds], columns[long_bonds]], axis=1)
+    )
+
+
+def group_identical_components(ase_atom, list_of_connected_components):
+    """
+    Group connected components that contain the same atoms.
+    Parameters:
+    -----------
+    ase_atom: ASE atoms
+    list_of_connected_components: list of list of atom indices
+
+    Returns
+    -------
+    python dictionary, wherein the key is the index of the first component
+    of each group and the value are the indices of all components in the group.
+    """
+    symbols = ase_atom.get_chemical_symbols()
+    groups = {}
+    for idx, component in enumerate(list_of_connected_components):
+        key = tuple(sorted(symbols[i] for i in component))
+        groups.setdefault(key, []).append(idx)
+    return {indices[0]: indices for indices in groups.values()}
 
 
 def dfsutil_graph_method(graph, temp, node, visited):
     """
     Depth-first search graph algorithm for traversing graph data structures.
     I starts at the root 'node' and explores as far as possible along
-    each branch before backtracking.
+    each branch before backtracking. The search is iterative and thus
+    not limited by the recursion depth.
     It is used here a a util for searching connected components in the MOF graph
     Parameters:
     -----------
@@ -256,9 +333,16 @@ def dfsutil_graph_method(graph, temp, node, visited):
     """
     visited[node] = True
     temp.append(node)
-    for i in graph[node]:
-        if visited[i] is False:
-            temp = dfsutil_graph_method(graph, temp, i, visited)
+    stack = [iter(graph[node])]
+    while stack:
+        for i in stack[-1]:
+            if visited[i] is False:
+                visited[i] = True
+                temp.append(i)
+                stack.append(iter(graph[i]))
+                break
+        else:
+            stack.pop()
     return temp
 
 
@@ -342,10 +426,8 @@ def connected_components(graph):
     These correspond to individual molecular fragments.
     list_of_connected_components = [[1,2],[1,3,4]]
     """
-    visited = []
+    visited = [False] * len(graph)
     list_of_connected_components = []
-    for _ in list(graph.keys()):
-        visited.append(False)
     for v in list(graph.keys()):
         if visited[v] is False:
             temp = []
@@ -502,17 +584,7 @@ def mof_regions(ase_atom, list_of_connected_components, atom_pairs_at_breaking_p
     a-axis. Such that the system can be grow along this axis
 
     """
-    all_regions = {}
-    all_pm_structures = [
-        sorted(ase_atom[i].symbols) for i in list_of_connected_components
-    ]
-    for i in range(len(all_pm_structures)):
-        temp = []
-        for j in range(len(all_pm_structures)):
-            if all_pm_structures[i] == all_pm_structures[j]:
-                temp.append(j)
-        if temp not in all_regions.values():
-            all_regions[i] = temp
+    all_regions = group_identical_components(ase_atom, list_of_connected_components)
     Xis_regions = {}
     for idx in range(len(all_regions.keys())):
         frag = list(all_regions.keys())[idx]
@@ -789,7 +861,6 @@ def secondary_building_units(ase_atom):
      Regions : Dictionary of regions.
     """
     atom_pairs_at_breaking_point = {}
-    all_regions = {}
     bonds_to_break = []
     seen_phosphorous = []
     seen_carbon = []
@@ -1072,31 +1143,11 @@ def secondary_building_units(ase_atom):
                 bonds_to_break.append([c_h, metal])
                 atom_pairs_at_breaking_point[metal] = c_h
 
-    for bonds in bonds_to_break:
-        bond_matrix[bonds[0], bonds[1]] = 0
-        bond_matrix[bonds[1], bonds[0]] = 0
+    bond_matrix = remove_bonds(bond_matrix, bonds_to_break)
 
     new_ase_graph = matrix2dict(bond_matrix)
-    try:
-        list_of_connected_components = connected_components(new_ase_graph)
-    except Exception:
-        import networkx as nx
-
-        N_Graph = nx.from_dict_of_lists(new_ase_graph)
-        list_of_connected_components = [
-            list(i) for i in list(nx.connected_components(N_Graph))
-        ]
-
-    all_pm_structures = [
-        sorted(ase_atom[i].symbols) for i in list_of_connected_components
-    ]
-    for i in range(len(all_pm_structures)):
-        temp = []
-        for j in range(len(all_pm_structures)):
-            if all_pm_structures[i] == all_pm_structures[j]:
-                temp.append(j)
-        if temp not in all_regions.values():
-            all_regions[i] = temp
+    list_of_connected_components = connected_components(new_ase_graph)
+    all_regions = group_identical_components(ase_atom, list_of_connected_components)
 
     return (
         list_of_connected_components,
@@ -1124,7 +1175,6 @@ def ligands_and_metal_clusters(ase_atom):
     """
     graph, bond_matrix = compute_ase_neighbour(ase_atom)
     porphyrin_checker = metal_in_porphyrin2(ase_atom, graph)
-    all_regions = {}
     atom_pairs_at_breaking_point = {}
     bonds_to_break = []
     carboxylates = find_carboxylates(ase_atom, graph)
@@ -1288,31 +1338,11 @@ def ligands_and_metal_clusters(ase_atom):
                 bonds_to_break.append([c_h, metal])
                 atom_pairs_at_breaking_point[metal] = c_h
 
-    for bonds in bonds_to_break:
-        bond_matrix[bonds[0], bonds[1]] = 0
-        bond_matrix[bonds[1], bonds[0]] = 0
+    bond_matrix = remove_bonds(bond_matrix, bonds_to_break)
 
     new_ase_graph = matrix2dict(bond_matrix)
-    try:
-        list_of_connected_components = connected_components(new_ase_graph)
-    except Exception:
-        import networkx as nx
-
-        N_Graph = nx.from_dict_of_lists(new_ase_graph)
-        list_of_connected_components = [
-            list(i) for i in list(nx.connected_components(N_Graph))
-        ]
-
-    all_pm_structures = [
-        sorted(ase_atom[i].symbols) for i in list_of_connected_components
-    ]
-    for i in range(len(all_pm_structures)):
-        temp = []
-        for j in range(len(all_pm_structures)):
-            if all_pm_structures[i] == all_pm_structures[j]:
-                temp.append(j)
-        if temp not in all_regions.values():
-            all_regions[i] = temp
+    list_of_connected_components = connected_components(new_ase_graph)
+    all_regions = group_identical_components(ase_atom, list_of_connected_components)
 
     return (
         list_of_connected_components,
@@ -1664,18 +1694,7 @@ def wrap_systems_in_unit_cell(ase_atom, max_iter=30, skin=0.3):
     ase_atom.positions = new_position
 
     graph, bond_matrix = compute_ase_neighbour(ase_atom)
-
-    for atom in graph:
-        connected = graph[atom]
-        for nl in connected:
-            check = (
-                covalent_radius(ase_atom[atom].symbol)
-                + covalent_radius(ase_atom[nl].symbol)
-                + skin
-            )
-            bond = round(ase_atom.get_distance(atom, nl), 2)
-            if bond > check:
-                bond_matrix[atom][nl] = 0
+    bond_matrix = remove_long_bonds(ase_atom, bond_matrix, skin)
 
     new_ase_graph = matrix2dict(bond_matrix)
     list_of_connected_components = connected_components(new_ase_graph)
@@ -1685,27 +1704,16 @@ def wrap_systems_in_unit_cell(ase_atom, max_iter=30, skin=0.3):
         max_index = all_len.index(max(all_len))
         Root = list_of_connected_components[max_index]
         list_of_connected_components.pop(max_index)
-        All_sum = sum(list_of_connected_components, [])
+        All_sum = set(sum(list_of_connected_components, []))
         for atom in Root:
             connected = graph[atom]
-            for nl in All_sum:
-                if nl in connected:
-                    v = ase_atom[nl].position - ase_atom[atom].position
-                    mic_vector = geometry.find_mic(v, ase_atom.get_cell(), pbc=True)
-                    ase_atom[nl].position = mic_vector[0] + ase_atom[atom].position
+            for nl in sorted(All_sum.intersection(connected)):
+                v = ase_atom[nl].position - ase_atom[atom].position
+                mic_vector = geometry.find_mic(v, ase_atom.get_cell(), pbc=True)
+                ase_atom[nl].position = mic_vector[0] + ase_atom[atom].position
 
         graph, bond_matrix = compute_ase_neighbour(ase_atom)
-        for atom in graph:
-            connected = graph[atom]
-            for nl in connected:
-                check = (
-                    covalent_radius(ase_atom[atom].symbol)
-                    + covalent_radius(ase_atom[nl].symbol)
-                    + skin
-                )
-                bond = round(ase_atom.get_distance(atom, nl), 2)
-                if bond > check:
-                    bond_matrix[atom][nl] = 0
+        bond_matrix = remove_long_bonds(ase_atom, bond_matrix, skin)
         new_ase_graph = matrix2dict(bond_matrix)
         list_of_connected_components = connected_components(new_ase_graph)
         number_of_iterations += 1
@@ -37,6 +37,12 @@ class Normalizer(metaclass=ABCMeta):
     normalizer_level = 0
     """Deprecated: Specifies the order of normalization with respect to other normalizers. Lower level
     is executed first."""
+    reads: Optional[List[str]] = None
+    """The archive paths (e.g. `run` or `results.material`) read by this normalizer. Normalizers
+    that declare reads and writes can run concurrently with other independent normalizers."""
+    writes: Optional[List[str]] = None
+    """The archive paths written by this normalizer. All but the last path segment must be
+    non-repeating subsections, and the normalizer must not replace these sections."""
 
     def __init__(self, **kwargs) -> None:
         self.logger = get_logger(__name__)
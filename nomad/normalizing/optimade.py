@@ -89,6 +89,9 @@ class OptimadeNormalizer(SystemBasedNormalizer):
     It assumes that the :class:`SystemNormalizer` was run before.
     """
 
+    reads = ['run', 'workflow2']
+    writes = ['metadata.optimade']
+
     def __init__(self):
         super().__init__(only_representatives=True)
 
@@ -18,9 +18,12 @@
 
 import os
 import re
-from typing import Dict
+import tempfile
+from typing import Dict, List
 
 import numpy as np
+from nomad import utils
+from nomad.config import config
 from nomad.units import ureg
 
 try:
@@ -63,6 +66,9 @@ class PorosityNormalizer(SystemBasedNormalizer):
     In the future, the it will also compute the rcsr tological code.
     """
 
+    reads = ['run', 'workflow2']
+    writes = ['results.material.topology']
+
     def __init__(self):
         super().__init__(only_representatives=True)
 
@@ -403,41 +409,125 @@ def zeo_calculation(
         7) PLD_A:The pore limiting diameter is the largest sphere that can freely
                  diffuse through the porous network without overlapping with any
                  of the atoms in the system
+
+    The volume, surface area and free sphere calculations run in parallel processes
+    if `normalize.porosity_workers` is larger than one.
     """
-    tmp_cssr = 'tmp.cssr'
-    tmp_out = 'tmp.res'
-    tmp = ase_to_zeoobject(ase_atom)
-    put_contents(tmp_cssr, tmp)
-    parameters = {}
-    atmnet = AtomNetwork.read_from_CSSR(tmp_cssr)
-    vol_str = volume(
-        atmnet, probe_radius, probe_radius, number_of_steps, high_accuracy=high_accuracy
-    )
-    if high_accuracy is True:
-        vol_str = vol_str[0].decode('utf-8').split()
-    else:
-        vol_str = vol_str.decode('utf-8').split()
-    parameters['AV_Volume_fraction'] = np.float64(vol_str[10])
-    parameters['AV'] = np.float64(vol_str[8])
-    sa_str = surface_area(
-        atmnet, probe_radius, probe_radius, number_of_steps, high_accuracy=False
-    )
-    sa_str = sa_str.decode('utf-8').split()
-    parameters['ASA'] = np.float64(sa_str[8])
-    parameters['Number_of_channels'] = np.int64(sa_str[20])
-    atmnet.calculate_free_sphere_parameters(tmp_out)
-    outlines = get_contents(tmp_out)
-    data = outlines[0].split()
-    parameters['LCD'] = np.float64(data[1])
-    parameters['lfpd'] = np.float64(data[3])
-    parameters['PLD'] = np.float64(data[2])
-    if os.path.exists(tmp_cssr):
-        os.remove(tmp_cssr)
-    if os.path.exists(tmp_out):
-        os.remove(tmp_out)
+    return zeo_calculations(
+        [ase_atom],
+        probe_radius=probe_radius,
+        number_of_steps=number_of_steps,
+        high_accuracy=high_accuracy,
+    )[0]
+
+
+def zeo_calculations(
+    ase_atoms: List,
+    probe_radius=1.8,
+    number_of_steps=5000,
+    high_accuracy=True,
+    max_workers: int = None,
+) -> List[dict]:
+    """
+    Runs :func:`zeo_calculation` for independent systems. The volume, surface area and
+    free sphere calculations of all systems are independent of each other and run in
+    up to `max_workers` forked processes, by default `normalize.porosity_workers`.
+    The results are returned in the order of the given systems. If a calculation
+    fails, its exception is raised.
+    """
+    if max_workers is None:
+        max_workers = config.normalize.porosity_workers
+    tasks = [
+        (calculation, cssr, probe_radius, number_of_steps, high_accuracy)
+        for cssr in map(ase_to_zeoobject, ase_atoms)
+        for calculation in ('volume', 'surface_area', 'free_sphere')
+    ]
+    results = utils.fork_map(_zeo_calculation, tasks, max_workers)
+
+    parameters = []
+    for index in range(0, len(results), 3):
+        system_parameters: dict = {}
+        for result in results[index : index + 3]:
+            system_parameters.update(result)
+        parameters.append(system_parameters)
     return parameters
 
 
+def _zeo_calculation(
+    calculation, cssr, probe_radius, number_of_steps, high_accuracy
+) -> dict:
+    """
+    Runs one of the zeo++ calculations `volume`, `surface_area` or `free_sphere` for
+    the given structure in CSSR format and returns the parsed results.
+
+    zeo++ only reads structures from and writes the free sphere parameters to
+    files. These files are kept in a private temporary directory for each call,
+    so that concurrent calculations do not interfere with each other.
+    """
+    with tempfile.TemporaryDirectory(prefix='zeo-') as directory:
+        tmp_cssr = os.path.join(directory, 'tmp.cssr')
+        put_contents(tmp_cssr, cssr)
+        atmnet = AtomNetwork.read_from_CSSR(tmp_cssr)
+        if calculation == 'volume':
+            vol_str = volume(
+                atmnet,
+                probe_radius,
+                probe_radius,
+                number_of_steps,
+                high_accuracy=high_accuracy,
+            )
+            if high_accuracy is True:
+                vol_str = vol_str[0]
+            return parse_volume(vol_str)
+
+        if calculation == 'surface_area':
+            sa_str = surface_area(
+                atmnet, probe_radius, probe_radius, number_of_steps, high_accuracy=False
+            )
+            return parse_surface_area(sa_str)
+
+        tmp_out = os.path.join(directory, 'tmp.res')
+        atmnet.calculate_free_sphere_parameters(tmp_out)
+        return parse_free_sphere(get_contents(tmp_out))
+
+
+def parse_volume(vol_str):
+    """
+    Extracts the accessible volume and its fraction from the zeo++ volume output.
+    """
+    data = vol_str.decode('utf-8').split()
+    return {
+        'AV_Volume_fraction': np.float64(data[10]),
+        'AV': np.float64(data[8]),
+    }
+
+
+def parse_surface_area(sa_str):
+    """
+    Extracts the accessible surface area and the number of channels from the
+    zeo++ surface area output.
+    """
+    data = sa_str.decode('utf-8').split()
+    return {
+        'ASA': np.float64(data[8]),
+        'Number_of_channels': np.int64(data[20]),
+    }
+
+
+def parse_free_sphere(outlines):
+    """
+    Extracts the largest cavity diameter, the pore limiting diameter and the
+    largest included sphere along the free sphere path from the lines of the
+    zeo++ free sphere output.
+    """
+    data = outlines[0].split()
+    return {
+        'LCD': np.float64(data[1]),
+        'lfpd': np.float64(data[3]),
+        'PLD': np.float64(data[2]),
+    }
+
+
 def ase_to_zeoobject(ase_atom):
     """
     Converts an ase atom type to a zeo++ Cssr object
@@ -457,10 +547,11 @@ def ase_to_zeoobject(ase_atom):
         f'{len(ase_atom)} 0',
         f'{pymol.formula}',
     ]
+    scaled_positions = ase_atom.get_scaled_positions()
     for index, atom in enumerate(ase_atom):
         charge = pymol[index].charge if hasattr(pymol[index], 'charge') else 0
         element = atom.symbol
-        position = ase_atom.get_scaled_positions()[index]
+        position = scaled_positions[index]
         load.append(
             f'{index+1} {element} { position[2]:.4f} {position[1]:.4f}  {position[0]:.4f} 0 0 0 0 0 0 0 0 {charge:.4f}'
         )
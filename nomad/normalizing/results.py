@@ -20,13 +20,13 @@ import re
 import numpy as np
 from typing import List, Union, Any, Optional, Dict
 import ase.data
-from matid import SymmetryAnalyzer  # pylint: disable=import-error
 import matid.geometry  # pylint: disable=import-error
 
 from nomad import atomutils
 from nomad.config import config
 from nomad.utils import traverse_reversed, extract_section
 from nomad.atomutils import Formula
+from nomad.metainfo import get_columns
 from nomad.normalizing.normalizer import Normalizer
 from nomad.normalizing.method import MethodNormalizer
 from nomad.normalizing.material import MaterialNormalizer
@@ -34,6 +34,7 @@ from nomad.datamodel import EntryArchive
 from nomad.datamodel.metainfo.workflow import Workflow
 from nomad.datamodel.data import ArchiveSection
 from nomad.normalizing.common import structures_2d
+from nomad.normalizing.symmetry import symmetry_analysis
 from nomad.datamodel.results import (
     BandGap,
     BandGapDeprecated,
@@ -909,57 +910,34 @@ class ResultsNormalizer(Normalizer):
                 if md:
                     traj.provenance = MDProvenance(molecular_dynamics=md)
 
-                # Loop through calculations, gather thermodynamics directly
-                # from each step in the workflow.
-                volume = []
-                volume_time = []
-                pressure = []
-                pressure_time = []
-                temperature = []
-                temperature_time = []
-                potential_energy = []
-                potential_energy_time = []
-
+                # Gather the thermodynamics of all steps in the workflow as
+                # columns. Only steps with a time are considered.
                 calculations_ref = []
                 if workflow.results and workflow.results.calculations_ref:
                     calculations_ref = workflow.results.calculations_ref
-                for calc in calculations_ref:
-                    time = calc.time
-                    if time is not None:
-                        time = time.magnitude
-                        if calc.volume is not None:
-                            volume.append(calc.volume.magnitude)
-                            volume_time.append(time)
-                        if calc.pressure is not None:
-                            pressure.append(calc.pressure.magnitude)
-                            pressure_time.append(time)
-                        if calc.temperature is not None:
-                            temperature.append(calc.temperature.magnitude)
-                            temperature_time.append(time)
-                        if calc.energy:
-                            if calc.energy.potential is not None:
-                                potential_energy.append(
-                                    calc.energy.potential.value.magnitude
-                                )
-                                potential_energy_time.append(time)
+                properties = [
+                    ('volume', 'volume', VolumeDynamic),
+                    ('pressure', 'pressure', PressureDynamic),
+                    ('temperature', 'temperature', TemperatureDynamic),
+                    ('energy_potential', 'energy.potential.value', EnergyDynamic),
+                ]
+                columns = get_columns(
+                    calculations_ref,
+                    ['time'] + [quantity_path for _, quantity_path, _ in properties],
+                )
+                time, has_time = columns['time']
 
                 available_properties = []
-                if volume:
-                    traj.volume = VolumeDynamic(value=volume, time=volume_time)
-                    available_properties.append('volume')
-                if pressure:
-                    traj.pressure = PressureDynamic(value=pressure, time=pressure_time)
-                    available_properties.append('pressure')
-                if temperature:
-                    traj.temperature = TemperatureDynamic(
-                        value=temperature, time=temperature_time
-                    )
-                    available_properties.append('temperature')
-                if potential_energy:
-                    traj.energy_potential = EnergyDynamic(
-                        value=potential_energy, time=potential_energy_time
-                    )
-                    available_properties.append('energy_potential')
+                for name, quantity_path, section_cls in properties:
+                    values, mask = columns[quantity_path]
+                    mask &= has_time
+                    if mask.any():
+                        setattr(
+                            traj,
+                            name,
+                            section_cls(value=values[mask], time=time[mask]),
+                        )
+                        available_properties.append(name)
                 if available_properties:
                     traj.available_properties = available_properties
                 trajs.append(traj)
@@ -1315,7 +1293,7 @@ class ResultsNormalizer(Normalizer):
             # First get a symmetry analyzer and the primitive system
             symm_system = original_atoms.copy()
             symm_system.set_pbc(True)
-            symmetry_analyzer = SymmetryAnalyzer(
+            symmetry_analyzer = symmetry_analysis(
                 symm_system,
                 config.normalize.symmetry_tolerance,
                 config.normalize.flat_dim_threshold,
@@ -0,0 +1,461 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+A process-wide cache for the results of the MatID symmetry analysis. Many entries
+(e.g. the frames of MD runs or the steps of relaxations) share the same or nearly the
+same structure. Instead of repeating the symmetry analysis for each of them, the
+results are cached by structure and analysis parameters.
+
+Structures are grouped by a fingerprint of their species, periodic boundary conditions
+and the analysis parameters. Within a group, a structure matches a cached one if their
+cells and their reduced positions (modulo periodic lattice translations) are equal
+within the symmetry tolerance. The same structure in a different cell setting does not
+match, because results like the transformation matrix depend on the given cell.
+
+The cache keeps the most recently used results in memory. Optionally, results are also
+stored in a directory to share them between processes and runs. There, each structure
+is stored as an ``.npz`` file and each result as a separate JSON file that is written
+once. The size and directory are configured with ``normalize.symmetry_cache_size`` and
+``normalize.symmetry_cache_directory``.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from ase import Atoms
+from matid import SymmetryAnalyzer  # pylint: disable=import-error
+from matid.core.system import System  # pylint: disable=import-error
+from matid.symmetry.wyckoffset import WyckoffSet  # pylint: disable=import-error
+
+from nomad.config import config
+
+
+def symmetry_fingerprint(
+    system: Atoms, symmetry_tol: float, min_2d_thickness: float = 1
+) -> str:
+    """
+    Returns a fingerprint of the parts of the given structure and symmetry analysis
+    parameters that have to be exactly equal for cached results to be shared: the
+    species, the periodic boundary conditions and the analysis parameters.
+    """
+    fingerprint = hashlib.sha1()
+    for array in (
+        np.asarray(system.get_atomic_numbers(), dtype=np.int64),
+        np.asarray(system.get_pbc(), dtype=bool),
+        np.array([symmetry_tol, min_2d_thickness], dtype=np.float64),
+    ):
+        fingerprint.update(array.tobytes())
+        fingerprint.update(b'|')
+
+    return fingerprint.hexdigest()
+
+
+def reduced_structure(system: Atoms) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the cell and the reduced positions of the given structure. Positions are
+    wrapped into the cell along periodic directions. Missing cell vectors are
+    completed with unit vectors.
+    """
+    cell = np.asarray(system.cell.complete(), dtype=np.float64)
+    positions = np.asarray(system.get_scaled_positions(wrap=True), dtype=np.float64)
+    return cell, positions
+
+
+def structures_match(
+    structure: Tuple[np.ndarray, np.ndarray],
+    other: Tuple[np.ndarray, np.ndarray],
+    pbc: np.ndarray,
+    symmetry_tol: float,
+) -> bool:
+    """
+    Returns true if the given reduced structures of the same species have equal cells
+    and positions within the symmetry tolerance. Positions are compared by the
+    cartesian length of the shortest reduced displacement along periodic directions.
+    """
+    cell, positions = structure
+    other_cell, other_positions = other
+    if np.max(np.abs(cell - other_cell)) > symmetry_tol:
+        return False
+
+    displacements = positions - other_positions
+    displacements[:, pbc] -= np.rint(displacements[:, pbc])
+    distances = np.linalg.norm(displacements @ cell, axis=1)
+    return bool(np.all(distances <= symmetry_tol))
+
+
+def _encode(value: Any) -> Any:
+    """Encodes a symmetry analysis result into JSON serializable data."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return dict(ndarray=value.tolist(), dtype=value.dtype.str)
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, WyckoffSet):
+        return dict(
+            wyckoff_set={key: _encode(item) for key, item in vars(value).items()}
+        )
+    if isinstance(value, Atoms):
+        data = dict(
+            arrays={key: _encode(array) for key, array in value.arrays.items()},
+            cell=_encode(np.asarray(value.get_cell())),
+            pbc=_encode(value.get_pbc()),
+        )
+        if isinstance(value, System):
+            data.update(
+                wyckoff_letters=_encode(value.wyckoff_letters),
+                equivalent_atoms=_encode(value.equivalent_atoms),
+            )
+            return dict(system=data)
+        return dict(atoms=data)
+
+    raise TypeError(f'Cannot encode a symmetry result of type {type(value)}')
+
+
+def _decode(data: Any) -> Any:
+    """Decodes a symmetry analysis result from data created with :func:`_encode`."""
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if 'ndarray' in data:
+        return np.array(data['ndarray'], dtype=np.dtype(data['dtype']))
+    if 'wyckoff_set' in data:
+        wyckoff_set = WyckoffSet.__new__(WyckoffSet)
+        wyckoff_set.__dict__.update(
+            {key: _decode(item) for key, item in data['wyckoff_set'].items()}
+        )
+        return wyckoff_set
+
+    if 'system' in data:
+        data = data['system']
+        atoms: Atoms = System(
+            cell=_decode(data['cell']),
+            pbc=_decode(data['pbc']),
+            wyckoff_letters=_decode(data['wyckoff_letters']),
+            equivalent_atoms=_decode(data['equivalent_atoms']),
+        )
+    else:
+        data = data['atoms']
+        atoms = Atoms(cell=_decode(data['cell']), pbc=_decode(data['pbc']))
+    atoms.arrays = {key: _decode(array) for key, array in data['arrays'].items()}
+    return atoms
+
+
+class SymmetryAnalysis:
+    """
+    Provides the methods of a :class:`matid.SymmetryAnalyzer` that are used during
+    normalization on top of a dictionary of results. Only results that are not known
+    yet are computed with an analyzer for the given system. Results are returned as
+    copies, callers can modify them.
+    """
+
+    cached_methods = {
+        'get_space_group_number',
+        'get_space_group_international_short',
+        'get_hall_number',
+        'get_hall_symbol',
+        'get_point_group',
+        'get_crystal_system',
+        'get_bravais_lattice',
+        'get_conventional_system',
+        'get_primitive_system',
+        'get_wyckoff_letters_conventional',
+        'get_wyckoff_sets_conventional',
+        '_get_spglib_origin_shift',
+        '_get_spglib_transformation_matrix',
+    }
+
+    def __init__(
+        self,
+        system: Atoms,
+        symmetry_tol: float,
+        min_2d_thickness: float = 1,
+        results: Dict[tuple, Any] = None,
+        on_update: Callable[[tuple, Any], None] = None,
+    ):
+        self.system = system
+        self.symmetry_tol = symmetry_tol
+        self.min_2d_thickness = min_2d_thickness
+        self.results: Dict[tuple, Any] = {} if results is None else results
+        self._analyzer: Optional[SymmetryAnalyzer] = None
+        self._on_update = on_update
+
+    def __getattr__(self, name):
+        if name not in SymmetryAnalysis.cached_methods:
+            raise AttributeError(name)
+
+        def method(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            if key not in self.results:
+                if self._analyzer is None:
+                    self._analyzer = SymmetryAnalyzer(
+                        self.system, self.symmetry_tol, self.min_2d_thickness
+                    )
+                self.results[key] = getattr(self._analyzer, name)(*args, **kwargs)
+                if self._on_update is not None:
+                    self._on_update(key, self.results[key])
+
+            value = self.results[key]
+            if isinstance(value, (int, float, str)) or value is None:
+                return value
+            return copy.deepcopy(value)
+
+        return method
+
+
+class SymmetryCache:
+    """
+    A least recently used cache of symmetry analysis results by structure. Only the
+    reduced structures and results are kept, not the analyzed systems or analyzers.
+    Counts hits and misses. If no size or directory are given, the respective
+    configuration values are used.
+    """
+
+    def __init__(self, max_size: int = None, directory: str = None):
+        self._max_size = max_size
+        self._directory = directory
+        self._results: 'OrderedDict[str, Dict[tuple, Any]]' = OrderedDict()
+        self._structures: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._groups: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is None:
+            return config.normalize.symmetry_cache_size
+        return self._max_size
+
+    @property
+    def directory(self) -> Optional[str]:
+        if self._directory is None:
+            return config.normalize.symmetry_cache_directory
+        return self._directory
+
+    def _group_path(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, fingerprint[:2], fingerprint)
+
+    def _write(self, path: str, write: Callable[[Any], None]) -> None:
+        """Atomically writes a file that does not exist yet."""
+        if os.path.exists(path):
+            return
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _store_structure(
+        self, fingerprint: str, structure_id: str, structure: Tuple[np.ndarray, ...]
+    ) -> None:
+        cell, positions = structure
+        self._write(
+            os.path.join(self._group_path(fingerprint), f'{structure_id}.npz'),
+            lambda f: np.savez(f, cell=cell, positions=positions),
+        )
+
+    def _store_result(
+        self, fingerprint: str, structure_id: str, key: tuple, value: Any
+    ) -> None:
+        if not self.directory:
+            return
+        try:
+            data = json.dumps(dict(key=key, value=_encode(value))).encode()
+        except TypeError:
+            return
+        key_hash = hashlib.sha1(json.dumps(key).encode()).hexdigest()
+        self._write(
+            os.path.join(
+                self._group_path(fingerprint), structure_id, f'{key_hash}.json'
+            ),
+            lambda f: f.write(data),
+        )
+
+    def _load_results(self, fingerprint: str, structure_id: str) -> Dict[tuple, Any]:
+        results: Dict[tuple, Any] = {}
+        path = os.path.join(self._group_path(fingerprint), structure_id)
+        try:
+            file_names = os.listdir(path)
+        except OSError:
+            return results
+        for file_name in file_names:
+            if not file_name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(path, file_name), 'rb') as f:
+                    data = json.load(f)
+                name, args, kwargs = data['key']
+                key = (name, tuple(args), tuple(tuple(item) for item in kwargs))
+                results[key] = _decode(data['value'])
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        return results
+
+    def _find(
+        self,
+        fingerprint: str,
+        structure: Tuple[np.ndarray, np.ndarray],
+        pbc: np.ndarray,
+        symmetry_tol: float,
+    ) -> Optional[str]:
+        for structure_id in reversed(self._groups.get(fingerprint, [])):
+            if structures_match(
+                self._structures[structure_id], structure, pbc, symmetry_tol
+            ):
+                return structure_id
+        return None
+
+    def _find_on_disk(
+        self,
+        fingerprint: str,
+        structure: Tuple[np.ndarray, np.ndarray],
+        pbc: np.ndarray,
+        symmetry_tol: float,
+    ) -> Optional[str]:
+        if not self.directory:
+            return None
+        try:
+            file_names = os.listdir(self._group_path(fingerprint))
+        except OSError:
+            return None
+        for file_name in file_names:
+            if not file_name.endswith('.npz'):
+                continue
+            try:
+                with np.load(
+                    os.path.join(self._group_path(fingerprint), file_name),
+                    allow_pickle=False,
+                ) as data:
+                    other = (data['cell'], data['positions'])
+            except (OSError, ValueError, KeyError):
+                continue
+            if other[1].shape == structure[1].shape and structures_match(
+                other, structure, pbc, symmetry_tol
+            ):
+                return file_name[: -len('.npz')]
+        return None
+
+    def _add(
+        self,
+        fingerprint: str,
+        structure_id: str,
+        structure: Tuple[np.ndarray, np.ndarray],
+        results: Dict[tuple, Any],
+    ) -> None:
+        self._results[structure_id] = results
+        self._structures[structure_id] = structure
+        self._groups.setdefault(fingerprint, []).append(structure_id)
+        while len(self._results) > self.max_size:
+            evicted_id, _ = self._results.popitem(last=False)
+            del self._structures[evicted_id]
+            for group_fingerprint, group in list(self._groups.items()):
+                if evicted_id in group:
+                    group.remove(evicted_id)
+                    if not group:
+                        del self._groups[group_fingerprint]
+                    break
+
+    def get(
+        self, system: Atoms, symmetry_tol: float, min_2d_thickness: float = 1
+    ) -> SymmetryAnalysis:
+        """
+        Returns a symmetry analysis for the given system and parameters that is
+        backed by the cached results.
+        """
+        fingerprint = symmetry_fingerprint(system, symmetry_tol, min_2d_thickness)
+        structure = reduced_structure(system)
+        pbc = np.asarray(system.get_pbc(), dtype=bool)
+
+        with self._lock:
+            structure_id = self._find(fingerprint, structure, pbc, symmetry_tol)
+            if structure_id is not None:
+                results = self._results[structure_id]
+                self._results.move_to_end(structure_id)
+                self.hits += 1
+
+        if structure_id is None:
+            structure_id = self._find_on_disk(fingerprint, structure, pbc, symmetry_tol)
+            if structure_id is None:
+                structure_id = uuid.uuid4().hex
+                results = {}
+            else:
+                results = self._load_results(fingerprint, structure_id)
+
+            with self._lock:
+                if results:
+                    self.disk_hits += 1
+                else:
+                    self.misses += 1
+                self._add(fingerprint, structure_id, structure, results)
+
+        def on_update(key: tuple, value: Any) -> None:
+            if self.directory:
+                self._store_structure(fingerprint, structure_id, structure)
+                self._store_result(fingerprint, structure_id, key, value)
+
+        return SymmetryAnalysis(
+            system, symmetry_tol, min_2d_thickness, results, on_update
+        )
+
+    def clear(self) -> None:
+        """Removes all results from memory and resets the counters."""
+        with self._lock:
+            self._results.clear()
+            self._structures.clear()
+            self._groups.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return dict(
+            hits=self.hits,
+            disk_hits=self.disk_hits,
+            misses=self.misses,
+            size=len(self._results),
+        )
+
+
+symmetry_cache = SymmetryCache()
+
+
+def symmetry_analysis(system: Atoms, symmetry_tol: float, min_2d_thickness: float = 1):
+    """
+    Returns the symmetry analysis for the given system and parameters backed by the
+    process-wide cache. Returns a plain analyzer if the cache is disabled (size 0).
+    """
+    if symmetry_cache.max_size <= 0:
+        return SymmetryAnalyzer(system, symmetry_tol, min_2d_thickness)
+
+    return symmetry_cache.get(system, symmetry_tol, min_2d_thickness)
@@ -59,6 +59,7 @@ from nomad.normalizing.common import (
     material_id_2d,
     material_id_1d,
 )
+from nomad.normalizing.symmetry import symmetry_analysis
 
 conventional_description = 'The conventional cell of the material from which the subsystem is constructed from.'
 subsystem_description = 'Automatically detected subsystem.'
@@ -574,7 +575,7 @@ class TopologyNormalizer:
         """
         cell = cluster.get_cell()
         # A big tolerance is used here to allow deviations from exact symmetry
-        symm = SymmetryAnalyzer(cell, 1.0)
+        symm = symmetry_analysis(cell, 1.0)
         conv_system = symm.get_conventional_system()
         subsystem.atoms = nomad_atoms_from_ase_atoms(conv_system)
         spg_number = symm.get_space_group_number()
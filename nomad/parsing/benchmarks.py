@@ -0,0 +1,272 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import multiprocessing
+import tracemalloc
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from nomad import utils
+from nomad.metainfo import MSection, SubSection
+from nomad.metainfo import Quantity as MQuantity
+from nomad.parsing.file_parser import Quantity, TextParser
+from nomad.parsing.tabular import _sheet_dataframe, parse_table, read_table_data
+
+
+@pytest.fixture(scope='module')
+def mainfile(tmp_path_factory):
+    """An output file with repeated blocks of forces and eigenvalues."""
+    rng = np.random.default_rng(0)
+    path = tmp_path_factory.mktemp('text_parser') / 'output.txt'
+    with open(path, 'w') as f:
+        for step in range(20):
+            f.write(f'Step {step}\nForces:\n')
+            np.savetxt(f, rng.normal(size=(2000, 3)), fmt='%14.8f')
+            f.write('End forces\nEigenvalues:\n')
+            np.savetxt(f, rng.normal(size=(1000, 8)), fmt='%12.6f')
+            f.write('End eigenvalues\n')
+
+    return str(path)
+
+
+@pytest.mark.parametrize('dense', [False, True])
+def test_text_parser_numeric_blocks(benchmark, mainfile, dense):
+    def parse():
+        parser = TextParser(
+            mainfile,
+            quantities=[
+                Quantity(
+                    'forces',
+                    r'Forces:\s*([\s\S]+?)End forces',
+                    repeats=True,
+                    dtype=np.float64,
+                    shape=[-1, 3],
+                    dense=dense,
+                ),
+                Quantity(
+                    'eigenvalues',
+                    r'Eigenvalues:\s*([\s\S]+?)End eigenvalues',
+                    repeats=True,
+                    shape=[-1, 8],
+                    dense=dense,
+                ),
+            ],
+        )
+        return parser.get('forces'), parser.get('eigenvalues')
+
+    forces, eigenvalues = benchmark(parse)
+    assert len(forces) == len(eigenvalues) == 20
+    assert forces[0].shape == (2000, 3)
+    assert eigenvalues[0].shape == (1000, 8)
+
+
+@pytest.mark.parametrize('dtype', [None, np.float64])
+@pytest.mark.parametrize('dense', [False, True])
+def test_quantity_to_data(benchmark, dense, dtype):
+    block = '\n'.join(
+        ' '.join(f'{value:14.8f}' for value in row)
+        for row in np.random.default_rng(0).normal(size=(100000, 3))
+    )
+    quantity = Quantity('forces', r'(.+)', dtype=dtype, shape=[-1, 3], dense=dense)
+    forces = benchmark(quantity.to_data, block)
+    assert forces.shape == (100000, 3)
+
+
+@pytest.fixture(scope='module')
+def nested_mainfile(tmp_path_factory):
+    """A large output with a run, that contains steps, that contain SCF loops."""
+    rng = np.random.default_rng(0)
+    path = tmp_path_factory.mktemp('text_parser') / 'nested.txt'
+    with open(path, 'w') as f:
+        f.write('Run started\n')
+        for step in range(500):
+            f.write(f'Step {step}\nSCF started\n')
+            for iteration, energy in enumerate(rng.normal(size=200)):
+                f.write(f'  iteration {iteration:6d}  energy {energy:18.10f}\n')
+            f.write('SCF converged\nForces:\n')
+            np.savetxt(f, rng.normal(size=(500, 3)), fmt='%14.8f')
+            f.write('End forces\nEnd step\n')
+        f.write('Run finished\n')
+
+    return str(path)
+
+
+def get_peak_rss_increase(func) -> Optional[int]:
+    """
+    Calls the function and returns the increase of the peak resident set size in bytes
+    over the resident set size before the call. Only available on linux.
+    """
+
+    def read_status(key):
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(key):
+                    return int(line.split()[1]) * 1024
+
+    try:
+        rss = read_status('VmRSS:')
+        # resets the peak resident set size to the current one
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return None
+
+    func()
+    return read_status('VmHWM:') - rss
+
+
+def parse_nested(mainfile: str) -> list:
+    """Parses the SCF energies and forces of all steps of the nested mainfile."""
+    scf_parser = TextParser(
+        quantities=[
+            Quantity('energy', r'energy\s+([\d\.\-]+)', repeats=True),
+        ]
+    )
+    step_parser = TextParser(
+        quantities=[
+            Quantity(
+                'scf',
+                r'SCF started([\s\S]+?)SCF converged',
+                sub_parser=scf_parser,
+            ),
+            Quantity(
+                'forces',
+                r'Forces:\s*([\s\S]+?)End forces',
+                shape=[-1, 3],
+                dense=True,
+            ),
+        ]
+    )
+    run_parser = TextParser(
+        quantities=[
+            Quantity(
+                'step',
+                r'Step \d+\n([\s\S]+?)End step',
+                repeats=True,
+                sub_parser=step_parser,
+            )
+        ]
+    )
+    parser = TextParser(
+        mainfile,
+        quantities=[
+            Quantity(
+                'run',
+                r'Run started([\s\S]+?)Run finished',
+                sub_parser=run_parser,
+            )
+        ],
+    )
+    return [
+        (step.get('scf').get('energy'), step.get('forces'))
+        for step in parser.get('run').get('step')
+    ]
+
+
+def measure_peak_rss_increase(mainfile: str, window: bool, connection):
+    """
+    Sends the peak resident set size increase of parsing the nested mainfile through
+    the connection. Run in a fresh process to not reuse memory of earlier runs.
+    """
+    if not window:
+        TextParser._can_search_window = lambda self: False  # type: ignore
+
+    connection.send(get_peak_rss_increase(lambda: parse_nested(mainfile)))
+
+
+@pytest.mark.parametrize('window', [False, True])
+def test_text_parser_nested(benchmark, nested_mainfile, monkeypatch, window):
+    if not window:
+        monkeypatch.setattr(TextParser, '_can_search_window', lambda self: False)
+
+    def parse():
+        return parse_nested(nested_mainfile)
+
+    steps = parse()
+    assert len(steps) == 500
+    del steps
+
+    tracemalloc.start()
+    parse()
+    benchmark.extra_info['peak_memory'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    context = multiprocessing.get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=measure_peak_rss_increase, args=(nested_mainfile, window, sender)
+    )
+    process.start()
+    benchmark.extra_info['peak_rss_increase'] = receiver.recv()
+    process.join()
+
+    benchmark(parse)
+
+
+class TabularInner(MSection):
+    label = MQuantity(type=str, a_tabular=dict(name='label'))
+    length = MQuantity(type=np.float64, unit='m', a_tabular=dict(name='length'))
+
+
+class TabularRow(MSection):
+    index = MQuantity(type=np.int64, a_tabular=dict(name='index'))
+    value = MQuantity(type=np.float64, a_tabular=dict(name='value'))
+    title = MQuantity(type=str, a_tabular=dict(name='title'))
+    inner = SubSection(sub_section=TabularInner, repeats=True)
+
+
+@pytest.fixture(scope='module')
+def csv_files(tmp_path_factory):
+    """CSV files with 10^3, 10^4, and 10^5 rows for the columns of `TabularRow`."""
+    rng = np.random.default_rng(0)
+    paths = {}
+    for rows in [1000, 10000, 100000]:
+        path = tmp_path_factory.mktemp('tabular') / f'{rows}.archive.csv'
+        with open(path, 'w') as f:
+            f.write('index, value, title, label, length\n')
+            for index, value in enumerate(rng.normal(size=rows)):
+                f.write(f'{index}, {value}, title {index}, label, {value}\n')
+        paths[rows] = str(path)
+
+    return paths
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+@pytest.mark.parametrize('rows', [1000, 10000, 100000])
+def test_read_table_data(benchmark, csv_files, rows, columnar):
+    def read():
+        data = read_table_data(csv_files[rows], columnar=columnar)
+        return _sheet_dataframe(data)
+
+    assert benchmark(read).shape == (rows, 5)
+
+
+@pytest.mark.parametrize('from_columns', [False, True])
+@pytest.mark.parametrize('rows', [1000, 10000])
+def test_parse_table(benchmark, csv_files, rows, from_columns, monkeypatch):
+    if not from_columns:
+        monkeypatch.setattr(
+            'nomad.parsing.tabular._sections_from_columns', lambda *args: None
+        )
+    data = read_table_data(csv_files[rows], columnar=True)
+    logger = utils.get_logger(__name__)
+    sections = benchmark(parse_table, data, TabularRow.m_def, logger)
+    assert len(sections) == rows
+    assert sections[-1].inner[0].length is not None
@@ -16,9 +16,10 @@
 import mmap
 import io
 import re
+import warnings
 import numpy as np
 import pint
-from typing import List, Union, Callable, Type, Any
+from typing import List, Optional, Union, Callable, Type, Any, Tuple
 
 from nomad.parsing.file_parser import FileParser
 from nomad.metainfo import Quantity as mQuantity
@@ -108,6 +109,10 @@ class Quantity:
         repeats: denotes if multiple matches are expected
         convert: switch automatic data type conversion
         comment: character to denote a line to be ignored
+        dense: denotes that the matched blocks only contain whitespace separated
+            numbers, e.g. large tables of eigenvalues or forces. These are converted
+            with a single vectorized call. Blocks that cannot be converted this way
+            are converted as usual.
 
     """
 
@@ -155,6 +160,7 @@ class Quantity:
         self.flatten: bool = kwargs.get('flatten', True)
         self.reduce: bool = kwargs.get('reduce', True)
         self.comment: str = kwargs.get('comment', None)
+        self.dense: bool = kwargs.get('dense', False)
 
     @property
     def re_pattern(self):
@@ -170,6 +176,38 @@ class Quantity:
     def re_pattern(self, val: str):
         self._re_pattern = val
 
+    def _to_dense_data(self, val_raw: str) -> Optional[np.ndarray]:
+        """
+        Converts a block of whitespace separated numbers into an array with a single
+        vectorized call. Returns None if the block cannot be converted this way.
+        """
+        if self.str_operation is not None or not self.convert or not self.flatten:
+            return None
+
+        try:
+            dtype = np.dtype(float if self.dtype is None else self.dtype)
+        except TypeError:
+            return None
+        if dtype.kind not in 'iuf':
+            return None
+
+        try:
+            # numpy only warns about blocks that are not numbers
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                data = np.fromstring(val_raw, dtype=dtype, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+
+        # single values are reduced to scalars by the usual conversion
+        if data.size < 2:
+            return None
+
+        if self.dtype is None and np.all(np.mod(data, 1) == 0):
+            data = data.astype(int)
+
+        return data
+
     def to_data(self, val_raw: str):
         """
         Converts the parsed block into data.
@@ -220,18 +258,21 @@ class Quantity:
             if val_raw.strip()[0] == self.comment:
                 return
 
-        data: Any = val_raw
+        data: Any = self._to_dense_data(val_raw) if self.dense else None
 
-        if self.str_operation is not None:
-            data = self.str_operation(val_raw)
+        if data is None:
+            data = val_raw
 
-        elif self.flatten:
-            data = val_raw.strip().split()
-            if self.reduce:
-                data = data[0] if len(data) == 1 else data
+            if self.str_operation is not None:
+                data = self.str_operation(val_raw)
 
-        if self.convert:
-            data = convert(data)
+            elif self.flatten:
+                data = val_raw.strip().split()
+                if self.reduce:
+                    data = data[0] if len(data) == 1 else data
+
+            if self.convert:
+                data = convert(data)
 
         if isinstance(data, np.ndarray) and self.shape:
             try:
@@ -248,6 +289,10 @@ class Quantity:
         return f'{self.name}({", ".join(sub_quantities[:5])}{"..." if len(sub_quantities) > 5 else ""})'
 
 
+# constructs that match depending on the data before the start position
+re_depends_on_preceding = re.compile(rb'(?<![\[\\])\^|\\[AbB]|\(\?<[=!]')
+
+
 class TextParser(FileParser):
     """
     Parser for unstructured text files using the re module. The quantities to be parsed
@@ -263,6 +308,11 @@ class TextParser(FileParser):
         findall: if True will employ re.findall, otherwise re.finditer
         file_offset: offset in reading the file
         file_length: length of the chunk to be read from the file
+
+    Sub parsers do not get a copy of the matched block, if the block is a single
+    group and their patterns do not depend on the data before the block (``^``,
+    ``\\A``, ``\\b``, ``\\B``, lookbehinds). Instead, they search a window of the
+    data of their parent, e.g. its memory map.
     """
 
     def __init__(
@@ -281,6 +331,7 @@ class TextParser(FileParser):
         self._file_length: int = kwargs.get('file_length', 0)
         self._file_offset: int = kwargs.get('file_offset', 0)
         self._file_pad: int = 0
+        self._file_window: Optional[Tuple[int, int]] = None
         if quantities is None:
             self.init_quantities()
         # check quantity patterns are valid
@@ -325,9 +376,14 @@ class TextParser(FileParser):
         Sets the quantities list.
         """
         self._file_handler = None
+        self._file_window = None
         self._results = None
         self._quantities = val
 
+    def reset(self):
+        super().reset()
+        self._file_window = None
+
     @property
     def file_offset(self):
         """
@@ -362,24 +418,52 @@ class TextParser(FileParser):
     @property
     def file_mmap(self):
         """
-        Memory mapped representation of the file.
+        Memory mapped representation of the file. For sub parsers that search a
+        window of their parent's data, this is a copy of the window.
         """
+        if self._file_window is not None:
+            start, end = self._file_window
+            return self._file_handler[start:end]
+
         if self._file_handler is None:
             with self.open(self.mainfile) as f:
                 if isinstance(f, io.TextIOWrapper):
+                    # only the first page is copied to blank the padding
                     self._file_handler = mmap.mmap(
                         f.fileno(),
                         self._file_length,
-                        access=mmap.ACCESS_COPY,
+                        access=mmap.ACCESS_COPY if self._file_pad else mmap.ACCESS_READ,
                         offset=self._file_offset,
                     )
                     # set the extra chunk loaded before the intended offset to empty
-                    self._file_handler[: self._file_pad] = b' ' * self._file_pad
+                    if self._file_pad:
+                        self._file_handler[: self._file_pad] = b' ' * self._file_pad
                 else:
                     self._file_handler = f.read()
             self._file_pad = 0
         return self._file_handler
 
+    def _get_data(self) -> Tuple[Any, int, int]:
+        """
+        Returns the data to parse, and the start and end position of the part that is
+        parsed, i.e. the window of a sub parser.
+        """
+        if self._file_window is not None:
+            return (self._file_handler, *self._file_window)
+
+        data = self.file_mmap
+        return data, 0, 0 if data is None else len(data)
+
+    def _can_search_window(self) -> bool:
+        """
+        Returns True, if the patterns of all quantities match in a window of data as
+        in a copy of the window.
+        """
+        return not any(
+            re_depends_on_preceding.search(quantity.re_pattern.pattern)
+            for quantity in self.quantities
+        )
+
     def keys(self):
         """
         Returns all the quantity names.
@@ -434,7 +518,8 @@ class TextParser(FileParser):
                 self._re_findall = re_findall_b
 
         # map matches to quantities
-        matches = re.findall(re_findall_b, self.file_mmap)
+        data, start, end = self._get_data()
+        matches = re_findall_b.findall(data, start, end)
         current_index = 0
         for quantity in quantities:
             values = []
@@ -474,16 +559,38 @@ class TextParser(FileParser):
 
             self._add_value(quantity, values, units)
 
+    def _set_block(self, sub_parser: 'TextParser', res: re.Match):
+        """
+        Sets the non-empty matched groups as the data of a sub parser. A single group
+        is given as a window of the data of this parser, if the sub parser can search
+        it. Otherwise, the groups are joined into new bytes. They are sliced from a
+        memoryview of the parsed data, so they are only copied once into the result.
+        """
+        data, _, _ = self._get_data()
+        spans = [
+            res.span(index)
+            for index in range(1, res.re.groups + 1)
+            if res.start(index) < res.end(index)
+        ]
+        if len(spans) == 1 and sub_parser._can_search_window():
+            sub_parser._file_handler = data
+            sub_parser._file_window = spans[0]
+            return
+
+        data = memoryview(data)
+        sub_parser._file_handler = b' '.join([data[start:end] for start, end in spans])
+
     def _parse_quantity(self, quantity: Quantity):
         """
         Parse a single quantity.
         """
         value = []
         units = []
+        data, start, end = self._get_data()
         re_matches = (
-            quantity.re_pattern.finditer(self.file_mmap)
+            quantity.re_pattern.finditer(data, start, end)
             if quantity.repeats
-            else [quantity.re_pattern.search(self.file_mmap)]
+            else [quantity.re_pattern.search(data, start, end)]
         )
         for res in re_matches:
             if res is None:
@@ -492,7 +599,7 @@ class TextParser(FileParser):
                 sub_parser = quantity.sub_parser.copy()
                 sub_parser.mainfile = self.mainfile
                 sub_parser.logger = self.logger
-                sub_parser._file_handler = b' '.join([g for g in res.groups() if g])
+                self._set_block(sub_parser, res)
                 value.append(sub_parser.parse())
 
             else:
@@ -529,7 +636,7 @@ class TextParser(FileParser):
         if self._results is None:
             self._results = dict()
 
-        if self.file_mmap is None:
+        if self._file_window is None and self.file_mmap is None:
             return self
 
         if self.findall:
@@ -561,6 +668,7 @@ class TextParser(FileParser):
 
             # free up memory
             self._file_handler = b' '
+            self._file_window = None
 
         else:
             for quantity in self._quantities:
@@ -578,6 +686,7 @@ class TextParser(FileParser):
             if quantity.sub_parser is not None:
                 quantity.sub_parser.clear()
         self._file_handler = None
+        self._file_window = None
 
 
 class DataTextParser(TextParser):
@@ -15,8 +15,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import csv
 import os
-from typing import List, Dict, Callable, Set, Any, Tuple, Iterator, Union, Iterable
+from typing import (
+    List,
+    Dict,
+    Callable,
+    Set,
+    Any,
+    Tuple,
+    Iterator,
+    Union,
+    Iterable,
+    Optional,
+)
 
 import pandas as pd
 import re
@@ -154,7 +166,7 @@ class TableData(ArchiveSection):
 
         parsing_options = dict(annotation.parsing_options)
         with archive.m_context.raw_file(data_file) as f:
-            data = read_table_data(data_file, f, **parsing_options)
+            data = read_table_data(data_file, f, columnar=True, **parsing_options)
 
         mapping_options = annotation.mapping_options
         if mapping_options:
@@ -201,7 +213,7 @@ class TableData(ArchiveSection):
                                 if sheet_name not in list(data):
                                     continue
                                 try:
-                                    df = pd.DataFrame.from_dict(data.loc[0, sheet_name])
+                                    df = _sheet_dataframe(data, sheet_name)
                                     tmp = np.array(df.loc[:, col_name])
                                     self.m_set(
                                         quantity,
@@ -212,7 +224,7 @@ class TableData(ArchiveSection):
                             else:
                                 # Otherwise, assume the sheet_name is the first sheet of Excel/csv
                                 try:
-                                    df = pd.DataFrame.from_dict(data.iloc[0, 0])
+                                    df = _sheet_dataframe(data)
                                     tmp = np.array(df.loc[:, col_data])
                                     self.m_set(
                                         quantity,
@@ -606,9 +618,22 @@ def _get_relative_path(section_def) -> Iterator[str]:
     )
 
 
+@cached(LRUCache(maxsize=100))
+def _parse_unit(unit: str):
+    return ureg(unit)
+
+
 @cached(LRUCache(maxsize=10))
-def _create_column_to_quantity_mapping(section_def: Section):
-    mapping: Dict[str, Callable[[MSection, Any], MSection]] = {}
+def _get_column_definitions(
+    section_def: Section,
+) -> Dict[str, Tuple[Quantity, TabularAnnotation, List[Tuple[SubSection, Section]]]]:
+    """
+    Returns the quantities with their tabular annotation and the path of subsections
+    to them by the names of the columns they are mapped to.
+    """
+    definitions: Dict[
+        str, Tuple[Quantity, TabularAnnotation, List[Tuple[SubSection, Section]]]
+    ] = {}
 
     def add_section_def(section_def: Section, path: List[Tuple[SubSection, Section]]):
         properties: Set[Property] = set()
@@ -623,63 +648,13 @@ def _create_column_to_quantity_mapping(section_def: Section):
             if annotation and annotation.name:
                 col_name = annotation.name
 
-                if col_name in mapping:
+                if col_name in definitions:
                     raise MetainfoError(
                         f'The schema has non unique column names. {col_name} exists twice. '
                         f'Column names must be unique, to be used for tabular parsing.'
                     )
 
-                def set_value(
-                    section: MSection,
-                    value,
-                    section_path_to_top_subsection=[],
-                    path=path,
-                    quantity=quantity,
-                    annotation: TabularAnnotation = annotation,
-                ):
-                    for sub_section, section_def in path:
-                        next_section = None
-                        try:
-                            next_section = section.m_get_sub_section(sub_section, -1)
-                        except (KeyError, IndexError):
-                            pass
-                        if not next_section:
-                            next_section = section_def.section_cls()
-                            section.m_add_sub_section(sub_section, next_section, -1)
-                        section = next_section
-
-                    if annotation and annotation.unit:
-                        value *= ureg(annotation.unit)
-
-                    # NaN values are not supported in the metainfo. Set as None
-                    # which means that they are not stored.
-                    if isinstance(value, float) and math.isnan(value):
-                        value = None
-
-                    if isinstance(value, (int, float, str, pd.Timestamp)):
-                        value = np.array([value])
-
-                    if value is not None:
-                        if len(value.shape) == 1 and len(quantity.shape) == 0:
-                            if len(value) == 1:
-                                value = value[0]
-                            elif len(value) == 0:
-                                value = None
-                            else:
-                                raise MetainfoError(
-                                    f'The shape of {quantity.name} does not match the given data.'
-                                )
-                        elif len(value.shape) != len(quantity.shape):
-                            raise MetainfoError(
-                                f'The shape of {quantity.name} does not match the given data.'
-                            )
-
-                    section.m_set(quantity, value)
-                    _section_path_list: List[str] = list(_get_relative_path(section))
-                    _section_path_str: str = '/'.join(_section_path_list)
-                    section_path_to_top_subsection.append(_section_path_str)
-
-                mapping[col_name] = set_value
+                definitions[col_name] = (quantity, annotation, path)
 
         for sub_section in section_def.all_sub_sections.values():
             if sub_section in properties:
@@ -698,6 +673,84 @@ def _create_column_to_quantity_mapping(section_def: Section):
             )
 
     add_section_def(section_def, [])
+    return definitions
+
+
+def _get_path_section(
+    section: MSection, path: List[Tuple[SubSection, Section]]
+) -> MSection:
+    """
+    Returns the last subsection along the given path. Missing subsections are
+    created.
+    """
+    for sub_section, section_def in path:
+        next_section = None
+        try:
+            next_section = section.m_get_sub_section(sub_section, -1)
+        except (KeyError, IndexError):
+            pass
+        if not next_section:
+            next_section = section_def.section_cls()
+            section.m_add_sub_section(sub_section, next_section, -1)
+        section = next_section
+
+    return section
+
+
+@cached(LRUCache(maxsize=10))
+def _create_column_to_quantity_mapping(section_def: Section):
+    mapping: Dict[str, Callable[[MSection, Any], MSection]] = {}
+
+    for col_name, (quantity, annotation, path) in _get_column_definitions(
+        section_def
+    ).items():
+
+        def set_value(
+            section: MSection,
+            value,
+            *,
+            section_path_to_top_subsection: List[str] = None,
+            path=path,
+            quantity=quantity,
+            annotation: TabularAnnotation = annotation,
+            dimensions=len(quantity.shape),
+        ):
+            section = _get_path_section(section, path)
+
+            if annotation and annotation.unit:
+                value *= _parse_unit(annotation.unit)
+
+            # NaN values are not supported in the metainfo. Set as None
+            # which means that they are not stored.
+            if isinstance(value, float) and math.isnan(value):
+                value = None
+
+            if isinstance(value, (int, float, str, pd.Timestamp)):
+                value = np.array([value])
+
+            if value is not None:
+                if len(value.shape) == 1 and dimensions == 0:
+                    if len(value) == 1:
+                        value = value[0]
+                    elif len(value) == 0:
+                        value = None
+                    else:
+                        raise MetainfoError(
+                            f'The shape of {quantity.name} does not match the given data.'
+                        )
+                elif len(value.shape) != dimensions:
+                    raise MetainfoError(
+                        f'The shape of {quantity.name} does not match the given data.'
+                    )
+
+            section.m_set(quantity, value)
+            if section_path_to_top_subsection is not None:
+                _section_path_list: List[str] = list(_get_relative_path(section))
+                _section_path_str: str = '/'.join(_section_path_list)
+                section_path_to_top_subsection.append(_section_path_str)
+
+        mapping[col_name] = set_value
+
     return mapping
 
 
@@ -709,6 +762,17 @@ def parse_columns(pd_dataframe, section: MSection):
     import pandas as pd
 
     data: pd.DataFrame = pd_dataframe
+    sheets: Dict[Union[str, int], pd.DataFrame] = {}
+
+    def get_sheet(sheet_name: Union[str, int]) -> pd.DataFrame:
+        if sheet_name not in sheets:
+            df = _sheet_dataframe(data, sheet_name)
+
+            # trimming the column names from leading/trailing white-spaces
+            _strip_whitespaces_from_df_columns(df)
+            sheets[sheet_name] = df
+
+        return sheets[sheet_name]
 
     mapping = _create_column_to_quantity_mapping(section.m_def)  # type: ignore
     for column in mapping:
@@ -720,17 +784,10 @@ def parse_columns(pd_dataframe, section: MSection):
                     f"The sheet name {sheet_name} doesn't exist in the excel file"
                 )
 
-            df = pd.DataFrame.from_dict(data.loc[0, sheet_name])
-
-            # trimming the column names from leading/trailing white-spaces
-            _strip_whitespaces_from_df_columns(df)
-            mapping[column](section, df.loc[:, col_name])
+            mapping[column](section, get_sheet(sheet_name).loc[:, col_name])
         else:
             # Otherwise, assume the sheet_name is the first sheet of Excel/csv
-            df = pd.DataFrame.from_dict(data.iloc[0, 0])
-
-            # trimming the column names from leading/trailing white-spaces
-            _strip_whitespaces_from_df_columns(df)
+            df = get_sheet(0)
             if column in df:
                 mapping[column](section, df.loc[:, column])
 
@@ -759,11 +816,7 @@ def parse_table(pd_dataframe, section_def: Section, logger):
         if '/' in column:
             sheet_name = column.split('/')[0]
 
-    df = pd.DataFrame.from_dict(
-        data.loc[0, sheet_name]
-        if isinstance(sheet_name, str)
-        else data.iloc[0, sheet_name]
-    )
+    df = _sheet_dataframe(data, sheet_name)
 
     # trimming the column names from leading/trailing white-spaces
     _strip_whitespaces_from_df_columns(df)
@@ -785,43 +838,71 @@ def parse_table(pd_dataframe, section_def: Section, logger):
         except Exception:
             continue
 
+    # The columns that are mapped for each column index. They are resolved once and
+    # the cells are taken from the rows of one array, instead of a series per row.
+    mapped_columns: List[List[Tuple[str, str, Any]]] = []
+    for col_index in range(0, max_no_of_repeated_columns + 1):
+        mapped_columns.append([])
+        for column in mapping:
+            col_name = column.split('/')[1] if '/' in column else column
+            col_name = f'{col_name}.{col_index}' if col_index > 0 else col_name
+            if col_name in df:
+                mapped_columns[col_index].append(
+                    (column, col_name, df.columns.get_loc(col_name))
+                )
+
+    # The sections of all rows are created at once from the columns of scalar
+    # quantities. All other cells are set one by one.
+    row_sections = None
+    from_columns = _sections_from_columns(df, section_def, mapped_columns[0])
+    if from_columns is not None:
+        row_sections, set_columns = from_columns
+        mapped_columns[0] = [
+            mapped_column
+            for mapped_column in mapped_columns[0]
+            if mapped_column[0] not in set_columns
+        ]
+
+    # These are the same values that rows of `df.iterrows()` would have
+    values = df.values
+    if values.dtype.kind in 'mM':
+        values = df.astype(object).values
+
     path_quantities_to_top_subsection: Set[str] = set()
-    for row_index, row in df.iterrows():
+    for row_position, (row_index, row) in enumerate(zip(df.index, values)):
         for col_index in range(0, max_no_of_repeated_columns + 1):
-            section = section_def.section_cls()
+            if row_sections is not None and col_index == 0:
+                section = row_sections[row_position]
+            else:
+                section = section_def.section_cls()
             try:
-                for column in mapping:
-                    col_name = column.split('/')[1] if '/' in column else column
-                    col_name = f'{col_name}.{col_index}' if col_index > 0 else col_name
-
-                    if col_name in df:
-                        try:
-                            temp_quantity_path_container: List[str] = []
-                            mapping[column](
-                                section,
-                                row[col_name],
-                                section_path_to_top_subsection=temp_quantity_path_container,
-                            )
-                        except Exception as e:
-                            logger.error(
-                                'could not parse cell',
-                                details=dict(row=row_index, column=col_name),
-                                exc_info=e,
-                            )
-                        if (
-                            col_index > 0
-                            and temp_quantity_path_container[0].split('/')[1:]
-                        ):
-                            path_quantities_to_top_subsection.update(
-                                temp_quantity_path_container
-                            )
-                        elif (
-                            col_index > 0
-                            and not temp_quantity_path_container[0].split('/')[1:]
-                        ):
-                            raise TabularParserError(
-                                f'there is a repeated column {column} that is not placed into a subsection in the schema. Please fix the schema.'
-                            )
+                for column, col_name, col_loc in mapped_columns[col_index]:
+                    try:
+                        temp_quantity_path_container: List[str] = (
+                            [] if col_index > 0 else None
+                        )
+                        mapping[column](
+                            section,
+                            row[col_loc],
+                            section_path_to_top_subsection=temp_quantity_path_container,
+                        )
+                    except Exception as e:
+                        logger.error(
+                            'could not parse cell',
+                            details=dict(row=row_index, column=col_name),
+                            exc_info=e,
+                        )
+                    if col_index > 0 and temp_quantity_path_container[0].split('/')[1:]:
+                        path_quantities_to_top_subsection.update(
+                            temp_quantity_path_container
+                        )
+                    elif (
+                        col_index > 0
+                        and not temp_quantity_path_container[0].split('/')[1:]
+                    ):
+                        raise TabularParserError(
+                            f'there is a repeated column {column} that is not placed into a subsection in the schema. Please fix the schema.'
+                        )
             except Exception as e:
                 logger.error(
                     'could not parse row', details=dict(row=row_index), exc_info=e
@@ -848,6 +929,60 @@ def parse_table(pd_dataframe, section_def: Section, logger):
     return sections
 
 
+def _sections_from_columns(
+    df, section_def: Section, mapped_columns: List[Tuple[str, str, Any]]
+) -> Optional[Tuple[List[MSection], Set[str]]]:
+    """
+    Creates the sections for all rows and sets the values of all scalar quantities
+    without a tabular unit from whole columns. The (sub)sections that hold these
+    quantities are created with :func:`MSection.m_from_columns`.
+
+    Returns the sections and the names of the columns that were set. Returns None,
+    if there are no such columns, or if some cells cannot be set. These are set (and
+    their errors logged) one by one instead.
+    """
+    definitions = _get_column_definitions(section_def)
+    columns: Dict[Tuple[Tuple[SubSection, Section], ...], Dict[str, Any]] = {}
+    for column, _, col_loc in mapped_columns:
+        quantity, annotation, path = definitions[column]
+        if annotation.unit or len(quantity.shape) != 0 or quantity.derived is not None:
+            continue
+        values = df.iloc[:, col_loc].to_numpy()
+        # NaN values are not supported in the metainfo and are not set
+        is_na = pd.isna(values)
+        if is_na.any():
+            values = values.astype(object)
+            values[is_na] = None
+        columns.setdefault(tuple(path), {})[column] = (quantity.name, values)
+
+    if not columns:
+        return None
+
+    path_sections: Dict[Tuple[Tuple[SubSection, Section], ...], List[MSection]] = {}
+    try:
+        for path, path_columns in columns.items():
+            path_section_def = path[-1][1] if path else section_def
+            path_sections[path] = path_section_def.section_cls.m_from_columns(
+                **{name: values for name, values in path_columns.values()}
+            )
+    except Exception:
+        return None
+
+    sections = path_sections.pop(
+        (), [section_def.section_cls() for _ in range(len(df))]
+    )
+    for path, sub_sections in path_sections.items():
+        *parent_path, (sub_section, _) = path
+        for section, sub_section_value in zip(sections, sub_sections):
+            _get_path_section(section, parent_path).m_add_sub_section(
+                sub_section, sub_section_value, -1
+            )
+
+    return sections, {
+        column for path_columns in columns.values() for column in path_columns
+    }
+
+
 def _strip_whitespaces_from_df_columns(df):
     transformed_column_names: Dict[str, str] = {}
     for col_name in list(df.columns):
@@ -885,6 +1020,61 @@ def _append_subsections_from_section(
         _append_subsections_from_section(section_name, target_section, source_section)
 
 
+def _sniff_csv_separator(f, comment: str = None, skiprows=None) -> str:
+    """
+    Determines the separator from the first line that is not skipped, like the python
+    engine of `pd.read_csv` does without a given separator. Restores the position of
+    the given text file.
+    """
+    if isinstance(skiprows, int):
+        skiprows = range(skiprows)
+    skip = set(skiprows) if skiprows else set()
+
+    position = f.tell()
+    index = 0
+    while True:
+        line = f.readline()
+        if comment is not None and comment in line:
+            line = line[: line.find(comment)]
+            if not line:
+                index += 1
+                continue
+        if index not in skip:
+            break
+        index += 1
+    f.seek(position)
+
+    return csv.Sniffer().sniff(line).delimiter
+
+
+def _read_csv(file_or_path, comment: str = None, sep: str = None, skiprows=None):
+    """
+    Reads a CSV file with the C engine of pandas. Without a separator, the separator is
+    sniffed like the python engine would. Regular expression separators and files the
+    C engine fails on are read with the python engine.
+    """
+    options: Dict[str, Any] = dict(
+        comment=comment, skiprows=skiprows, skipinitialspace=True
+    )
+    if sep is None or len(sep) == 1:
+        position = None
+        try:
+            if not isinstance(file_or_path, str):
+                position = file_or_path.tell()
+            delimiter = sep
+            if delimiter is None and position is None:
+                with open(file_or_path, encoding='utf-8', newline='') as f:
+                    delimiter = _sniff_csv_separator(f, comment, skiprows)
+            elif delimiter is None:
+                delimiter = _sniff_csv_separator(file_or_path, comment, skiprows)
+            return pd.read_csv(file_or_path, engine='c', sep=delimiter, **options)
+        except Exception:
+            if position is not None:
+                file_or_path.seek(position)
+
+    return pd.read_csv(file_or_path, engine='python', sep=sep, **options)
+
+
 def read_table_data(
     path,
     file_or_path=None,
@@ -892,42 +1082,64 @@ def read_table_data(
     sep: str = None,
     skiprows: Union[list[int], int] = None,
     separator: str = None,
+    *,
+    columnar: bool = False,
 ):
+    """
+    Reads an Excel or CSV file into a dataframe with a single row and a column for each
+    sheet (a single column `0` for CSV files). The cells contain the data of the sheets
+    as dicts of columns, or as dataframes if `columnar` is set. Use `_sheet_dataframe`
+    to get the data of a sheet in both cases.
+    """
     import pandas as pd
 
-    df = pd.DataFrame()
-
     if file_or_path is None:
         file_or_path = path
 
+    sheets: Dict[Union[str, int], pd.DataFrame] = {}
     if path.endswith('.xls') or path.endswith('.xlsx'):
         excel_file: pd.ExcelFile = pd.ExcelFile(
             file_or_path if isinstance(file_or_path, str) else file_or_path.name
         )
         for sheet_name in excel_file.sheet_names:
-            df.loc[0, sheet_name] = [
-                pd.read_excel(
-                    excel_file,
-                    skiprows=skiprows,
-                    sheet_name=sheet_name,
-                    comment=comment,
-                ).to_dict()
-            ]
-    else:
-        df.loc[0, 0] = [
-            pd.read_csv(
-                file_or_path,
-                engine='python',
-                comment=comment,
-                sep=sep if sep else separator,
+            sheets[sheet_name] = pd.read_excel(
+                excel_file,
                 skiprows=skiprows,
-                skipinitialspace=True,
-            ).to_dict()
-        ]
+                sheet_name=sheet_name,
+                comment=comment,
+            )
+    else:
+        sheets[0] = _read_csv(
+            file_or_path,
+            comment=comment,
+            sep=sep if sep else separator,
+            skiprows=skiprows,
+        )
+
+    df = pd.DataFrame(index=[0], columns=list(sheets), dtype=object)
+    for sheet_name, sheet in sheets.items():
+        df.at[0, sheet_name] = sheet if columnar else sheet.to_dict()
 
     return df
 
 
+def _sheet_dataframe(data, sheet_name: Union[str, int] = 0):
+    """
+    Returns a new dataframe for a sheet of the data read with `read_table_data`. A
+    string is the name of the sheet and an int the index of the sheet.
+    """
+    sheet = (
+        data.loc[0, sheet_name]
+        if isinstance(sheet_name, str)
+        else data.iloc[0, sheet_name]
+    )
+    if isinstance(sheet, pd.DataFrame):
+        # a shallow copy, renaming its columns does not change the read data
+        return sheet.copy(deep=False)
+
+    return pd.DataFrame.from_dict(sheet)
+
+
 class TabularDataParser(MatchingParser):
     creates_children = True
 
@@ -968,8 +1180,6 @@ class TabularDataParser(MatchingParser):
     ) -> Union[bool, Iterable[str]]:
         # We use the main file regex capabilities of the superclass to check if this is a
         # .csv file
-        import pandas as pd
-
         is_tabular = super().is_mainfile(
             filename, mime, buffer, decoded_buffer, compression
         )
@@ -977,11 +1187,11 @@ class TabularDataParser(MatchingParser):
             return False
 
         try:
-            data = read_table_data(filename)
+            data = read_table_data(filename, columnar=True)
         except Exception:
             # If this cannot be parsed as a .csv file, we don't match with this file
             return False
-        data = pd.DataFrame.from_dict(data.iloc[0, 0])
+        data = _sheet_dataframe(data)
         return [str(item) for item in range(0, data.shape[0])]
 
     def parse(self, logger=None, **kwargs):
@@ -48,6 +48,7 @@ from mongoengine import (
     DateTimeField,
     BooleanField,
     IntField,
+    FloatField,
     ListField,
     DictField,
     EmbeddedDocument,
@@ -98,7 +99,7 @@ from nomad.processing.base import (
 )
 from nomad.parsing import Parser
 from nomad.parsing.parsers import parser_dict, match_parser
-from nomad.normalizing import normalizers
+from nomad.normalizing import normalizers, run_normalizers
 from nomad.datamodel import (
     EntryArchive,
     EntryMetadata,
@@ -109,6 +110,7 @@ from nomad.datamodel import (
     AuthLevel,
     ServerContext,
 )
+from nomad.datamodel.hdf5 import hdf5_write_session
 from nomad.archive import (
     write_partial_archive_to_mongo,
     delete_partial_archives_from_mongo,
@@ -883,6 +885,20 @@ class Timestamp(EmbeddedDocument):
     tsa_server = StringField()
 
 
+class NormalizerStats(EmbeddedDocument):
+    """
+    The resources used by a normalizer during the last processing of an entry,
+    see :func:`nomad.normalizing.run_normalizer`.
+    """
+
+    normalizer = StringField()
+    wall_time = FloatField()
+    cpu_time = FloatField()
+    peak_rss_increase = IntField()
+    time_budget = FloatField()
+    interrupted = BooleanField()
+
+
 class Entry(Proc):
     """
     Instances of this class represent entries. This class manages the elastic
@@ -912,6 +928,8 @@ class Entry(Proc):
         entry_coauthors: a user provided list of co-authors specific for this entry. Note
             that normally, coauthors should be set on the upload level.
         datasets: a list of user curated datasets this entry belongs to
+        normalizer_stats: the resources used by each normalizer during the last
+            processing
     """
 
     upload_id = StringField(required=True)
@@ -933,6 +951,7 @@ class Entry(Proc):
     datasets = ListField(StringField())
 
     entry_timestamp = EmbeddedDocumentField(Timestamp)
+    normalizer_stats = ListField(EmbeddedDocumentField(NormalizerStats))
 
     meta: Any = {
         'strict': False,
@@ -1155,7 +1174,9 @@ class Entry(Proc):
                 else:
                     assert False, f'Cannot set metadata quantity: {key}'
 
-    def full_entry_metadata(self, upload: 'Upload') -> EntryMetadata:
+    def full_entry_metadata(
+        self, upload: 'Upload', lazy: bool = False
+    ) -> EntryMetadata:
         """
         Returns a complete set of :class:`EntryMetadata` including
         both the mongo metadata and the metadata from the archive.
@@ -1163,30 +1184,39 @@ class Entry(Proc):
         Arguments:
             upload: The :class:`Upload` to which this entry belongs. Upload level metadata
                 and the archive files will be read from this object.
+            lazy: Only deserialize the subsections of the archive when they are accessed.
+                This is only used for published uploads, where all entries share one
+                archive reader. The reader is then kept open and the returned metadata
+                can only be used until the upload files are closed.
         """
         assert upload.upload_id == self.upload_id, 'Mismatching upload_id encountered'
+        lazy = lazy and isinstance(upload.upload_files, PublicUploadFiles)
         try:
             # instead of loading the whole archive, it should be enough to load the
             # parts that are referenced by section_metadata/EntryMetadata
             # TODO somehow it should determine which root sections too load from the metainfo
             # or configuration
-            with upload.upload_files.read_archive(self.entry_id) as archive:
+            archive = upload.upload_files.read_archive(self.entry_id)
+            try:
                 entry_archive = archive[self.entry_id]
-                entry_archive_dict = {
-                    section_metadata: to_json(entry_archive[section_metadata])
-                }
+                entry_archive_dict = {section_metadata: entry_archive[section_metadata]}
                 if section_workflow in entry_archive:
-                    entry_archive_dict[section_workflow] = to_json(
-                        entry_archive[section_workflow]
-                    )
+                    entry_archive_dict[section_workflow] = entry_archive[
+                        section_workflow
+                    ]
                 if section_results in entry_archive:
-                    entry_archive_dict[section_results] = to_json(
-                        entry_archive[section_results]
-                    )
-                entry_metadata = datamodel.EntryArchive.m_from_dict(entry_archive_dict)[
-                    section_metadata
-                ]
-                self._apply_metadata_from_mongo(upload, entry_metadata)
+                    entry_archive_dict[section_results] = entry_archive[section_results]
+                if not lazy:
+                    entry_archive_dict = {
+                        key: to_json(value) for key, value in entry_archive_dict.items()
+                    }
+                entry_metadata = datamodel.EntryArchive.m_from_dict(
+                    entry_archive_dict, lazy=lazy
+                )[section_metadata]
+            finally:
+                if not lazy:
+                    archive.close()
+            self._apply_metadata_from_mongo(upload, entry_metadata)
         except KeyError:
             # Due to hard processing failures, it might be possible that an entry might not
             # have an archive. Return the metadata that is available.
@@ -1349,10 +1379,13 @@ class Entry(Proc):
                     'Have you placed many mainfiles in the same directory?'
                 )
 
-            self.parsing()
-            for entry in self._main_and_child_entries():
-                entry.normalizing()
-                entry.archiving()
+            # HDF5 files written by parsers, normalizers and the archive serialization
+            # are opened once and flushed when the entry is archived
+            with hdf5_write_session(self.upload.archive_context):
+                self.parsing()
+                for entry in self._main_and_child_entries():
+                    entry.normalizing()
+                    entry.archiving()
 
         elif self.upload.published:
             self.set_last_status_message('Preserving entry data')
@@ -1521,30 +1554,45 @@ class Entry(Proc):
                 datamodel.EntryArchive.metadata, self._entry_metadata
             )
 
-        for normalizer in normalizers:
-            if (
-                normalizer.domain is not None
-                and normalizer.domain != parser_dict[self.parser_name].domain
-            ):
-                continue
+        def get_normalizer_logger(normalizer):
+            return self.get_logger(
+                normalizer=normalizer.__name__, step=normalizer.__name__
+            )
 
+        domain = parser_dict[self.parser_name].domain
+        self.normalizer_stats = []
+        for normalizer, stats, error in run_normalizers(
+            [
+                normalizer
+                for normalizer in normalizers
+                if normalizer.domain is None or normalizer.domain == domain
+            ],
+            self._parser_results,
+            get_normalizer_logger,
+        ):
             normalizer_name = normalizer.__name__
             context = dict(normalizer=normalizer_name, step=normalizer_name)
-            logger = self.get_logger(**context)
+            logger = get_normalizer_logger(normalizer)
 
-            with utils.timer(
-                logger, 'normalizer executed', input_size=self.mainfile_file.size
-            ):
-                try:
-                    normalizer(self._parser_results).normalize(logger=logger)
-                    logger.info('normalizer completed successfully', **context)
-                except Exception as e:
-                    raise ProcessFailure(
-                        'normalizer failed with exception',
-                        exc_info=e,
-                        error=str(e),
-                        **context,
-                    )
+            if error is not None:
+                raise ProcessFailure(
+                    'normalizer failed with exception',
+                    exc_info=error,
+                    error=str(error),
+                    **context,
+                )
+
+            self.normalizer_stats.append(NormalizerStats(**stats))
+            if not stats['interrupted']:
+                logger.info('normalizer completed successfully', **context)
+            logger.info(
+                'normalizer executed',
+                input_size=self.mainfile_file.size,
+                exec_time=stats['wall_time'],
+                cpu_time=stats['cpu_time'],
+                peak_rss_increase=stats['peak_rss_increase'],
+                interrupted=stats['interrupted'],
+            )
 
         parser = parser_dict[self.parser_name]
         try:
@@ -2613,6 +2661,11 @@ class Upload(Proc):
 
         self.reprocess_settings = None  # Don't need this anymore
 
+        if not self.published:
+            deleted = self.staging_upload_files.delete_abandoned_chunked_uploads()
+            if deleted:
+                logger.info('deleted abandoned chunked uploads', n_deleted=deleted)
+
         if self.published:
             # We have reprocessed an already published upload
             logger.info('started to repack re-processed upload')
@@ -2805,11 +2858,13 @@ class Upload(Proc):
         """
         This is the :py:mod:`nomad.datamodel` transformation method to transform
         processing upload's entries into list of :class:`EntryMetadata` objects.
+        With `archive.lazy_loading`, the archives of published uploads are only
+        deserialized when they are accessed within this context.
         """
         try:
             # read all entry objects first to avoid missing cursor errors
             yield [
-                entry.full_entry_metadata(self)
+                entry.full_entry_metadata(self, lazy=config.archive.lazy_loading)
                 for entry in list(Entry.objects(upload_id=self.upload_id))
             ]
 
@@ -38,7 +38,7 @@ Depending on the configuration all logs will also be send to a central logstash.
 .. autofunc::nomad.utils.strip
 """
 
-from typing import List, Iterable, Union, Any, Dict
+from typing import List, Iterable, Union, Any, Dict, Callable
 from collections import OrderedDict
 from functools import reduce
 from itertools import takewhile
@@ -338,6 +338,64 @@ def chunks(list, n):
         yield list[i : i + n]
 
 
+def fork_map(func: Callable, args: Iterable[tuple], processes: int) -> List[Any]:
+    """
+    Calls `func` with each of the given argument tuples and returns the results in
+    order. With more than one process, the calls are distributed over forked billiard
+    processes. Unlike :mod:`multiprocessing` processes, these can also be started
+    from daemonic processes, e.g. celery prefork workers. An exception of one of the
+    calls is raised after all processes have finished.
+    """
+    args = list(args)
+    processes = min(processes, len(args))
+    if processes <= 1:
+        return [func(*call_args) for call_args in args]
+
+    # delayed import, billiard is only available with the infrastructure dependencies
+    import billiard
+
+    context = billiard.get_context('fork')
+
+    def run(connection, indices):
+        try:
+            connection.send((True, [func(*args[index]) for index in indices]))
+        except BaseException as e:
+            connection.send((False, e))
+        finally:
+            connection.close()
+
+    workers = []
+    for offset in range(processes):
+        indices = list(range(offset, len(args), processes))
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=run, args=(sender, indices), daemon=True)
+        process.start()
+        sender.close()
+        workers.append((process, receiver, indices))
+
+    results: List[Any] = [None] * len(args)
+    error: BaseException = None
+    for process, receiver, indices in workers:
+        try:
+            success, value = receiver.recv()
+        except EOFError:
+            success, value = False, RuntimeError('forked process exited unexpectedly')
+        finally:
+            receiver.close()
+            process.join()
+
+        if not success:
+            error = error or value
+            continue
+        for index, result in zip(indices, value):
+            results[index] = result
+
+    if error is not None:
+        raise error
+
+    return results
+
+
 class SleepTimeBackoff:
     """
     Provides increasingly larger sleeps. Useful when
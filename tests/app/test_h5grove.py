@@ -79,3 +79,20 @@ def test_h5grove(
     assert resp.status_code == status_code
     if status_code == 200:
         assert resp.content == b'"test"'
+
+
+def test_h5grove_modified_file(
+    auth_headers, h5grove_api, upload_id, proc_infra, example_data_nxs
+):
+    file_path = f'{StagingUploadFiles(upload_id=upload_id, create=True)._raw_dir}{os.sep}test.h5'
+    for data in ['test', 'modified' * 100]:
+        with h5py.File(file_path, 'w') as h5file:
+            h5file.create_dataset('entry', data=data)
+        # The second request reuses the open file, until it is modified
+        for _ in range(2):
+            resp = h5grove_api.get(
+                f'/data/?file=test.h5&path=/entry&upload_id={upload_id}&source=raw',
+                headers=auth_headers['user1'],
+            )
+            assert resp.status_code == 200
+            assert resp.content == f'"{data}"'.encode()
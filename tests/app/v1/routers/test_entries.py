@@ -900,6 +900,26 @@ def example_data_with_compressed_files(
         pytest.param(
             'id_01', 'mainfile.json', {'offset': 1000000}, 200, id='offset-too-large'
         ),
+        pytest.param(
+            'id_01', 'mainfile.json', {'range': 'bytes=10-19'}, 206, id='range'
+        ),
+        pytest.param(
+            'id_01', 'mainfile.json', {'range': 'bytes=-10'}, 206, id='range-suffix'
+        ),
+        pytest.param(
+            'id_01',
+            'mainfile.json',
+            {'range': 'bytes=1000000-'},
+            416,
+            id='range-not-satisfiable',
+        ),
+        pytest.param(
+            'id_01',
+            'mainfile.json',
+            {'range': 'bytes=0-1,5-6'},
+            200,
+            id='multiple-ranges-ignored',
+        ),
         pytest.param('id_01', 'mainfile.json', {'offset': -1}, 422, id='bad-offset'),
         pytest.param('id_01', 'mainfile.json', {'length': -1}, 422, id='bad-length'),
         pytest.param(
@@ -933,6 +953,20 @@ def example_data_with_compressed_files(
             200,
             id='decompress-gz-unpublished',
         ),
+        pytest.param(
+            'with_compr_published',
+            'mainfile.xz',
+            {'decompress': True, 'offset': 5, 'length': 7},
+            200,
+            id='decompress-xz-offset-length',
+        ),
+        pytest.param(
+            'with_compr_unpublished',
+            'mainfile.gz',
+            {'decompress': True, 'offset': 5, 'length': 7, 'user': 'user1'},
+            200,
+            id='decompress-gz-offset-length',
+        ),
         pytest.param('id_unpublished', 'mainfile.json', {}, 404, id='404-unpublished'),
         pytest.param(
             'id_embargo_1', 'mainfile.json', {}, 404, id='404-embargo-no-user'
@@ -981,13 +1015,23 @@ def test_entry_raw_file(
     user = params.get('user')
     if user:
         del params['user']
+    headers = dict(auth_headers[user] or {})
+    range_header = params.pop('range', None)
+    if range_header:
+        headers['Range'] = range_header
 
     response = client.get(
         f'entries/{entry_id}/raw/{path}?{urlencode(params, doseq=True)}',
-        headers=auth_headers[user],
+        headers=headers,
     )
 
     assert_response(response, status_code)
+    if status_code == 206:
+        size = len(example_mainfile_contents)
+        start, end = range_header[len('bytes=') :].split('-')
+        start, end = (int(start), int(end)) if start else (size - int(end), size - 1)
+        assert response.text == example_mainfile_contents[start : end + 1]
+        assert response.headers['Content-Range'] == f'bytes {start}-{end}/{size}'
     if status_code == 200:
         content = response.text
         if path.endswith('.json'):
@@ -995,7 +1039,9 @@ def test_entry_raw_file(
             length = params.get('length', len(example_mainfile_contents) - offset)
             assert content == example_mainfile_contents[offset : offset + length]
         else:
-            assert content == 'test content\n'
+            offset = params.get('offset', 0)
+            length = params.get('length', len('test content\n') - offset)
+            assert content == 'test content\n'[offset : offset + length]
 
 
 @pytest.mark.parametrize(
@@ -16,8 +16,11 @@
 # limitations under the License.
 #
 
+import asyncio
+import hashlib
 import io
 import os
+import threading
 import time
 import zipfile
 from datetime import datetime
@@ -27,6 +30,7 @@ import pytest
 import requests
 
 from nomad import files, infrastructure
+from nomad.app.v1.routers.uploads import _UploadSink
 from nomad.bundles import BundleExporter
 from nomad.config import config
 from nomad.config.models.config import BundleImportSettings
@@ -46,6 +50,7 @@ from tests.processing.test_edit_metadata import (
 from tests.test_files import (
     assert_upload_files,
     empty_file,
+    example_file,
     example_file_aux,
     example_file_corrupt_zip,
     example_file_mainfile_different_atoms,
@@ -2543,6 +2548,187 @@ def test_post_upload_raw_create_dir_path(
         assert not upload.upload_files.raw_path_is_file(path)
 
 
+@pytest.mark.parametrize(
+    'source_path, expected_mainfiles',
+    [
+        pytest.param(
+            example_file,
+            [
+                'examples_template/template.json',
+                'chunked/examples_template/template.json',
+            ],
+            id='archive',
+        ),
+        pytest.param(
+            'tests/data/proc/examples_template/template.json',
+            ['examples_template/template.json', 'chunked/template.json'],
+            id='file',
+        ),
+    ],
+)
+def test_chunked_upload(
+    auth_headers,
+    client,
+    proc_infra,
+    non_empty_processed,
+    example_data_writeable,
+    source_path,
+    expected_mainfiles,
+    monkeypatch,
+):
+    upload_id = 'examples_template'
+    user_auth = auth_headers['user1']
+    with open(source_path, 'rb') as f:
+        data = f.read()
+    chunks = [data[i : i + 200] for i in range(0, len(data), 200)]
+
+    def post_chunked(n_chunks):
+        return client.post(
+            build_url(
+                f'uploads/{upload_id}/raw-chunked/chunked',
+                dict(file_name=os.path.basename(source_path), n_chunks=n_chunks),
+            ),
+            headers=user_auth,
+        )
+
+    def put_chunk(session_id, index, chunk):
+        return client.put(
+            build_url(
+                f'uploads/{upload_id}/chunked/{session_id}/{index}',
+                dict(checksum=hashlib.sha256(chunk).hexdigest()),
+            ),
+            data=chunk,
+            headers=user_auth,
+        )
+
+    assert_response(post_chunked(config.services.chunked_upload_max_chunks + 1), 422)
+    response = post_chunked(len(chunks))
+    assert_response(response, 200)
+    session_id = response.json()['session_id']
+    assert response.json()['missing_chunks'] == list(range(len(chunks)))
+
+    # Simulate an interrupted upload: every third chunk is dropped, and one is corrupted
+    for index, chunk in enumerate(chunks):
+        if index % 3 != 1:
+            assert_response(put_chunk(session_id, index, chunk), 200)
+    response = client.put(
+        build_url(
+            f'uploads/{upload_id}/chunked/{session_id}/0',
+            dict(checksum=hashlib.sha256(chunks[0]).hexdigest()),
+        ),
+        data=chunks[0][:-1],
+        headers=user_auth,
+    )
+    assert_response(response, 400)
+    assert_response(put_chunk(session_id, len(chunks), b''), 400)
+    monkeypatch.setattr(
+        config.services, 'chunked_upload_max_chunk_size', len(chunks[0]) - 1
+    )
+    assert_response(put_chunk(session_id, 0, chunks[0]), 400)
+    monkeypatch.undo()
+    response = client.post(
+        f'uploads/{upload_id}/chunked/{session_id}/commit', headers=user_auth
+    )
+    assert_response(response, 400)
+
+    # Resume with the missing chunks
+    response = client.get(
+        f'uploads/{upload_id}/chunked/{session_id}', headers=user_auth
+    )
+    assert_response(response, 200)
+    missing_chunks = response.json()['missing_chunks']
+    assert missing_chunks == list(range(1, len(chunks), 3))
+    for index in missing_chunks:
+        assert_response(put_chunk(session_id, index, chunks[index]), 200)
+
+    response = client.post(
+        f'uploads/{upload_id}/chunked/{session_id}/commit', headers=user_auth
+    )
+    assert_response(response, 200)
+    assert_processing(client, upload_id, user_auth)
+    assert_expected_mainfiles(upload_id, expected_mainfiles)
+    response = client.get(
+        f'uploads/{upload_id}/chunked/{session_id}', headers=user_auth
+    )
+    assert_response(response, 404)
+
+
+@pytest.fixture(scope='function')
+def upload_sink_config(monkeypatch):
+    monkeypatch.setattr(config.services, 'upload_block_size', 4)
+    monkeypatch.setattr(config.services, 'upload_queue_size', 1)
+
+
+def test_upload_sink_blocks(upload_sink_config):
+    async def receive():
+        sink = _UploadSink(lambda blocks: [bytes(block) for block in blocks])
+        for chunk in [b'ab', b'cde', b'f', b'ghijklm', b'n']:
+            await sink.write(chunk)
+        await sink.close()
+        return sink.result()
+
+    # chunks are coalesced into multiples of the block size, the rest is passed on close
+    assert asyncio.run(receive()) == [b'abcd', b'efghijkl', b'mn']
+
+
+@pytest.mark.timeout(10)
+def test_upload_sink_backpressure(upload_sink_config):
+    release = threading.Event()
+
+    def consume(blocks):
+        release.wait()
+        return [bytes(block) for block in blocks]
+
+    async def receive():
+        sink = _UploadSink(consume)
+        await sink.write(b'abcd')
+        # the queue is full, writing waits for the consumer
+        write = asyncio.ensure_future(sink.write(b'efgh'))
+        await asyncio.sleep(0.1)
+        assert not write.done()
+        release.set()
+        await write
+        await sink.close()
+        assert sink.wait_time > 0
+        return sink.result()
+
+    assert asyncio.run(receive()) == [b'abcd', b'efgh']
+
+
+@pytest.mark.timeout(10)
+def test_upload_sink_consumer_error(upload_sink_config):
+    def consume(blocks):
+        for _ in blocks:
+            raise ValueError('cannot write')
+
+    async def receive():
+        sink = _UploadSink(consume)
+        await sink.write(b'abcd')
+        while not sink._result.done():
+            await asyncio.sleep(0.01)
+        # the error is raised before the rest of the upload is received
+        with pytest.raises(ValueError):
+            await sink.write(b'efgh')
+        await sink.close()
+        with pytest.raises(ValueError):
+            sink.result()
+
+    asyncio.run(receive())
+
+
+@pytest.mark.timeout(10)
+def test_upload_sink_drain(upload_sink_config):
+    async def receive():
+        # the consumer stops early, the remaining blocks are drained on close
+        sink = _UploadSink(lambda blocks: bytes(next(iter(blocks))))
+        for _ in range(10):
+            await sink.write(b'abcd')
+        await sink.close()
+        return sink.result()
+
+    assert asyncio.run(receive()) == b'abcd'
+
+
 @pytest.mark.parametrize(
     'user, upload_id, path, use_upload_token, expected_status_code, expected_mainfiles',
     [
@@ -39,6 +39,7 @@ from nomad.metainfo import (
     MProxy,
     Section,
 )
+from nomad.metainfo.example import Run, System, SCC
 from nomad.datamodel import EntryArchive, ClientContext
 from nomad.archive.storage import TOCPacker, _decode, _entries_per_block, to_json
 from nomad.archive import (
@@ -276,6 +277,28 @@ def test_read_archive_multi(
             assert float(i) == entry['large_list'][i]
 
 
+@pytest.mark.parametrize('use_blocked_toc', [False, True])
+def test_read_archive_lazy(monkeypatch, example_uuid, use_blocked_toc):
+    monkeypatch.setattr('nomad.config.archive.small_obj_optimization_threshold', 0)
+
+    run = Run(code_name='code')
+    for n_atoms in range(1, 4):
+        run.m_create(System, atom_labels=['H'] * n_atoms)
+    run.m_create(SCC, energy_total=1.0, system=run.systems[2])
+    entry = run.m_to_dict()
+
+    f = BytesIO()
+    write_archive(f, 1, [(example_uuid, entry)])
+
+    f = BytesIO(f.getbuffer())
+    with read_archive(f, use_blocked_toc=use_blocked_toc) as reader:
+        lazy_run = Run.m_from_dict(reader[example_uuid], lazy=True)
+        assert lazy_run.code_name == 'code'
+        assert lazy_run.sccs[0].system.m_proxy_resolve() is lazy_run.systems[2]
+        assert lazy_run.systems[2].atom_labels == ['H'] * 3
+        assert lazy_run.m_to_dict() == entry
+
+
 test_query_example: Dict[Any, Any] = {
     'c1': {
         's1': {'ss1': [{'p1': 1.0, 'p2': 'x'}, {'p1': 1.5, 'p2': 'y'}]},
@@ -26,7 +26,7 @@ from nomad.datamodel import EntryData, EntryArchive, EntryMetadata
 from nomad.datamodel.context import ServerContext
 from nomad.metainfo import Quantity
 
-from nomad.datamodel.hdf5 import HDF5Reference, HDF5Dataset
+from nomad.datamodel.hdf5 import HDF5Reference, HDF5Dataset, hdf5_write_session
 
 
 external_file = 'tests/data/datamodel/context.h5'
@@ -90,3 +90,33 @@ def test_hdf5(test_context, quantity_type, value):
             assert (quantity == f[path][()]).all()
 
     test_context.close()
+
+
+def test_hdf5_write_session(test_context):
+    TestSection.quantity.type = HDF5Dataset
+
+    archive = EntryArchive(
+        m_context=test_context,
+        metadata=EntryMetadata(entry_id='test_entry', upload_id='test_upload'),
+        data=TestSection(),
+    )
+    with hdf5_write_session(test_context) as session:
+        HDF5Reference.write_dataset(archive, np.ones(5), 'raw.h5#/data/value')
+        HDF5Reference.write_dataset(archive, np.zeros(3), 'raw.h5#/data/other')
+        # Written, but not yet flushed datasets can be read
+        assert (HDF5Reference.read_dataset(archive, 'raw.h5#/data/value') == 1).all()
+
+        archive.data.quantity = np.arange(10)
+        serialized = archive.m_to_dict()
+        deserialized = archive.m_from_dict(serialized, m_context=test_context)
+        assert (deserialized.data.quantity[()] == np.arange(10)).all()
+        # One handle for the raw file and one for the archive file
+        assert len(session._files) == 2
+
+    assert test_context.hdf5_write_session is None
+    with h5py.File(test_context.upload_files.raw_file('raw.h5', 'rb')) as f:
+        assert set(f['data'].keys()) == {'value', 'other'}
+    with h5py.File(test_context.upload_files.archive_hdf5_file('test_entry')) as f:
+        assert (f['data/quantity'][()] == np.arange(10)).all()
+
+    test_context.close()
@@ -539,7 +539,11 @@ def create_entries(spec: str):
         pytest.param('1-1', '1-1*', '1-1*', id='update-material-property'),
     ],
 )
-def test_index_entries(elastic_function, indices, before, to_index, after):
+@pytest.mark.parametrize('delta', [False, True])
+def test_index_entries(
+    elastic_function, indices, monkeypatch, before, to_index, after, delta
+):
+    monkeypatch.setattr('nomad.config.elastic.material_delta_updates', delta)
     index_entries_with_materials(create_entries(before), refresh=True)
     index_entries_with_materials(create_entries(to_index), refresh=True)
 
@@ -550,8 +554,12 @@ def test_index_entries(elastic_function, indices, before, to_index, after):
     'cap, entries',
     [pytest.param(2, 1, id='below-cap'), pytest.param(2, 3, id='above-cap')],
 )
-def test_index_materials_capped(elastic_function, indices, monkeypatch, cap, entries):
+@pytest.mark.parametrize('delta', [False, True])
+def test_index_materials_capped(
+    elastic_function, indices, monkeypatch, cap, entries, delta
+):
     monkeypatch.setattr('nomad.config.elastic.entries_per_material_cap', cap)
+    monkeypatch.setattr('nomad.config.elastic.material_delta_updates', delta)
     index_entries_with_materials(
         create_entries(','.join([f'{i}-1' for i in range(1, entries + 1)])),
         refresh=True,
@@ -41,8 +41,16 @@ from nomad.metainfo.metainfo import (
     Context,
     DefinitionAnnotation,
     derived,
+    get_column,
+    get_columns,
+    MProxy,
     MTypes,
 )
+from nomad.metainfo.util import (
+    MColumnarSubSectionList,
+    MLazySubSection,
+    MLazySubSectionList,
+)
 from nomad.metainfo.example import (
     Run,
     VaspRun,
@@ -602,6 +610,215 @@ class TestM1:
         assert run.m_get_sub_section(Run.systems, 0) == system1
         assert run.m_sub_section_count(Run.systems) == 2
 
+    def test_create_many(self):
+        run = Run()
+        systems = run.m_create_many(
+            System,
+            atom_labels=[['H', 'O'], ['H', 'H']],
+            atom_positions=np.zeros((2, 2, 3)) * ureg.angstrom,
+            system_type=np.array(['molecule', 'bulk']),
+            periodic_dimensions=[[True, True, True], None],
+        )
+
+        assert len(run.systems) == 2
+        for index, system in enumerate(systems):
+            assert run.systems[index] == system
+            assert system.m_parent == run
+            assert system.m_parent_index == index
+            assert system.n_atoms == 2
+            assert system.atom_positions.units == ureg.m
+        assert systems[0].system_type == 'molecule'
+        assert type(systems[0].system_type) is str
+        assert systems[0].periodic_dimensions == [True, True, True]
+        assert not systems[1].m_is_set(System.periodic_dimensions)
+
+        expected = Run()
+        expected.m_create(
+            System,
+            atom_labels=['H', 'O'],
+            atom_positions=np.zeros((2, 3)) * ureg.angstrom,
+            system_type='molecule',
+            periodic_dimensions=[True, True, True],
+        )
+        assert run.systems[0].m_to_dict() == expected.systems[0].m_to_dict()
+
+    def test_create_many_fallback(self):
+        sccs = SCC.m_from_columns(
+            energy_total=[1, 2.0],
+            an_int=[1, 2],
+            energy_total_0=[1.0 * ureg.eV, 2.0 * ureg.eV],
+        )
+        assert [scc.energy_total.m for scc in sccs] == [1.0, 2.0]
+        assert all(type(scc.energy_total.m) is float for scc in sccs)
+        assert all(type(scc.an_int) is np.int32 for scc in sccs)
+        assert sccs[1].energy_total_0.to(ureg.eV).m == pytest.approx(2.0)
+
+    def test_create_many_errors(self):
+        with pytest.raises(MetainfoError):
+            System.m_from_columns(n_atoms=[1, 2])
+        with pytest.raises(MetainfoError):
+            System.m_from_columns(atom_labels=[['H']], system_type=['a', 'b'])
+        with pytest.raises(KeyError):
+            System.m_from_columns(does_not_exist=[1])
+        with pytest.raises(MetainfoError):
+            Run().m_create_many(Parsing, parser_name=['a'])
+
+    def test_create_many_columnar(self):
+        columns = dict(
+            atom_labels=[['H', 'O'], ['H', 'H'], ['O', 'O']],
+            atom_positions=np.arange(18).reshape((3, 2, 3)) * ureg.angstrom,
+            system_type=['molecule', 'bulk', None],
+        )
+        expected = Run()
+        expected.m_create_many(System, **columns)
+        run = Run()
+        systems = run.m_create_many(System, columnar=True, **columns)
+
+        assert isinstance(systems, MColumnarSubSectionList)
+        assert run.systems is systems
+        assert run.m_sub_section_count(Run.systems) == 3
+        assert run.m_to_dict() == expected.m_to_dict()
+        assert [path for _, _, _, path in run.m_traverse()] == [
+            path for _, _, _, path in expected.m_traverse()
+        ]
+
+        system = run.systems[1]
+        assert system is run.systems[-2]
+        assert system.m_parent == run
+        assert system.m_parent_index == 1
+        assert system.n_atoms == 2
+        assert system in run.systems
+        system.system_type = 'surface'
+        assert run.m_to_dict()['systems'][1]['system_type'] == 'surface'
+        assert run.systems[2:] == [run.systems[2]]
+        assert not run.systems[2].m_is_set(System.system_type)
+
+        appended = run.m_create(System, system_type='atom')
+        assert appended.m_parent_index == 3
+        del run.systems[0]
+        assert [system.m_parent_index for system in run.systems] == [0, 1, 2]
+        assert run.systems[2] is appended
+
+    def test_create_many_columnar_fallback(self):
+        run = Run()
+        run.m_create(System)
+        systems = run.m_create_many(System, columnar=True, atom_labels=[['H']])
+        assert not isinstance(run.systems, MColumnarSubSectionList)
+        assert systems[0].m_parent_index == 1
+
+        run = Run()
+        run.m_create_many(SCC, columnar=True, energy_total=[1, 2.0])
+        assert not isinstance(run.m_get_sub_sections(Run.sccs), MColumnarSubSectionList)
+
+    def test_get_column(self):
+        run = Run()
+        run.m_create_many(SCC, energy_total=[1.0, 2.0, 3.0] * ureg.kJ, an_int=[1, 2, 3])
+        energies, mask = get_column(run.sccs, 'energy_total')
+        assert np.array_equal(energies, [1000.0, 2000.0, 3000.0])
+        assert mask.all()
+        run.sccs[1].m_set(SCC.an_int, None)
+        an_ints, mask = get_column(run.sccs, 'an_int', dtype=float)
+        assert np.array_equal(mask, [True, False, True])
+        assert np.array_equal(an_ints[mask], [1, 3])
+        assert np.isnan(an_ints[1])
+
+        run = Run()
+        run.m_create_many(
+            System,
+            columnar=True,
+            atom_positions=np.arange(18).reshape((3, 2, 3)) * ureg.nm,
+        )
+        run.systems[2].atom_positions = np.zeros((2, 3))
+        run.m_create(System)
+        assert isinstance(run.systems, MColumnarSubSectionList)
+        positions, mask = get_column(run.systems, 'atom_positions')
+        assert positions.shape == (4, 2, 3)
+        assert np.array_equal(mask, [True, True, True, False])
+        assert np.allclose(positions[:2], np.arange(12).reshape((2, 2, 3)) * 1e-9)
+        assert np.array_equal(positions[2], np.zeros((2, 3)))
+        assert np.isnan(positions[3]).all()
+
+        runs = [Run(), Run(parsing=Parsing(parser_name='parser'))]
+        names, mask = get_column(
+            runs, 'parsing.parser_name', dtype=object, fill_value=None
+        )
+        assert names.tolist() == [None, 'parser']
+        assert mask.tolist() == [False, True]
+        with pytest.raises(MetainfoError):
+            get_column([Run()], 'systems.n_atoms')
+        with pytest.raises(KeyError):
+            get_column([Run()], 'parsing')
+
+    def test_get_columns(self):
+        run = Run()
+        for index in range(3):
+            system = run.m_create(System, atom_positions=np.full((2, 3), index))
+            if index != 1:
+                system.lattice_vectors = np.eye(3)
+            run.m_create(SCC, system=system)
+        run = Run.m_from_dict(run.m_to_dict())
+        systems = [scc.system for scc in run.sccs]
+        assert all(isinstance(system, MProxy) for system in systems)
+
+        paths = ['atom_positions', 'lattice_vectors']
+        columns = get_columns(systems, paths)
+        assert list(columns) == paths
+        for path in paths:
+            values, mask = get_column(run.systems, path)
+            assert np.array_equal(columns[path][0], values, equal_nan=True)
+            assert np.array_equal(columns[path][1], mask)
+        assert columns['lattice_vectors'][1].tolist() == [True, False, True]
+        assert np.array_equal(columns['atom_positions'][0][2], np.full((2, 3), 2))
+
+        run = Run()
+        run.m_create_many(
+            System,
+            columnar=True,
+            atom_positions=np.arange(18).reshape((3, 2, 3)) * ureg.nm,
+        )
+        run.systems[1].atom_positions = np.zeros((2, 3))
+        references = [
+            MProxy(url, m_proxy_section=run, m_proxy_type=SCC.system.type)
+            for url in ['#/systems/2', '/systems/1', '#/systems/0']
+        ]
+        positions, mask = get_column(references, 'atom_positions')
+        assert mask.all()
+        assert np.allclose(positions[0], np.arange(12, 18).reshape((2, 3)) * 1e-9)
+        assert np.array_equal(positions[1], np.zeros((2, 3)))
+        assert all(reference.m_proxy_resolved is None for reference in references)
+        materialized = [
+            isinstance(system, System) for system in list.__iter__(run.systems)
+        ]
+        assert materialized == [False, True, False]
+        _, mask = get_column(references, 'lattice_vectors')
+        assert not mask.any()
+
+    def test_from_dict_lazy(self):
+        run = Run()
+        run.m_create(Parsing, parser_name='parser')
+        run.m_create(System, atom_labels=['H'])
+        system = run.m_create(System, atom_labels=['O'])
+        run.m_create(SCC, energy_total=1.0, system=system)
+        data = run.m_to_dict()
+
+        lazy_run = Run.m_from_dict(data, lazy=True)
+        assert isinstance(lazy_run.__dict__['parsing'], MLazySubSection)
+        assert isinstance(lazy_run.systems, MLazySubSectionList)
+        assert lazy_run.m_sub_section_count(Run.systems) == 2
+
+        lazy_system = lazy_run.sccs[0].system.m_proxy_resolve()
+        assert lazy_system is lazy_run.systems[1]
+        assert lazy_system.atom_labels == ['O']
+        assert lazy_system.m_parent is lazy_run
+        assert lazy_system.m_parent_index == 1
+        assert lazy_run.parsing.parser_name == 'parser'
+        assert lazy_run.parsing.m_parent_sub_section == Run.parsing
+        assert lazy_run.m_to_dict() == data
+        assert Run.m_from_dict(data, lazy=True).m_to_dict() == data
+
+        lazy_run.parsing = Parsing(parser_name='other')
+        assert lazy_run.parsing.parser_name == 'other'
+
     def test_parent_repeats(self):
         run = Run()
         system = run.m_create(System)
@@ -877,6 +1094,8 @@ class TestM1:
         assert (
             copy.systems[0].m_parent_sub_section is run.systems[0].m_parent_sub_section
         )
+        assert copy.parsing.m_parent_index == -1
+        assert copy.parsing.m_path() == run.parsing.m_path()
 
     def test_copy_keeps_m_sub_section_list(self):
         run = Run()
@@ -27,11 +27,16 @@ from nomad.metainfo.metainfo import (
     Bytes,
     Capitalized,
     Datetime,
+    DerivedQuantity,
     Dimension,
+    FullStorageQuantity,
     JSON,
     MSection,
     MTypes,
+    PlainQuantity,
+    PrimitiveQuantity,
     Quantity,
+    UnitQuantity,
     URL,
     Unit,
     units,
@@ -338,3 +343,88 @@ def test_complex_number_exception(quantity_type, value):
     section = TestSection()
     with pytest.raises((ValueError, AssertionError)):
         section.quantity = value
+
+
+@pytest.mark.parametrize(
+    'kwargs,quantity_cls',
+    [
+        pytest.param(dict(type=str), PrimitiveQuantity, id='primitive'),
+        pytest.param(
+            dict(type=float, unit='m'), PrimitiveQuantity, id='primitive-unit'
+        ),
+        pytest.param(dict(type=np.float64, shape=[3]), PlainQuantity, id='plain'),
+        pytest.param(
+            dict(type=np.float64, shape=[3], unit='m'), UnitQuantity, id='unit'
+        ),
+        pytest.param(
+            dict(type=int, derived=lambda section: 1), DerivedQuantity, id='derived'
+        ),
+        pytest.param(dict(type=float, repeats=True), FullStorageQuantity, id='full'),
+        pytest.param(dict(type=Datetime), Quantity, id='get-normalize'),
+    ],
+)
+def test_quantity_specialization(kwargs, quantity_cls):
+    class TestSection(MSection):
+        quantity = Quantity(**kwargs)
+
+    assert TestSection.quantity.__class__ == quantity_cls
+
+
+def test_quantity_specialization_on_change():
+    class TestSection(MSection):
+        quantity = Quantity(type=np.float64, shape=[3])
+
+    section = TestSection(quantity=[1.0, 2.0, 3.0])
+    assert TestSection.quantity.__class__ == PlainQuantity
+    assert not isinstance(section.quantity, pint.Quantity)
+
+    TestSection.quantity.unit = 'm'
+    assert TestSection.quantity.__class__ == UnitQuantity
+    assert section.quantity.units == units.m
+
+
+@pytest.mark.parametrize(
+    'kwargs,value,magnitude',
+    [
+        pytest.param(dict(type=float), 1.0, 1.0, id='primitive'),
+        pytest.param(dict(type=float, unit='m'), 1.0, 1.0, id='primitive-unit'),
+        pytest.param(
+            dict(type=np.float64, shape=[2], unit='m'),
+            [1.0, 2.0] * units.cm,
+            [0.01, 0.02],
+            id='unit',
+        ),
+        pytest.param(
+            dict(type=np.float64, unit='m', derived=lambda _: 2 * units.cm),
+            None,
+            0.02,
+            id='derived',
+        ),
+        pytest.param(
+            dict(type=np.float64, unit='m', default=3.0), None, 3.0, id='default'
+        ),
+    ],
+)
+def test_get_magnitude(kwargs, value, magnitude):
+    class TestSection(MSection):
+        quantity = Quantity(**kwargs)
+
+    section = TestSection()
+    if value is not None:
+        section.quantity = value
+
+    assert np.allclose(TestSection.quantity.get_magnitude(section), magnitude)
+    assert np.allclose(section.m_get_magnitude(TestSection.quantity), magnitude)
+    if 'unit' in kwargs:
+        assert np.allclose(section.quantity.to('m').magnitude, magnitude)
+
+
+def test_unit_quantity_returns_copy():
+    class TestSection(MSection):
+        quantity = Quantity(type=np.float64, shape=[2], unit='m')
+
+    section = TestSection(quantity=[1.0, 2.0])
+    value = section.quantity
+    value *= 2
+    assert np.all(section.quantity.magnitude == [1.0, 2.0])
+    assert section.m_get_magnitude(TestSection.quantity) is section.__dict__['quantity']
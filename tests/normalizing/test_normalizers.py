@@ -0,0 +1,242 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import pytest
+
+from nomad.datamodel import EntryArchive, EntryMetadata
+from nomad.datamodel.results import Material, Results
+from nomad.metainfo import MSection, Quantity, Reference, SubSection
+from nomad.normalizing import (
+    NormalizerInterfaceNew,
+    run_normalizer,
+    run_normalizers,
+    schedule_normalizers,
+)
+from nomad.normalizing.normalizer import Normalizer
+from nomad.utils import get_logger
+
+
+class SleepingNormalizer(Normalizer):
+    def __init__(self, duration, **kwargs):
+        super().__init__(**kwargs)
+        self.duration = duration
+
+    def normalize(self, archive, logger=None):
+        deadline = time.time() + self.duration
+        while time.time() < deadline:
+            try:
+                time.sleep(0.01)
+            except Exception:
+                pass
+
+
+class PartialNormalizer(SleepingNormalizer):
+    def normalize(self, archive, logger=None):
+        archive.metadata.mainfile = 'changed'
+        archive.metadata.entry_name = 'added'
+        archive.results.material.elements = ['H']
+        archive.m_create(Results)
+        super().normalize(archive, logger)
+
+
+class FailingNormalizer(Normalizer):
+    def normalize(self, archive, logger=None):
+        raise ValueError('failed')
+
+
+@pytest.fixture
+def time_budgets(monkeypatch):
+    monkeypatch.setattr('nomad.config.normalize.normalizer_time_budget', 0.1)
+    monkeypatch.setattr(
+        'nomad.config.normalize.normalizer_time_budgets', dict(FailingNormalizer=0)
+    )
+
+
+@pytest.mark.parametrize(
+    'duration, interrupted',
+    [
+        pytest.param(0.01, False, id='within-budget'),
+        pytest.param(10, True, id='exceeds-budget'),
+    ],
+)
+def test_run_normalizer(time_budgets, duration, interrupted):
+    normalizer = NormalizerInterfaceNew(SleepingNormalizer(duration), level=0)
+    stats = run_normalizer(normalizer, EntryArchive(), get_logger(__name__))
+
+    assert stats['normalizer'] == 'SleepingNormalizer'
+    assert stats['interrupted'] == interrupted
+    assert stats['time_budget'] == 0.1
+    assert min(duration, 0.1) <= stats['wall_time'] < 1
+    assert stats['cpu_time'] >= 0
+    assert stats['peak_rss_increase'] >= 0
+
+
+def test_run_normalizer_failure(time_budgets):
+    normalizer = NormalizerInterfaceNew(FailingNormalizer(), level=0)
+    with pytest.raises(ValueError):
+        run_normalizer(normalizer, EntryArchive(), get_logger(__name__))
+
+
+def test_run_normalizer_removes_partial_results(time_budgets):
+    archive = EntryArchive(metadata=EntryMetadata(mainfile='mainfile'))
+    archive.m_create(Results).m_create(Material, chemical_formula_hill='H2O')
+    expected = archive.m_to_dict()
+
+    normalizer = NormalizerInterfaceNew(PartialNormalizer(10), level=0)
+    stats = run_normalizer(normalizer, archive, get_logger(__name__))
+
+    assert stats['interrupted']
+    assert archive.m_to_dict() == expected
+    assert archive.metadata.mainfile == 'mainfile'
+    assert archive.results.material.elements is None
+
+
+class Input(MSection):
+    values = Quantity(type=float, shape=['*'])
+
+
+class Item(MSection):
+    value = Quantity(type=float)
+    input_ref = Quantity(type=Reference(Input.m_def))
+
+
+class Output(MSection):
+    total = Quantity(type=float)
+    items = SubSection(sub_section=Item, repeats=True)
+
+
+class Root(MSection):
+    input = SubSection(sub_section=Input)
+    output = SubSection(sub_section=Output)
+    other_output = SubSection(sub_section=Output)
+    unused_output = SubSection(sub_section=Output)
+
+
+class ItemsNormalizer(Normalizer):
+    reads = ['input']
+    writes = ['output.items']
+
+    def normalize(self, archive, logger=None):
+        for value in archive.input.values:
+            time.sleep(0.01)
+            archive.m_setdefault('output').items.append(
+                Item(value=value, input_ref=archive.input)
+            )
+
+
+class TotalNormalizer(Normalizer):
+    reads = ['input']
+    writes = ['other_output.total']
+
+    def normalize(self, archive, logger=None):
+        time.sleep(0.01)
+        archive.m_setdefault('other_output').total = sum(archive.input.values)
+
+
+class UnusedNormalizer(Normalizer):
+    reads = ['input']
+    writes = ['unused_output.total']
+
+    def normalize(self, archive, logger=None):
+        pass
+
+
+class SummaryNormalizer(Normalizer):
+    def normalize(self, archive, logger=None):
+        archive.output.total = sum(item.value for item in archive.output.items)
+
+
+def create_normalizers(*normalizer_classes):
+    return [
+        NormalizerInterfaceNew(normalizer_class(), level=0)
+        for normalizer_class in normalizer_classes
+    ]
+
+
+def test_schedule_normalizers(monkeypatch):
+    normalizers = create_normalizers(
+        ItemsNormalizer, TotalNormalizer, SummaryNormalizer, ItemsNormalizer
+    )
+    stages = schedule_normalizers(normalizers)
+    assert [len(stage) for stage in stages] == [2, 1, 1]
+
+    monkeypatch.setattr(
+        'nomad.config.normalize.normalizer_time_budgets', dict(TotalNormalizer=1)
+    )
+    stages = schedule_normalizers(normalizers)
+    assert [len(stage) for stage in stages] == [1, 1, 1, 1]
+
+
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_run_normalizers(max_workers):
+    archive = Root(
+        input=Input(values=[1.0, 2.0, 3.0]), output=Output(items=[Item(value=0.0)])
+    )
+    normalizers = create_normalizers(
+        ItemsNormalizer, TotalNormalizer, UnusedNormalizer, SummaryNormalizer
+    )
+
+    results = list(
+        run_normalizers(
+            normalizers,
+            archive,
+            lambda normalizer: get_logger(__name__),
+            max_workers=max_workers,
+        )
+    )
+
+    assert [normalizer.__name__ for normalizer, _, _ in results] == [
+        'ItemsNormalizer',
+        'TotalNormalizer',
+        'UnusedNormalizer',
+        'SummaryNormalizer',
+    ]
+    assert all(error is None for _, _, error in results)
+    assert all(not stats['interrupted'] for _, stats, _ in results)
+    assert archive.m_to_dict() == {
+        'input': {'values': [1.0, 2.0, 3.0]},
+        'output': {
+            'total': 6.0,
+            'items': [
+                {'value': 0.0},
+                *[{'value': value, 'input_ref': '/input'} for value in [1, 2, 3]],
+            ],
+        },
+        'other_output': {'total': 6.0},
+    }
+    assert archive.output.items[1].input_ref is archive.input
+
+
+def test_run_normalizers_failure():
+    normalizers = create_normalizers(
+        ItemsNormalizer, TotalNormalizer, FailingNormalizer, SummaryNormalizer
+    )
+    archive = Root(input=Input(values=[1.0]))
+    results = list(
+        run_normalizers(
+            normalizers, archive, lambda normalizer: get_logger(__name__), 2
+        )
+    )
+    assert [normalizer.__name__ for normalizer, _, _ in results] == [
+        'ItemsNormalizer',
+        'TotalNormalizer',
+        'FailingNormalizer',
+    ]
+    assert isinstance(results[-1][2], ValueError)
@@ -15,9 +15,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
+
+import numpy as np
 import pytest
 import ase
 
+from nomad.normalizing.mof_deconstructor import inter_atomic_distance_check
+from nomad.normalizing.porosity import zeo_calculation, zeo_calculations
 from tests.normalizing.conftest import get_template_for_structure
 from tests.normalizing.test_topology import assert_topology
 
@@ -86,3 +91,64 @@ def test_mof(filepath):
     assert len(metal_sbus) > 0
     assert len(organic_sbus) > 0
     assert len(ligands) > 0
+
+
+def test_zeo_calculations(tmp_path, monkeypatch):
+    pytest.importorskip('pyzeo')
+    systems = [
+        ase.io.read(f'tests/data/normalizers/porous_systems/{name}.cif')
+        for name in ['COF-1', 'IRR']
+    ]
+    monkeypatch.chdir(tmp_path)
+    results = zeo_calculations(systems, number_of_steps=100, max_workers=3)
+    for system, result in zip(systems, results):
+        expected = zeo_calculation(system, number_of_steps=100)
+        assert list(result.keys()) == list(expected.keys())
+        assert len(result) == 7
+        for key in ['LCD', 'PLD', 'lfpd']:
+            assert result[key] == expected[key]
+    assert os.listdir(tmp_path) == []
+
+
+def dense_inter_atomic_distance_check(atoms):
+    distances = atoms.get_all_distances(mic=True)
+    for i in range(len(atoms)):
+        if atoms[i].symbol != 'H':
+            for j in range(len(atoms)):
+                if i != j and distances[i, j] < 0.90:
+                    return False
+    return True
+
+
+@pytest.mark.parametrize(
+    'filepath',
+    [
+        'tests/data/normalizers/mofs/EDUSIF.cif',
+        'tests/data/normalizers/mofs/RUBTAK01.cif',
+        'tests/data/normalizers/mofs/SARSUC.cif',
+        'tests/data/normalizers/porous_systems/COF-1.cif',
+    ],
+)
+def test_inter_atomic_distance_check(filepath):
+    atoms = ase.io.read(filepath)
+    assert inter_atomic_distance_check(atoms) == dense_inter_atomic_distance_check(
+        atoms
+    )
+
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        shaken = atoms.copy()
+        index, other = rng.choice(len(atoms), 2, replace=False)
+        # move an atom close to another one, possibly across the cell boundary
+        shaken.positions[index] = (
+            shaken.positions[other]
+            + rng.uniform(-0.6, 0.6, 3)
+            + shaken.cell[rng.integers(3)]
+        )
+        assert inter_atomic_distance_check(shaken) == dense_inter_atomic_distance_check(
+            shaken
+        )
+
+    hydrogens = ase.Atoms('H2', positions=[[0, 0, 0], [0, 0, 0.5]])
+    assert inter_atomic_distance_check(hydrogens)
+    assert dense_inter_atomic_distance_check(hydrogens)
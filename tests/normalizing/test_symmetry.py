@@ -0,0 +1,140 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import ase.build
+import numpy as np
+import pytest
+from matid import SymmetryAnalyzer
+
+from nomad.normalizing.symmetry import (
+    SymmetryCache,
+    reduced_structure,
+    structures_match,
+    symmetry_analysis,
+    symmetry_fingerprint,
+)
+
+
+@pytest.fixture
+def bulk():
+    return ase.build.bulk('NaCl', 'rocksalt', a=5.64)
+
+
+def test_fingerprint(bulk):
+    fingerprint = symmetry_fingerprint(bulk, 0.1)
+
+    displaced = bulk.copy()
+    displaced.positions[0] += 0.5
+    assert symmetry_fingerprint(displaced, 0.1) == fingerprint
+    assert symmetry_fingerprint(bulk, 0.2) != fingerprint
+    assert symmetry_fingerprint(bulk, 0.1, 2) != fingerprint
+    assert symmetry_fingerprint(ase.build.bulk('Cu'), 0.1) != fingerprint
+
+
+def match(system, other, symmetry_tol=0.1):
+    return structures_match(
+        reduced_structure(system), reduced_structure(other), system.pbc, symmetry_tol
+    )
+
+
+def test_structures_match(bulk):
+    shaken = bulk.copy()
+    shaken.positions += 0.001
+    assert match(bulk, shaken)
+
+    wrapped = bulk.copy()
+    wrapped.positions += bulk.get_cell()[0]
+    assert match(bulk, wrapped)
+
+    # positions on both sides of the cell boundary and of any rounding boundary
+    boundary = bulk.copy()
+    boundary.positions[0] = [0.049, 0.0, 0.0]
+    other_boundary = bulk.copy()
+    other_boundary.positions[0] = [-0.049, 0.0, 0.0]
+    assert match(boundary, other_boundary)
+
+    displaced = bulk.copy()
+    displaced.positions[0] += 0.5
+    assert not match(bulk, displaced)
+
+    strained = bulk.copy()
+    strained.set_cell(bulk.get_cell() * 1.1, scale_atoms=True)
+    assert not match(bulk, strained)
+
+    molecule = ase.build.molecule('H2O')
+    shifted_molecule = molecule.copy()
+    shifted_molecule.positions += 0.01
+    assert match(molecule, shifted_molecule)
+
+
+def test_cache(bulk):
+    cache = SymmetryCache(max_size=1)
+    analysis = cache.get(bulk, 0.1)
+    analyzer = SymmetryAnalyzer(bulk, 0.1)
+
+    assert analysis.get_space_group_number() == 225
+    conv_system = analysis.get_conventional_system()
+    assert np.allclose(
+        conv_system.get_positions(), analyzer.get_conventional_system().get_positions()
+    )
+    conv_system.set_pbc(False)
+    assert all(analysis.get_conventional_system().get_pbc())
+
+    assert cache.get(bulk.copy(), 0.1).results is analysis.results
+    assert cache.stats() == dict(hits=1, disk_hits=0, misses=1, size=1)
+
+    cache.get(ase.build.bulk('Cu'), 0.1)
+    cache.get(bulk, 0.1)
+    assert cache.stats() == dict(hits=1, disk_hits=0, misses=3, size=1)
+
+
+def test_cache_directory(bulk, tmp_path):
+    cache = SymmetryCache(max_size=10, directory=str(tmp_path))
+    analysis = cache.get(bulk, 0.1)
+    wyckoff_sets = analysis.get_wyckoff_sets_conventional(return_parameters=False)
+    conv_system = analysis.get_conventional_system()
+
+    cache = SymmetryCache(max_size=10, directory=str(tmp_path))
+    shaken = bulk.copy()
+    shaken.positions += 0.001
+    analysis = cache.get(shaken, 0.1)
+    assert cache.stats()['disk_hits'] == 1
+    cached_wyckoff_sets = analysis.get_wyckoff_sets_conventional(
+        return_parameters=False
+    )
+    assert [vars(wyckoff_set) for wyckoff_set in cached_wyckoff_sets] == [
+        vars(wyckoff_set) for wyckoff_set in wyckoff_sets
+    ]
+    cached_conv_system = analysis.get_conventional_system()
+    assert type(cached_conv_system) is type(conv_system)
+    assert np.allclose(cached_conv_system.get_positions(), conv_system.get_positions())
+    assert np.array_equal(
+        cached_conv_system.wyckoff_letters, conv_system.wyckoff_letters
+    )
+    assert analysis._analyzer is None
+
+    # every result is written once into its own file
+    analysis.get_space_group_number()
+    files = sorted(path.name for path in tmp_path.glob('*/*/*/*.json'))
+    assert len(files) == 3
+    assert not list(tmp_path.glob('**/*.pickle'))
+
+
+def test_symmetry_analysis_disabled(bulk, monkeypatch):
+    monkeypatch.setattr('nomad.config.normalize.symmetry_cache_size', 0)
+    assert isinstance(symmetry_analysis(bulk, 0.1), SymmetryAnalyzer)
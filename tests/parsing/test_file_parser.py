@@ -1,3 +1,4 @@
+import mmap
 import pytest
 import numpy as np
 import pint
@@ -285,6 +286,82 @@ class TestTextParser:
 
         assert parser.get('total_time') == 22.4
 
+    def test_sub_parser_block(self, parser):
+        parser.quantities = [
+            Quantity(
+                'scf',
+                r'Self\-consistent loop started([\s\S]+?)Self\-consistent loop stopped',
+                repeats=True,
+                sub_parser=TextParser(
+                    quantities=[
+                        Quantity(
+                            'iteration',
+                            r'SCF iteration number\s*:\s*(\d+)',
+                            repeats=True,
+                        )
+                    ],
+                    findall=False,
+                ),
+            )
+        ]
+
+        scf = parser.get('scf')
+        assert len(scf[0].get('iteration')) == 12
+        assert isinstance(scf[0].file_mmap, bytes)
+        assert b'SCF iteration number' in scf[0].file_mmap
+        # the sub parser searches a window of the parent mmap instead of a copy
+        assert isinstance(scf[0]._file_handler, mmap.mmap)
+        assert scf[0]._file_window is not None
+
+    def test_sub_parser_block_preceding(self, parser):
+        def sub_parser(pattern):
+            return TextParser(
+                quantities=[Quantity('iteration', pattern, repeats=True)],
+                findall=False,
+            )
+
+        def get_iterations(sub_parser):
+            parser.quantities = [
+                Quantity(
+                    'scf',
+                    r'Self\-consistent loop started([\s\S]+?)Self\-consistent loop stopped',
+                    repeats=True,
+                    sub_parser=sub_parser,
+                )
+            ]
+            return parser.get('scf')
+
+        scf = get_iterations(sub_parser(r'(?m)^\| SCF iteration number\s*:\s*(\d+)'))
+        # patterns depending on preceding data are searched in a copy of the block
+        assert isinstance(scf[0]._file_handler, bytes)
+        assert scf[0]._file_window is None
+        iterations = [s.get('iteration') for s in scf]
+        scf = get_iterations(sub_parser(r'SCF iteration number\s*:\s*(\d+)'))
+        assert scf[0]._file_window is not None
+        assert [s.get('iteration') for s in scf] == iterations
+
+    def test_file_offset(self, mainfile, quantity_float):
+        with open(mainfile, 'rb') as f:
+            offset = f.read().index(b'Total time spent')
+
+        parser = TextParser(
+            mainfile,
+            quantities=[
+                quantity_float.get('quantity'),
+                Quantity(
+                    'total_time',
+                    r'Total time spent \(seconds\)\s*:\s*([\d.]+)',
+                    repeats=False,
+                ),
+            ],
+            findall=False,
+        )
+        parser.file_offset = offset
+        assert isinstance(parser.file_mmap, mmap.mmap)
+        assert parser.file_mmap[:].lstrip().startswith(b'Total time spent')
+        assert parser.get('total_time') == 22.4
+        assert parser.get(quantity_float.get('quantity').name) is None
+
     def test_block_short(self, parser, quantity_repeats):
         parser.quantities = [
             Quantity(
@@ -339,6 +416,33 @@ class TestTextParser:
         parser.quantities = [quantity]
         assert parser.get(quantity.name) == quantity_float.get('value')
 
+    @pytest.mark.parametrize(
+        'block, dtype, shape',
+        [
+            pytest.param('1.5 -2.0e-3\n3 nan', None, (2, 2), id='float'),
+            pytest.param('1 2\n3 4', None, None, id='int'),
+            pytest.param('1 2 3 4', np.float32, [2, 2], id='dtype'),
+            pytest.param('1 2.5', int, None, id='not-int'),
+            pytest.param('1 2 x', None, None, id='not-numeric'),
+            pytest.param('1.0D+00 2.0D+00', float, None, id='fortran'),
+            pytest.param('42', None, None, id='scalar'),
+            pytest.param('  ', None, None, id='empty'),
+        ],
+    )
+    def test_quantity_dense(self, block, dtype, shape):
+        expected, value = [
+            Quantity('data', r'(.+)', dtype=dtype, shape=shape, dense=dense).to_data(
+                block
+            )
+            for dense in [False, True]
+        ]
+        assert type(value) is type(expected)
+        if isinstance(expected, np.ndarray):
+            assert value.dtype == expected.dtype
+            assert np.array_equal(value, expected, equal_nan=True)
+        else:
+            assert value == expected
+
     def test_quantity_parse_pattern(self, parser):
         parser.quantities = [
             Quantity(
@@ -21,13 +21,23 @@ import os
 import os.path
 import re
 import datetime
+import numpy as np
+import pandas as pd
 import yaml
 
+from nomad import utils
 from nomad.config import config
 from nomad.datamodel.datamodel import EntryArchive, EntryMetadata
 from nomad.datamodel.context import ClientContext
 from nomad.utils import generate_entry_id, strip
 from nomad.parsing.parser import ArchiveParser
+from nomad.metainfo import MSection, Quantity, SubSection
+from nomad.parsing.tabular import (
+    _sections_from_columns,
+    _sheet_dataframe,
+    parse_table,
+    read_table_data,
+)
 from tests.normalizing.conftest import run_normalize
 from nomad.processing import Upload, Entry
 from nomad.processing import ProcessStatus
@@ -897,6 +907,86 @@ def test_tabular_checkbox(raw_files_function, monkeypatch, schema, content):
         assert main_archive.data.MySubsection[0].header_0 == 'c'
 
 
+@pytest.mark.parametrize(
+    'content, options',
+    [
+        pytest.param('a,b,c\n1,2.5,x\n3,,y\n', {}, id='comma'),
+        pytest.param('a;b;c\n1;2.5;x\n3;;y\n', {}, id='sniffed-semicolon'),
+        pytest.param('#c\na\tb\n1\t2 #c\n', {'comment': '#'}, id='sniffed-tab'),
+        pytest.param('skipped\na, b\n1, 2\n', {'skiprows': 1}, id='skiprows'),
+        pytest.param('a|b\n1|2\n', {'sep': '|'}, id='sep'),
+        pytest.param('a  b\n1  2\n', {'sep': r'\s+'}, id='regex-sep'),
+    ],
+)
+def test_read_table_data(tmp_path, content, options):
+    """Tests that CSV files are read like with the python engine of pandas."""
+    path = str(tmp_path / 'test.archive.csv')
+    with open(path, 'wt') as f:
+        f.write(content)
+    expected = pd.read_csv(
+        path, engine='python', skipinitialspace=True, **{'sep': None, **options}
+    )
+
+    for columnar in [False, True]:
+        with open(path) as f:
+            data = read_table_data(path, f, columnar=columnar, **options)
+        df = _sheet_dataframe(data)
+        pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+        df.rename(columns={'a': 'renamed'}, inplace=True)
+        assert 'a' in _sheet_dataframe(data)
+
+
+class TabularInner(MSection):
+    length = Quantity(type=np.float64, unit='m', a_tabular=dict(name='length'))
+
+
+class TabularRow(MSection):
+    index = Quantity(type=np.int64, a_tabular=dict(name='index'))
+    value = Quantity(type=np.float64, a_tabular=dict(name='value'))
+    title = Quantity(type=str, a_tabular=dict(name='title'))
+    inner = SubSection(sub_section=TabularInner, repeats=True)
+
+
+@pytest.mark.parametrize(
+    'content, from_columns',
+    [
+        pytest.param(
+            'index,value,title,length\n1,2.5,a,1.5\n2,,b,3.5\n',
+            True,
+            id='columns',
+        ),
+        pytest.param(
+            'index,value,title,length\n1,2.5,a,1.5\n2,x,b,3.5\n',
+            False,
+            id='cells',
+        ),
+    ],
+)
+def test_parse_table(tmp_path, monkeypatch, content, from_columns):
+    """Tests that sections created from whole columns equal those set cell by cell."""
+    path = str(tmp_path / 'test.archive.csv')
+    with open(path, 'wt') as f:
+        f.write(content)
+    data = read_table_data(path)
+    df = _sheet_dataframe(data)
+    mapped_columns = [
+        (name, name, df.columns.get_loc(name)) for name in ['index', 'value', 'title']
+    ]
+    sections = _sections_from_columns(df, TabularRow.m_def, mapped_columns)
+    assert (sections is not None) == from_columns
+
+    logger = utils.get_logger(__name__)
+    sections = parse_table(data, TabularRow.m_def, logger)
+    monkeypatch.setattr(
+        'nomad.parsing.tabular._sections_from_columns', lambda *args: None
+    )
+    expected = parse_table(data, TabularRow.m_def, logger)
+    assert [section.m_to_dict() for section in sections] == [
+        section.m_to_dict() for section in expected
+    ]
+    assert sections[1].inner[0].length.to('m').magnitude == 3.5
+
+
 def get_files(schema=None, content=None):
     """Prepares files containing schema and data in the temporary file
     directory.
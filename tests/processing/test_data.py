@@ -251,6 +251,12 @@ def assert_user_metadata(entries_metadata, user_metadata):
 @pytest.mark.timeout(config.tests.default_timeout)
 def test_processing(processed, no_warn, mails, monkeypatch):
     assert_processing(processed)
+    for entry in Entry.objects(upload_id=processed.upload_id):
+        assert len(entry.normalizer_stats) > 0
+        for stats in entry.normalizer_stats:
+            assert stats.normalizer is not None
+            assert stats.wall_time >= 0
+            assert not stats.interrupted
 
     assert len(mails.messages) == 1
     assert (
@@ -321,6 +327,20 @@ def test_publish_directly(non_empty_uploaded, user1, proc_infra, no_warn, monkey
     assert_processing(Upload.get(processed.upload_id), published=True)
 
 
+@pytest.mark.timeout(config.tests.default_timeout)
+def test_entries_metadata_lazy(non_empty_processed: Upload, no_warn, monkeypatch):
+    non_empty_processed.publish_upload()
+    non_empty_processed.block_until_complete(interval=0.01)
+    published = Upload.get(non_empty_processed.upload_id)
+
+    with published.entries_metadata() as entries:
+        expected = [entry.m_parent.m_to_dict() for entry in entries]
+
+    monkeypatch.setattr('nomad.config.archive.lazy_loading', True)
+    with published.entries_metadata() as entries:
+        assert [entry.m_parent.m_to_dict() for entry in entries] == expected
+
+
 @pytest.mark.timeout(config.tests.default_timeout)
 def test_republish(
     non_empty_processed: Upload, no_warn, internal_example_user_metadata, monkeypatch
@@ -15,8 +15,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import numpy as np
 import pytest
-from nomad.atomutils import Formula
+from nomad.atomutils import (
+    Formula,
+    calc_molecular_rdf,
+    create_molecular_universe,
+    mean_squared_displacement_fft,
+)
 from nomad.datamodel.results import Material, ElementalComposition
 
 
@@ -161,3 +167,37 @@ def test_formula_populate_overwrite_exception(formula, material):
     formula_object = Formula(formula)
     with pytest.raises(ValueError):
         formula_object.populate(material, descriptive_format='original')
+
+
+@pytest.mark.parametrize('n_processes', [1, 2])
+def test_calc_molecular_rdf_one_pass(n_processes):
+    universe = create_molecular_universe(n_molecules=20, n_frames=10)
+    kwargs = dict(n_traj_split=5, n_prune=2, interval_indices=[[0], [1, 2], [2, 3, 4]])
+    expected = calc_molecular_rdf(universe, **kwargs)
+    results = calc_molecular_rdf(
+        universe, one_pass=True, n_processes=n_processes, **kwargs
+    )
+
+    assert results['types'] == ['A-A', 'A-A', 'A-A', 'B-A', 'B-A', 'B-A'] + ['B-B'] * 3
+    for key in ['types', 'frame_start', 'frame_end', 'n_smooth', 'n_prune']:
+        assert results[key] == expected[key]
+    for bins, expected_bins in zip(results['bins'], expected['bins']):
+        assert np.array_equal(bins.magnitude, expected_bins.magnitude)
+    for value, expected_value in zip(results['value'], expected['value']):
+        assert np.array_equal(value, expected_value)
+
+
+@pytest.mark.parametrize('max_chunk_elements', [2**22, 100])
+def test_mean_squared_displacement_fft(max_chunk_elements):
+    rng = np.random.default_rng(0)
+    n_frames = 50
+    positions = np.cumsum(rng.normal(size=(n_frames, 7, 3)), axis=0) + 100
+    expected = [
+        np.mean(np.sum((positions[lag:] - positions[: n_frames - lag]) ** 2, axis=2))
+        for lag in range(n_frames)
+    ]
+
+    msd = mean_squared_displacement_fft(
+        positions, max_chunk_elements=max_chunk_elements
+    )
+    assert np.allclose(msd, expected, rtol=1e-10, atol=1e-10)
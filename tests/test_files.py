@@ -18,12 +18,15 @@
 
 from typing import Generator, Any, Dict, Tuple, Iterable, List
 from datetime import datetime
+import hashlib
 import os
 import os.path
 import shutil
+import billiard
 import pytest
 import itertools
 import zipfile
+import tarfile
 import re
 import pathlib
 
@@ -33,8 +36,11 @@ from nomad.archive import to_json
 from nomad.files import (
     DirectoryObject,
     PathObject,
+    StreamedFile,
+    create_zipstream,
     empty_zip_file_size,
     empty_archive_file_size,
+    extract_archive_stream,
 )
 from nomad.files import StagingUploadFiles, PublicUploadFiles, UploadFiles
 from nomad.processing import Upload
@@ -249,6 +255,20 @@ class UploadFilesContract(UploadFilesFixtures):
                 with upload_files.raw_file(file_path, mode) as f:
                     assert len(f.read()) > 0
 
+    def test_rawfile_seek(self, test_upload: UploadWithFiles):
+        _, entries, upload_files = test_upload
+        for entry in entries:
+            for file_path in entry.files:
+                with upload_files.raw_file(file_path, 'rb') as f:
+                    content = f.read()
+                    middle = len(content) // 2
+                    f.seek(middle)
+                    assert f.read(10) == content[middle : middle + 10]
+                    f.seek(0)
+                    assert f.read() == content
+                    f.seek(-5, os.SEEK_END)
+                    assert f.read() == content[-5:]
+
     def test_rawfile_size(self, test_upload: UploadWithFiles):
         _, entries, upload_files = test_upload
         for entry in entries:
@@ -376,6 +396,62 @@ class TestStagingUploadFiles(UploadFilesContract):
         _, entries, upload_files = test_upload
         upload_files.pack(entries, with_embargo=entries[0].with_embargo)
 
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_pack_hdf5(self, monkeypatch, test_upload_id, workers):
+        import h5py
+
+        monkeypatch.setattr('nomad.config.process.hdf5_pack_workers', workers)
+        upload_id, entries, upload_files = create_staging_upload(
+            test_upload_id, entry_specs='ppp', embargo_length=0
+        )
+        upload_files.archive_hdf5_file_object(entries[2].entry_id).delete()
+        upload_files.pack(entries, with_embargo=False)
+        upload_files.delete()
+
+        upload_files = PublicUploadFiles(upload_id)
+        file_object = upload_files.archive_hdf5_file_object(entries[0].entry_id)
+        assert not any('shard' in name for name in os.listdir(upload_files.os_path))
+        with h5py.File(file_object.os_path, 'r') as f:
+            assert set(f.keys()) == {entry.entry_id for entry in entries}
+            assert f[entries[0].entry_id]['value'][()] == 1.0
+            assert f[entries[1].entry_id]['value'][()] == 1.0
+            assert len(f[entries[2].entry_id]) == 0
+        upload_files.close()
+
+    def test_pack_hdf5_celery_worker(self, monkeypatch, test_upload_id, tmp_path):
+        import h5py
+        from nomad import files
+
+        # publishing runs in celery prefork workers, which are daemonic billiard
+        # processes
+        merged_shards = tmp_path / 'merged_shards'
+
+        def merge_hdf5_files(os_path, other_os_paths):
+            merged_shards.write_text(str(len(other_os_paths)))
+            merge(os_path, other_os_paths)
+
+        merge = files._merge_hdf5_files
+        monkeypatch.setattr('nomad.files._merge_hdf5_files', merge_hdf5_files)
+        monkeypatch.setattr('nomad.config.process.hdf5_pack_workers', 2)
+        upload_id, entries, upload_files = create_staging_upload(
+            test_upload_id, entry_specs='pp', embargo_length=0
+        )
+        process = billiard.get_context('fork').Process(
+            target=upload_files.pack, args=(entries,), kwargs=dict(with_embargo=False)
+        )
+        process.daemon = True
+        process.start()
+        process.join()
+        assert process.exitcode == 0
+        assert merged_shards.read_text() == '1'
+        upload_files.delete()
+
+        upload_files = PublicUploadFiles(upload_id)
+        file_object = upload_files.archive_hdf5_file_object(entries[0].entry_id)
+        with h5py.File(file_object.os_path, 'r') as f:
+            assert set(f.keys()) == {entry.entry_id for entry in entries}
+        upload_files.close()
+
     @pytest.mark.parametrize('entry_specs', ['r', 'p'])
     def test_pack_potcar(self, entry_specs):
         embargo_length = 12 if 'r' in entry_specs.lower() else 0
@@ -431,6 +507,70 @@ class TestStagingUploadFiles(UploadFilesContract):
             example_file_contents
         )
 
+    def test_chunked_upload(self, test_upload_id):
+        upload_files = StagingUploadFiles(test_upload_id, create=True)
+        with open(example_file, 'rb') as f:
+            data = f.read()
+        chunks = [data[i : i + 500] for i in range(0, len(data), 500)]
+        chunked_upload = upload_files.create_chunked_upload(
+            'examples.zip', 'target', len(chunks)
+        )
+        session_id = chunked_upload.session_id
+
+        for index in range(0, len(chunks), 2):
+            chunked_upload.put_chunk(
+                index, [chunks[index]], hashlib.sha256(chunks[index]).hexdigest()
+            )
+        with pytest.raises(ValueError):
+            chunked_upload.put_chunk(1, [chunks[1]], hashlib.sha256(b'').hexdigest())
+
+        chunked_upload = upload_files.chunked_upload(session_id)
+        assert chunked_upload.file_name == 'examples.zip'
+        assert chunked_upload.path == 'target'
+        assert chunked_upload.missing_chunks() == list(range(1, len(chunks), 2))
+        for index in chunked_upload.missing_chunks():
+            chunked_upload.put_chunk(
+                index, [chunks[index]], hashlib.sha256(chunks[index]).hexdigest()
+            )
+        assert chunked_upload.missing_chunks() == []
+        assert b''.join(chunked_upload.read_chunks()) == data
+
+        chunked_upload.delete()
+        with pytest.raises(KeyError):
+            upload_files.chunked_upload(session_id)
+
+    def test_chunked_upload_limits(self, test_upload_id, monkeypatch):
+        monkeypatch.setattr(config.services, 'chunked_upload_max_chunks', 2)
+        monkeypatch.setattr(config.services, 'chunked_upload_max_chunk_size', 4)
+        upload_files = StagingUploadFiles(test_upload_id, create=True)
+        with pytest.raises(AssertionError):
+            upload_files.create_chunked_upload('file.txt', '', 3)
+
+        chunked_upload = upload_files.create_chunked_upload('file.txt', '', 2)
+        chunked_upload.put_chunk(0, [b'ab', b'cd'], hashlib.sha256(b'abcd').hexdigest())
+        with pytest.raises(ValueError):
+            chunked_upload.put_chunk(
+                1, [b'ab', b'cde'], hashlib.sha256(b'abcde').hexdigest()
+            )
+        assert chunked_upload.missing_chunks() == [1]
+        assert sorted(os.listdir(chunked_upload.os_path)) == ['chunk_0', 'session.json']
+
+    def test_delete_abandoned_chunked_uploads(self, test_upload_id):
+        upload_files = StagingUploadFiles(test_upload_id, create=True)
+        assert upload_files.delete_abandoned_chunked_uploads(0) == 0
+
+        abandoned = upload_files.create_chunked_upload('abandoned.txt', '', 2)
+        abandoned.put_chunk(0, [b'data'], hashlib.sha256(b'data').hexdigest())
+        for name in os.listdir(abandoned.os_path):
+            os.utime(os.path.join(abandoned.os_path, name), (0, 0))
+        os.utime(abandoned.os_path, (0, 0))
+        active = upload_files.create_chunked_upload('active.txt', '', 2)
+
+        assert upload_files.delete_abandoned_chunked_uploads(3600) == 1
+        with pytest.raises(KeyError):
+            upload_files.chunked_upload(abandoned.session_id)
+        assert upload_files.chunked_upload(active.session_id).file_name == 'active.txt'
+
     @pytest.mark.parametrize('prefix_size', [0, 2])
     def test_prefix_size(self, monkeypatch, prefix_size):
         monkeypatch.setattr('nomad.config.fs.prefix_size', prefix_size)
@@ -457,6 +597,97 @@ class TestStagingUploadFiles(UploadFilesContract):
         assert not os.path.exists(prefix)
 
 
+def create_archive(path, mode):
+    source_dir = os.path.dirname(example_directory)
+    zip_compressions = dict(
+        zip=zipfile.ZIP_DEFLATED, zipbz2=zipfile.ZIP_BZIP2, ziplzma=zipfile.ZIP_LZMA
+    )
+    if mode in zip_compressions:
+        with zipfile.ZipFile(path, 'w', zip_compressions[mode]) as zf:
+            for file_path in example_file_contents:
+                zf.write(os.path.join(source_dir, file_path), file_path)
+    elif mode == 'zipstream':
+        streamed_files = [
+            StreamedFile(
+                f=open(os.path.join(source_dir, file_path), 'rb'),
+                path=file_path,
+                size=os.path.getsize(os.path.join(source_dir, file_path)),
+            )
+            for file_path in example_file_contents
+        ]
+        with open(path, 'wb') as f:
+            for chunk in create_zipstream(streamed_files):
+                f.write(chunk)
+    else:
+        with tarfile.open(path, mode) as tf:
+            tf.add(example_directory, arcname='./examples_template')
+            link = tarfile.TarInfo('examples_template/link')
+            link.type = tarfile.SYMTYPE
+            link.linkname = '/etc/passwd'
+            tf.addfile(link)
+
+
+def archive_chunks(path, chunk_size=100):
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+@pytest.mark.parametrize(
+    'mode, archive_format',
+    [
+        pytest.param('zip', 'zip', id='zip'),
+        pytest.param('zipbz2', 'zip', id='zip-bzip2'),
+        pytest.param('ziplzma', 'zip', id='zip-lzma'),
+        pytest.param('zipstream', 'zip', id='zip-with-data-descriptors'),
+        pytest.param('w', 'tar', id='tar'),
+        pytest.param('w:gz', 'tar', id='tar-gz'),
+        pytest.param('w:bz2', 'tar', id='tar-bz2'),
+    ],
+)
+def test_extract_archive_stream(tmp_path, mode, archive_format):
+    create_archive(tmp_path / 'archive', mode)
+    target_dir = tmp_path / 'extracted'
+    target_dir.mkdir()
+
+    assert (
+        extract_archive_stream(archive_chunks(tmp_path / 'archive'), str(target_dir))
+        == archive_format
+    )
+    assert sorted(
+        str(path.relative_to(target_dir))
+        for path in target_dir.rglob('*')
+        if not path.is_dir()
+    ) == sorted(example_file_contents)
+    for file_path in example_file_contents:
+        with open(
+            os.path.join(os.path.dirname(example_directory), file_path), 'rb'
+        ) as f:
+            assert (target_dir / file_path).read_bytes() == f.read()
+
+
+@pytest.mark.parametrize(
+    'members, error',
+    [
+        pytest.param(None, 'Bad file format', id='not-an-archive'),
+        pytest.param(['../escape'], 'Unsafe path', id='unsafe-path'),
+        pytest.param(['a/b', 'a'], 'Cannot merge', id='file-over-directory'),
+        pytest.param(['a', 'a/b'], 'Cannot merge', id='directory-over-file'),
+    ],
+)
+def test_extract_archive_stream_errors(tmp_path, members, error):
+    archive = tmp_path / 'archive.zip'
+    if members is None:
+        shutil.copyfile(example_file_corrupt_zip, archive)
+    else:
+        with zipfile.ZipFile(archive, 'w') as zf:
+            for member in members:
+                zf.writestr(member, 'content')
+
+    with pytest.raises(ValueError, match=error):
+        extract_archive_stream(archive_chunks(archive), str(tmp_path))
+
+
 def create_public_upload(
     upload_id: str, entry_specs: str, embargo_length: int = 0, with_upload: bool = True
 ) -> PublicUploadWithFiles:
@@ -566,6 +797,25 @@ class TestPublicUploadFiles(UploadFilesContract):
 
         assert upload_files.to_staging_upload_files() is None
 
+    def test_raw_zip_index(self, test_upload):
+        upload_id, _, upload_files = test_upload
+        index_file_object = PublicUploadFiles._create_raw_zip_index_file_object(
+            upload_files, upload_files.access
+        )
+        assert index_file_object.exists()
+        assert upload_files._open_raw_zip_index() is not None
+        path_infos = list(upload_files.raw_directory_list(recursive=True))
+        page = upload_files.raw_directory_page('', 0, 2)
+        upload_files.close()
+
+        # Uploads packed without index fall back to the raw zip file
+        index_file_object.delete()
+        upload_files = PublicUploadFiles(upload_id)
+        assert upload_files._open_raw_zip_index() is None
+        assert list(upload_files.raw_directory_list(recursive=True)) == path_infos
+        assert upload_files.raw_directory_page('', 0, 2) == page
+        upload_files.close()
+
     def test_repack(self, test_upload):
         upload_id, entries, upload_files = test_upload
         for entry in entries:
@@ -18,6 +18,9 @@
 
 import time
 import json
+import multiprocessing
+import os
+import billiard
 import pytest
 import pandas as pd
 
@@ -61,6 +64,46 @@ def test_sleep_timer():
     assert duration < 1
 
 
+def add_with_pid(a, b):
+    return a + b, os.getpid()
+
+
+def fail(value):
+    raise ValueError(value)
+
+
+@pytest.mark.parametrize('processes', [1, 3])
+def test_fork_map(processes):
+    results = utils.fork_map(add_with_pid, [(i, 1) for i in range(5)], processes)
+    assert [result for result, _ in results] == [1, 2, 3, 4, 5]
+    pids = {pid for _, pid in results}
+    assert len(pids) == processes
+    assert (os.getpid() in pids) == (processes == 1)
+
+
+def test_fork_map_error():
+    with pytest.raises(ValueError, match='1'):
+        utils.fork_map(fail, [(1,), (2,)], 2)
+
+
+def fork_map_in_daemon(connection):
+    connection.send(utils.fork_map(add_with_pid, [(i, 1) for i in range(4)], 2))
+
+
+@pytest.mark.parametrize('context', [billiard, multiprocessing])
+def test_fork_map_daemon(context):
+    # celery prefork workers are daemonic billiard processes
+    context = context.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=fork_map_in_daemon, args=(sender,), daemon=True)
+    process.start()
+    results = receiver.recv()
+    process.join()
+    assert process.exitcode == 0
+    assert [result for result, _ in results] == [1, 2, 3, 4]
+    assert process.pid not in {pid for _, pid in results}
+
+
 def test_sanitize_logevent():
     assert structlogging.sanitize_logevent('numbers 2 and 45.2') == 'numbers X and X'
     assert (